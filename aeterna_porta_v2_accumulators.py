@@ -0,0 +1,184 @@
+"""
+AETERNA-PORTA v2.1 — SHOT SHARDING + STREAMING OBSERVABLE ACCUMULATORS
+Framework: dna::}{::lang v51.843
+
+Large shot budgets (IGNITION_CONFIG: 100000 shots, growing CONTROL_SHOTS)
+are split into shards that run as concurrent jobs. Every shard folds into
+an ObservableAccumulator holding only
+
+- the support histogram (distinct packed outcome → count)
+- the parity tally and the reference-state (|0…0⟩) hit count
+
+Accumulators merge by addition, so Φ̂/Λ̂/Γ̂ can be reported from the merged
+state after every shard while later shards are still running. Peak memory
+scales with the number of distinct outcomes, not with the total shot count.
+"""
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from aeterna_porta_v2_observables import (
+    gamma_from_tallies,
+    lambda_from_tallies,
+    observables_from_histogram,
+    outcome_histogram,
+    parity_hits,
+    phi_from_histogram,
+    reference_mask,
+)
+from aeterna_porta_v2_partition import register_width
+
+
+class ObservableAccumulator:
+    """Mergeable streaming state for Φ̂, Λ̂, Γ̂ and p_succ"""
+
+    def __init__(self, num_qubits, expected_parity=0):
+        self.num_qubits = num_qubits
+        self.expected_parity = expected_parity
+        self.num_bits = register_width(num_qubits)
+        self.histogram = {}
+        self.shots = 0
+        self.parity_hits = 0
+        self.reference_hits = 0
+
+    @classmethod
+    def from_bits(cls, bits, num_qubits, expected_parity=0):
+        acc = cls(num_qubits, expected_parity)
+        acc.update(bits)
+        return acc
+
+    def update(self, bits):
+        """Fold one shard (BitArray or packed uint8 array) into the state"""
+        rows, counts = outcome_histogram(bits)
+        self.num_bits = getattr(bits, "num_bits", self.num_bits)
+
+        self.shots += int(counts.sum())
+        self.parity_hits += parity_hits(rows, counts, self.expected_parity)
+        self.reference_hits += int(counts[reference_mask(rows)].sum())
+
+        histogram = self.histogram
+        for key, count in zip(rows.view(np.dtype((np.void, rows.shape[1]))).ravel(), counts.tolist()):
+            key = key.tobytes()
+            histogram[key] = histogram.get(key, 0) + count
+        return self
+
+    def merge(self, other):
+        """Add another accumulator's state into this one (in place)"""
+        if other.num_qubits != self.num_qubits or other.expected_parity != self.expected_parity:
+            raise ValueError("Cannot merge accumulators for different observables")
+
+        self.num_bits = max(self.num_bits, other.num_bits)
+        self.shots += other.shots
+        self.parity_hits += other.parity_hits
+        self.reference_hits += other.reference_hits
+        histogram = self.histogram
+        for key, count in other.histogram.items():
+            histogram[key] = histogram.get(key, 0) + count
+        return self
+
+    def __add__(self, other):
+        merged = ObservableAccumulator(self.num_qubits, self.expected_parity)
+        merged.num_bits = self.num_bits
+        return merged.merge(self).merge(other)
+
+    @property
+    def support(self):
+        return len(self.histogram)
+
+    def histogram_arrays(self):
+        """(rows, counts) arrays in the same layout as outcome_histogram"""
+        if not self.histogram:
+            return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+        keys = list(self.histogram)
+        rows = np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(len(keys), -1)
+        counts = np.fromiter(self.histogram.values(), dtype=np.int64, count=len(keys))
+        return rows, counts
+
+    def observables(self, top=10):
+        """Φ̂, Λ̂, Γ̂, p_succ (same dict as observables_from_bits)"""
+        rows, counts = self.histogram_arrays()
+        return observables_from_histogram(rows, counts, self.num_qubits, self.num_bits, top)
+
+    def snapshot(self):
+        """Cheap partial report: Φ̂/Λ̂/Γ̂ from the tallies without the outcome sample"""
+        counts = np.fromiter(self.histogram.values(), dtype=np.int64, count=self.support)
+        off_counts = counts
+        if self.reference_hits:
+            # The reference outcome is a single histogram entry
+            off_counts = np.sort(counts)
+            off_counts = np.delete(off_counts, np.searchsorted(off_counts, self.reference_hits))
+        return {
+            "phi": phi_from_histogram(counts),
+            "lambda": lambda_from_tallies(self.reference_hits, off_counts, self.shots),
+            "gamma": gamma_from_tallies(self.parity_hits, self.support, self.shots, self.num_qubits),
+            "shots": self.shots,
+            "support": self.support,
+        }
+
+# ═══════════════════════════════════════════════════════════════════
+# SHARDED EXECUTION
+# ═══════════════════════════════════════════════════════════════════
+
+def run_sharded(backend, circuit, total_shots, num_qubits, shard_shots=20000,
+                max_concurrent=4, on_partial=None, on_shard=None, register="meas",
+                dynamical_decoupling=True):
+    """
+    Run `circuit` for `total_shots` as concurrent shards of ≤ `shard_shots`.
+
+    Each shard's BitArray is folded into its own accumulator and released;
+    the per-shard accumulators are merged as shards complete. `on_partial`
+    (if given) is called with (snapshot, shards_done, shards_total) after
+    every merge; `on_shard` (if given) receives each shard's raw BitArray and
+    its whole DataBin, (bits, data), before they are released, e.g. to
+    archive the shots and keep the per-cycle Zeno registers. on_shard calls
+    are serialized, so whatever it appends per shard stays in one order.
+
+    Returns (merged ObservableAccumulator, [job_id, ...]).
+    """
+    # Imported here so the accumulator itself stays NumPy-only (offline analysis)
+    from aeterna_porta_v2_batch import make_sampler, shard_sizes
+
+    sizes = shard_sizes(total_shots, shard_shots)
+    sampler = make_sampler(backend, dynamical_decoupling)
+    merged = ObservableAccumulator(num_qubits)
+    job_ids = []
+    jobs = []
+    shard_lock = threading.Lock()
+
+    def run_shard(shots):
+        job = sampler.run([circuit], shots=shots)
+        jobs.append(job)
+        data = job.result()[0].data
+        bits = getattr(data, register)
+        if on_shard is not None:
+            with shard_lock:
+                on_shard(bits, data)
+        return ObservableAccumulator.from_bits(bits, num_qubits), job.job_id()
+
+    pool = ThreadPoolExecutor(max_workers=max_concurrent)
+    pending = set()
+    try:
+        pending = {pool.submit(run_shard, shots) for shots in sizes}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard, job_id = future.result()
+                merged.merge(shard)
+                job_ids.append(job_id)
+                if on_partial is not None:
+                    on_partial(merged.snapshot(), len(job_ids), len(sizes))
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        for job in jobs:
+            try:
+                job.cancel()
+            except Exception:
+                # Already finished or not cancellable any more
+                pass
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return merged, job_ids
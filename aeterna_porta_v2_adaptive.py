@@ -0,0 +1,161 @@
+"""
+AETERNA-PORTA v2.1 — ADAPTIVE SHOT ALLOCATION
+Framework: dna::}{::lang v51.843
+
+Sequential elimination over the (α, K) grid instead of a flat SHOTS per point:
+
+  round 0   every configuration gets `first_round_shots`
+  round r   survivors get first_round_shots · eta^r more (capped at max_shots
+            in total per configuration, and by the overall budget)
+
+After each round a configuration is dropped once its bootstrap confidence
+bounds rule out ignition, i.e. the upper Φ̂ bound is below the Φ̂ threshold or
+the lower Γ̂ bound is above Γ_critical. Survivors end with exactly max_shots,
+the same as a flat grid, so they are accepted or rejected on the same data.
+Shots that could not change the outcome are never spent.
+
+Shots fold into mergeable ObservableAccumulators, so no round re-reads earlier
+shots. Every round is logged (shots, active set, drops and their bounds) for
+the evidence file.
+"""
+from aeterna_porta_v2_accumulators import ObservableAccumulator
+from aeterna_porta_v2_statistics import analyse_histogram
+
+DEFAULT_ETA = 2
+DEFAULT_LEVEL = 0.99
+DEFAULT_REPLICATES = 200
+
+
+class AdaptiveShotScheduler:
+    """
+    Round-by-round shot allocation for a set of configuration keys.
+
+    Usage:
+        while (step := scheduler.next_round()) is not None:
+            shots, keys = step
+            ... run `keys` for `shots` each, scheduler.record(key, bits) ...
+            finished = scheduler.close_round(job_ids)
+    """
+
+    def __init__(self, keys, num_qubits, first_round_shots, max_shots,
+                 phi_threshold, gamma_critical, eta=DEFAULT_ETA, budget=None,
+                 level=DEFAULT_LEVEL, replicates=DEFAULT_REPLICATES, seed=None):
+        self.num_qubits = num_qubits
+        self.first_round_shots = first_round_shots
+        self.max_shots = max_shots
+        self.phi_threshold = phi_threshold
+        self.gamma_critical = gamma_critical
+        self.eta = eta
+        self.budget = budget
+        self.level = level
+        self.replicates = replicates
+        self.seed = seed
+
+        self.active = list(keys)
+        self.accumulators = {key: ObservableAccumulator(num_qubits) for key in self.active}
+        self.spent = {key: 0 for key in self.active}
+        self.outcome = {}
+        self.history = []
+        self.round = 0
+        self._round_shots = None
+
+    @property
+    def total_spent(self):
+        return sum(self.spent.values())
+
+    def next_round(self):
+        """(shots per configuration, [keys]) for the next round, or None when done"""
+        if not self.active:
+            return None
+
+        shots = min(self.first_round_shots * self.eta ** self.round,
+                    min(self.max_shots - self.spent[key] for key in self.active))
+        if self.budget is not None:
+            remaining = self.budget - self.total_spent
+            shots = min(shots, remaining // len(self.active))
+            if shots <= 0:
+                # Budget exhausted: survivors finish with what they have
+                for key in self.active:
+                    self.outcome[key] = {"status": "budget", "rounds": self.round}
+                self.history.append({"round": self.round, "budget_exhausted": True,
+                                     "finished": [list(k) for k in self.active]})
+                self.active = []
+                return None
+
+        self._round_shots = shots
+        return shots, list(self.active)
+
+    def record(self, key, bits):
+        """Fold one round's shots (BitArray / packed array) for `key`"""
+        self.accumulators[key].update(bits)
+        self.spent[key] = self.accumulators[key].shots
+
+    def bounds(self, key):
+        """Bootstrap (Φ̂ upper, Γ̂ lower) bounds at `level`, bias-corrected"""
+        rows, counts = self.accumulators[key].histogram_arrays()
+        summary = analyse_histogram(
+            rows, counts, self.num_qubits, replicates=self.replicates,
+            seed=self.seed, level=self.level,
+        )
+        return summary["phi"]["ci_bias_corrected"][1], summary["gamma"]["ci_bias_corrected"][0]
+
+    def close_round(self, job_ids=None):
+        """
+        Apply the elimination rule after a round's shots are recorded.
+
+        Returns the keys that finished this round (dropped or at max_shots).
+        """
+        finished = []
+        dropped = []
+        survivors = []
+        for key in self.active:
+            phi_upper, gamma_lower = self.bounds(key)
+            reason = None
+            if phi_upper < self.phi_threshold:
+                reason = "phi_upper_below_threshold"
+            elif gamma_lower > self.gamma_critical:
+                reason = "gamma_lower_above_critical"
+
+            if reason is not None:
+                self.outcome[key] = {"status": "dropped", "reason": reason,
+                                     "rounds": self.round + 1,
+                                     "phi_upper": phi_upper, "gamma_lower": gamma_lower}
+                dropped.append({"key": list(key), "reason": reason, "shots": self.spent[key],
+                                "phi_upper": phi_upper, "gamma_lower": gamma_lower})
+                finished.append(key)
+            elif self.spent[key] >= self.max_shots:
+                self.outcome[key] = {"status": "complete", "rounds": self.round + 1,
+                                     "phi_upper": phi_upper, "gamma_lower": gamma_lower}
+                finished.append(key)
+            else:
+                survivors.append(key)
+
+        self.history.append({
+            "round": self.round,
+            "shots_per_config": self._round_shots,
+            "active": [list(k) for k in self.active],
+            "dropped": dropped,
+            "job_ids": list(job_ids or []),
+            "total_spent": self.total_spent,
+        })
+        self.active = survivors
+        self.round += 1
+        return finished
+
+    def summary(self, flat_shots_per_config=None):
+        """Allocation record for the evidence file"""
+        configs = len(self.spent)
+        flat = flat_shots_per_config * configs if flat_shots_per_config else None
+        return {
+            "policy": "sequential elimination (geometric rounds)",
+            "first_round_shots": self.first_round_shots,
+            "eta": self.eta,
+            "max_shots": self.max_shots,
+            "budget": self.budget,
+            "confidence_level": self.level,
+            "replicates": self.replicates,
+            "total_shots": self.total_spent,
+            "flat_grid_shots": flat,
+            "savings": 1 - self.total_spent / flat if flat else None,
+            "rounds": self.history,
+        }
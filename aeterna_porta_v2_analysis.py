@@ -0,0 +1,165 @@
+"""
+AETERNA-PORTA v2.1 — SWEEP EVIDENCE ANALYSIS
+Framework: dna::}{::lang v51.843
+
+The decision-rule side of a sweep, shared by the live run and by offline
+re-analysis of a saved evidence file:
+
+- run_statistics: bootstrap SE/CI for every configuration and control
+  (from the shot archive), Z-scores against C0/C1/C2 and the ignition
+  decision per configuration
+- best_configuration / print_best_configuration: Ξ-best among the
+  configurations the rule accepts
+- analyze_evidence: the same on a saved `aeterna_porta_sweep_<run>.json`,
+  with thresholds and partition read back from the evidence itself
+
+Only NumPy is required (no qiskit), so `analyze` starts in a fraction of a
+second.
+"""
+import json
+from pathlib import Path
+
+from aeterna_porta_v2_evidence_store import histogram_from_archive
+from aeterna_porta_v2_partition import Partition
+from aeterna_porta_v2_statistics import (
+    DEFAULT_LEVEL,
+    DEFAULT_REPLICATES,
+    analyse_histograms,
+    ignition_decision,
+    z_vs_controls,
+)
+
+DEFAULT_Z_THRESHOLD = 5.0
+
+
+def run_statistics(sweep_results, controls_results, base_dir, num_qubits,
+                   phi_threshold, gamma_critical, z_threshold=DEFAULT_Z_THRESHOLD,
+                   replicates=DEFAULT_REPLICATES, seed=None, level=DEFAULT_LEVEL,
+                   max_workers=None):
+    """
+    Bootstrap SE/CI for every configuration and control, Z-scores against
+    C0/C1/C2 and the ignition decision per configuration. Attaches
+    entry["statistics"] in place; returns the evidence summary.
+    """
+    histograms = {}
+    for i, entry in enumerate(sweep_results):
+        histograms[("grid", i)] = (
+            *histogram_from_archive(entry["shots_ref"], base_dir), entry["circuit_depth"]
+        )
+    for entry in controls_results:
+        histograms[("control", entry["control"])] = (
+            *histogram_from_archive(entry["shots_ref"], base_dir), entry["circuit_depth"]
+        )
+
+    summaries = analyse_histograms(
+        histograms, num_qubits, replicates=replicates, seed=seed,
+        level=level, max_workers=max_workers,
+    )
+
+    control_summaries = {entry["control"]: summaries[("control", entry["control"])]
+                         for entry in controls_results}
+    for entry in controls_results:
+        entry["statistics"] = control_summaries[entry["control"]]
+
+    accepted = []
+    for i, entry in enumerate(sweep_results):
+        summary = summaries[("grid", i)]
+        z_scores = z_vs_controls(summary, control_summaries)
+        decision = ignition_decision(summary, z_scores, phi_threshold, gamma_critical, z_threshold)
+        entry["statistics"] = {**summary, "z_vs_controls": z_scores, "decision": decision}
+        if decision["ignite"]:
+            accepted.append({"alpha": entry["alpha"], "K": entry["K"]})
+
+    return {
+        "method": "multinomial bootstrap over archived shots",
+        "replicates": replicates,
+        "seed": seed,
+        "confidence_level": level,
+        "z_threshold": z_threshold,
+        "rule": f"(Φ̂ ≥ {phi_threshold}) ∧ (Γ̂ ≤ {gamma_critical}) ∧ (min Z_Δτ ≥ {z_threshold})",
+        "accepted": accepted,
+    }
+
+# ═══════════════════════════════════════════════════════════════════
+# BEST CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════
+
+def ignites(entry):
+    """Decision rule verdict (the point-estimate `conscious` flag without statistics)"""
+    if "statistics" not in entry:
+        return entry["ccce"]["conscious"]
+    return entry["statistics"]["decision"]["ignite"]
+
+
+def best_configuration(sweep_results):
+    """Ξ-best among accepted configurations (Ξ-best overall when none is accepted)"""
+    candidates = [r for r in sweep_results if ignites(r)] or sweep_results
+    return max(candidates, key=lambda r: r["ccce"]["xi"])
+
+
+def print_best_configuration(best_config, phi_threshold):
+    print("🏆 BEST CONFIGURATION:")
+    print(f"  α = {best_config['alpha']:.4f}")
+    print(f"  K = {best_config['K']}")
+    if "statistics" in best_config:
+        stats = best_config["statistics"]
+        lo, hi = stats["phi"]["ci_bias_corrected"]
+        print(f"  Φ̂ = {best_config['ccce']['phi']:.4f} [{lo:.4f}, {hi:.4f}] "
+              f"{'✅' if stats['decision']['phi_ok'] else '❌'}")
+        lo, hi = stats["gamma"]["ci_bias_corrected"]
+        print(f"  Γ̂ = {best_config['ccce']['gamma']:.4f} [{lo:.4f}, {hi:.4f}] "
+              f"{'✅' if stats['decision']['gamma_ok'] else '❌'}")
+        z = stats["decision"]["z_delta_tau"]
+        z_text = f"{z:.2f}" if z is not None else "n/a"
+        print(f"  Z_Δτ = {z_text} {'✅' if stats['decision']['z_ok'] else '❌'}")
+    else:
+        print(f"  Φ̂ = {best_config['ccce']['phi']:.4f} {'✅' if best_config['ccce']['phi'] >= phi_threshold else '❌'}")
+    print(f"  Ξ = {best_config['ccce']['xi']:.4f}")
+    print(f"  Conscious: {best_config['ccce']['conscious']}")
+    print()
+
+    if ignites(best_config):
+        print("🔥 IGNITION ACHIEVED")
+    else:
+        print("❄️ IGNITION INCOMPLETE — Recommend further parameter tuning")
+
+# ═══════════════════════════════════════════════════════════════════
+# SAVED EVIDENCE
+# ═══════════════════════════════════════════════════════════════════
+
+def latest_evidence(directory, pattern="aeterna_porta_sweep_*.json"):
+    """Most recently modified sweep evidence file in `directory` (None if there is none)"""
+    files = sorted(Path(directory).glob(pattern), key=lambda p: p.stat().st_mtime)
+    return files[-1] if files else None
+
+
+def analyze_evidence(evidence_path, replicates=None, seed=None, level=None,
+                     z_threshold=None, max_workers=None, write=False):
+    """
+    Re-run the statistics and decision rule on a saved sweep.
+
+    Thresholds and partition come from the evidence file; bootstrap settings
+    default to the ones the sweep recorded. With `write`, the refreshed
+    statistics are stored back into the evidence file. Returns the evidence.
+    """
+    evidence_path = Path(evidence_path)
+    evidence = json.loads(evidence_path.read_text())
+    entries = evidence["results"] + evidence["controls"]
+    if any(entry.get("shots_ref") is None for entry in entries):
+        raise ValueError(f"{evidence_path.name} has no shot archive to bootstrap from")
+
+    recorded = evidence.get("statistics") or {}
+    constants = evidence["constants"]
+    evidence["statistics"] = run_statistics(
+        evidence["results"], evidence["controls"], evidence_path.parent,
+        Partition.from_dict(evidence["partition"]), constants["PHI_THRESHOLD"], constants["GAMMA_CRITICAL"],
+        z_threshold=z_threshold if z_threshold is not None
+        else recorded.get("z_threshold", DEFAULT_Z_THRESHOLD),
+        replicates=replicates or recorded.get("replicates", DEFAULT_REPLICATES),
+        seed=seed if seed is not None else recorded.get("seed"),
+        level=level or recorded.get("confidence_level", DEFAULT_LEVEL),
+        max_workers=max_workers,
+    )
+    if write:
+        evidence_path.write_text(json.dumps(evidence, indent=2))
+    return evidence
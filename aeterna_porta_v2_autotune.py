@@ -0,0 +1,282 @@
+"""
+AETERNA-PORTA v2.1 — TRANSPILE AUTOTUNER
+Framework: dna::}{::lang v51.843
+
+Searches transpile settings per circuit family (the K templates, the
+C0/C1/C2 controls) and keeps the winner per backend:
+
+    result, compiled = tune_family(members, backend, baseline=options, base_seed=seed)
+    store = TuningStore()
+    store.save(backend, "grid", result, members)
+    store.lookup(backend, "grid", members)   # → {"options", "base_seed", …} or None
+
+A candidate is (optimization level, layout method, routing method) plus a
+base seed. Every family member is compiled with
+deterministic_seed(member key, base seed), exactly as the sweep compiles it,
+so the stored winner reproduces the tuned circuits. Score (lower is better,
+in depth units):
+
+    Σ_members  depth + TWO_QUBIT_WEIGHT · two-qubit gates
+                     + COMPILE_SECOND_WEIGHT · compile seconds
+
+Depth dominates because it enters Δτ_eff directly; compile time only breaks
+near-ties. When the sweep has planned layouts (aeterna_porta_v2_layout),
+layout_method="planned" competes with SABRE and the others: it pins each
+member to its planned physical qubits and skips the layout search.
+
+Successive halving, as in the adaptive sweep: round 0 compiles every
+candidate with one seed (the current base seed); each later round keeps the
+best 1/ETA of the candidates and gives the survivors ETA× as many seeds, up
+to MAX_SEEDS. A candidate scores its best seed. Settings that do not lower
+depth are dropped after one compile of the family, so the extra seeds go to
+the ones that do.
+
+Winners are stored in ~/.osiris/autotune/transpile_tuning.json per backend
+name. An entry applies while the backend topology, the qiskit version and
+the family's logical circuits are unchanged; recalibrations keep it.
+"""
+import hashlib
+import json
+import math
+import os
+import time
+from datetime import datetime, timezone
+from itertools import product
+from pathlib import Path
+
+import qiskit
+from qiskit import transpile
+
+from aeterna_porta_v2_parallel_compile import deterministic_seed
+from aeterna_porta_v2_transpile_cache import cache_key, circuit_fingerprint, topology_fingerprint
+
+PLANNED = "planned"  # layout_method value: compile on the planned layout (aeterna_porta_v2_layout)
+DEFAULT_TUNING_PATH = Path.home() / ".osiris" / "autotune" / "transpile_tuning.json"
+SEARCH_SPACE = {
+    "optimization_level": [1, 2, 3],
+    "layout_method": ["sabre", "dense", "trivial", PLANNED],
+    # "lookahead" routing is left out: ~60 s per 120-qubit compile on heavy-hex
+    "routing_method": ["sabre", "basic"],
+}
+MAX_SEEDS = 4  # Seeds per surviving candidate in the last round
+ETA = 2  # Keep the best 1/ETA of the candidates per round, ETA× the seeds
+TWO_QUBIT_WEIGHT = 0.1  # Score per two-qubit gate (depth units)
+COMPILE_SECOND_WEIGHT = 1.0  # Score per second of compile time (depth units)
+
+# ═══════════════════════════════════════════════════════════════════
+# CANDIDATES
+# ═══════════════════════════════════════════════════════════════════
+
+def candidate_options(space=SEARCH_SPACE, baseline=None, planned=False):
+    """Every combination in `space` (PLANNED layouts only if `planned`), the baseline options first"""
+    names = list(space)
+    candidates = [dict(zip(names, values)) for values in product(*space.values())]
+    if not planned:
+        candidates = [c for c in candidates if c.get("layout_method") != PLANNED]
+    if baseline is not None:
+        baseline = dict(baseline)
+        candidates = [baseline] + [c for c in candidates if c != baseline]
+    return candidates
+
+
+def resolve_layout(options, layout):
+    """
+    Transpile options for one circuit: layout_method=PLANNED becomes
+    initial_layout=layout (the default layout stage when there is no plan).
+    """
+    if options.get("layout_method") != PLANNED:
+        return dict(options)
+    options = {name: value for name, value in options.items() if name != "layout_method"}
+    if layout is not None:
+        options["initial_layout"] = list(layout)
+    return options
+
+
+def candidate_seeds(base_seed, count):
+    """`base_seed` first, then `count - 1` seeds derived from it"""
+    return [base_seed] + [deterministic_seed(("autotune", i), base_seed) for i in range(1, count)]
+
+
+def members_fingerprint(members):
+    """sha256 over the family's compile-unit keys and logical circuits"""
+    h = hashlib.sha256()
+    for key in sorted(members, key=repr):
+        h.update(repr(key).encode())
+        h.update(circuit_fingerprint(members[key]).encode())
+    return h.hexdigest()
+
+
+def member_label(key):
+    return "/".join(str(part) for part in key)
+
+
+def options_label(options):
+    return ", ".join(f"{name}={value}" for name, value in options.items())
+
+
+def score(depth, two_qubit_gates, compile_s):
+    return depth + TWO_QUBIT_WEIGHT * two_qubit_gates + COMPILE_SECOND_WEIGHT * compile_s
+
+# ═══════════════════════════════════════════════════════════════════
+# SEARCH
+# ═══════════════════════════════════════════════════════════════════
+
+def compile_members(members, target, options, base_seed, layouts=None):
+    """
+    Compile every member with its derived seed (and planned layout from
+    `layouts`, {key: layout}) → (trial, {key: compiled}).
+    A failed compile gives a trial with score inf and no circuits.
+    """
+    layouts = layouts or {}
+    compiled = {}
+    depths = {}
+    two_qubit_gates = 0
+    seconds = 0.0
+    try:
+        for key, circuit in members.items():
+            t0 = time.perf_counter()
+            qc = transpile(circuit, target=target,
+                           seed_transpiler=deterministic_seed(key, base_seed),
+                           **resolve_layout(options, layouts.get(key)))
+            seconds += time.perf_counter() - t0
+            depths[member_label(key)] = qc.depth()
+            two_qubit_gates += qc.num_nonlocal_gates()
+            compiled[key] = qc
+    except Exception as exc:
+        return {"options": options, "base_seed": base_seed, "score": math.inf, "error": str(exc)}, {}
+
+    depth = sum(depths.values())
+    trial = {
+        "options": options,
+        "base_seed": base_seed,
+        "depth": depth,
+        "depths": depths,
+        "two_qubit_gates": two_qubit_gates,
+        "compile_s": seconds,
+        "score": score(depth, two_qubit_gates, seconds),
+    }
+    return trial, compiled
+
+
+def tune_family(members, backend, baseline=None, base_seed=0, space=SEARCH_SPACE,
+                max_seeds=MAX_SEEDS, eta=ETA, layouts=None, on_round=None):
+    """
+    Successive-halving search over `space` for one circuit family.
+
+    members: {compile-unit key: logical circuit}
+    baseline: the options in use today (always a candidate; with `base_seed`
+    it is the comparison point in the result)
+    layouts: {key: planned physical layout}; enables layout_method=PLANNED
+    on_round(round, candidates, seeds, best_trial) after every round.
+
+    Returns (result, {key: compiled circuit} of the winning trial).
+    """
+    t0 = time.perf_counter()
+    candidates = candidate_options(space, baseline, planned=bool(layouts))
+    seeds = candidate_seeds(base_seed, max(1, max_seeds))
+    trials = [[] for _ in candidates]
+    alive = list(range(len(candidates)))
+    best, best_compiled = None, {}
+    n_seeds, rounds, compiles = 1, 0, 0
+
+    def candidate_score(i):
+        return min(trial["score"] for trial in trials[i])
+
+    while True:
+        for i in alive:
+            for seed in seeds[len(trials[i]):n_seeds]:
+                trial, compiled = compile_members(members, backend.target, candidates[i], seed, layouts)
+                trials[i].append(trial)
+                compiles += 1
+                if best is None or trial["score"] < best["score"]:
+                    best, best_compiled = trial, compiled
+        if on_round is not None:
+            on_round(rounds, len(alive), n_seeds, best)
+        rounds += 1
+        if len(alive) == 1 or n_seeds >= len(seeds):
+            break
+        alive = sorted(alive, key=candidate_score)[:max(1, math.ceil(len(alive) / eta))]
+        n_seeds = min(len(seeds), n_seeds * eta)
+
+    if best is None or math.isinf(best["score"]):
+        raise RuntimeError("Every transpile candidate failed")
+    result = {
+        **best,
+        "baseline": trials[0][0] if baseline is not None else None,
+        "candidates": len(candidates),
+        "rounds": rounds,
+        "compiles": compiles,
+        "tuning_s": time.perf_counter() - t0,
+    }
+    return result, best_compiled
+
+
+def prime_cache(cache, backend, members, compiled, result, layouts=None):
+    """Store the winning compiled circuits under the keys the sweep will look up"""
+    calibration = cache.calibration(backend)
+    layouts = layouts or {}
+    for key, circuit in members.items():
+        options = {**resolve_layout(result["options"], layouts.get(key)),
+                   "seed_transpiler": deterministic_seed(key, result["base_seed"])}
+        cache.put(cache_key(circuit, calibration, options), compiled[key], backend.name, calibration)
+
+# ═══════════════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════════════
+
+class TuningStore:
+    """
+    Tuned settings per backend and family (one JSON file):
+
+    {backend: {"topology", "qiskit", "families": {family: result + "circuits", "tuned_at"}}}
+    """
+
+    def __init__(self, path=DEFAULT_TUNING_PATH):
+        self.path = Path(path)
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.data, indent=2))
+        os.replace(tmp, self.path)
+
+    def _entry(self, backend):
+        """The backend's entry if it still matches its topology and qiskit version"""
+        entry = self.data.get(backend.name)
+        if entry is None or entry.get("qiskit") != qiskit.__version__:
+            return None
+        if entry.get("topology") != topology_fingerprint(backend):
+            return None
+        return entry
+
+    def lookup(self, backend, family, members=None):
+        """Stored winner for `family` on `backend` (None if absent or stale)"""
+        entry = self._entry(backend)
+        record = entry["families"].get(family) if entry is not None else None
+        if record is None:
+            return None
+        if members is not None and record.get("circuits") != members_fingerprint(members):
+            return None
+        return record
+
+    def save(self, backend, family, result, members):
+        entry = self._entry(backend)
+        if entry is None:
+            entry = self.data[backend.name] = {
+                "topology": topology_fingerprint(backend),
+                "qiskit": qiskit.__version__,
+                "families": {},
+            }
+        entry["families"][family] = {
+            **result,
+            "circuits": members_fingerprint(members),
+            "tuned_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._save()
@@ -0,0 +1,170 @@
+"""
+AETERNA-PORTA v2.1 — BATCHED PUB SUBMISSION
+Framework: dna::}{::lang v51.843
+
+One SamplerV2 call per sweep instead of one blocking job per grid point:
+
+- Each K template becomes ONE PUB carrying the full α parameter-value array
+- C0/C1/C2 controls ride along as extra PUBs (with their own shot counts)
+- Results are split back per configuration from the PUB data
+- PUBs above a per-PUB shot limit are sharded and re-joined transparently
+
+Queue latency is paid once per sweep instead of once per configuration.
+Works unchanged against local fake backends (SamplerV2 local mode) and the
+offline LocalBackend (aeterna_porta_v2_local_backend). qiskit_ibm_runtime is
+only imported once an IBM sampler or Batch is actually opened.
+"""
+import numpy as np
+from qiskit.primitives.containers import BitArray
+
+from aeterna_porta_v2_local_backend import is_local
+from aeterna_porta_v2_zeno import zeno_register_names
+
+
+def make_sampler(mode, dynamical_decoupling=True):
+    """SamplerV2 on `mode` (backend, Batch or Session) with the sweep's DD knobs"""
+    if is_local(mode):
+        # Offline simulator: its own sampler, no DD (nothing to decouple)
+        return mode.sampler()
+
+    from qiskit_ibm_runtime import SamplerV2
+
+    sampler = SamplerV2(mode=mode)
+
+    # Enable dynamical decoupling (IBM Runtime knob; ignored in local mode)
+    if dynamical_decoupling:
+        sampler.options.dynamical_decoupling.enable = True
+        sampler.options.dynamical_decoupling.sequence_type = "XY4"
+
+    return sampler
+
+
+def build_sweep_pubs(templates, alpha_values, k_values, shots,
+                     controls=None, control_shots=None, max_shots_per_pub=None,
+                     grid_points=None):
+    """
+    Assemble the PUBs for a whole sweep.
+
+    templates: ParametricTemplateEngine (one compiled template per K)
+    controls:  {name: compiled circuit} run with `control_shots`
+    max_shots_per_pub: shard any PUB above this shot count into several PUBs
+                       (merged again by split_batched_results)
+    grid_points: optional subset of (α, K) to run (e.g. the remainder of a
+                 resumed sweep); defaults to the full alpha_values × k_values
+
+    Returns (pubs, layout) where layout[i] describes PUB i:
+      {"kind": "grid", "K": K, "alphas": [...]} or
+      {"kind": "control", "control": name}
+    """
+    pubs = []
+    layout = []
+
+    def add(circuit, values, n_shots, entry):
+        for shard in shard_sizes(n_shots, max_shots_per_pub or n_shots):
+            pubs.append((circuit, values, shard))
+            layout.append(entry)
+
+    if grid_points is None:
+        grid_points = [(alpha_val, K) for alpha_val in alpha_values for K in k_values]
+
+    for K in k_values:
+        alphas = [alpha_val for alpha_val, k in grid_points if k == K]
+        if not alphas:
+            continue
+        template = templates.template(K)
+        if template.num_parameters:
+            values = np.asarray(alphas, dtype=float).reshape(-1, 1)
+        else:
+            # α optimised away: still one binding (and its own shots) per α,
+            # so no two configurations report the same draws
+            values = np.zeros((len(alphas), 0))
+        add(template, values, shots, {"kind": "grid", "K": K, "alphas": alphas})
+
+    for name, circuit in (controls or {}).items():
+        add(circuit, None, control_shots or shots, {"kind": "control", "control": name})
+
+    return pubs, layout
+
+
+def submit_batched(backend, pubs, max_pubs_per_job=None, dynamical_decoupling=True):
+    """
+    Submit all PUBs without waiting.
+
+    With `max_pubs_per_job=None` everything goes out as a single job. Otherwise
+    the PUBs are chunked and submitted as several jobs inside one Batch so the
+    backend can schedule them back to back.
+
+    Returns a list of (job, first_pub_index) in submission order.
+    """
+    if max_pubs_per_job is None or len(pubs) <= max_pubs_per_job:
+        sampler = make_sampler(backend, dynamical_decoupling)
+        return [(sampler.run(pubs), 0)]
+
+    jobs = []
+    if is_local(backend):
+        sampler = make_sampler(backend)
+        for start in range(0, len(pubs), max_pubs_per_job):
+            jobs.append((sampler.run(pubs[start:start + max_pubs_per_job]), start))
+        return jobs
+
+    from qiskit_ibm_runtime import Batch
+
+    with Batch(backend=backend) as batch:
+        sampler = make_sampler(batch, dynamical_decoupling)
+        for start in range(0, len(pubs), max_pubs_per_job):
+            chunk = pubs[start:start + max_pubs_per_job]
+            jobs.append((sampler.run(chunk), start))
+    return jobs
+
+
+def collect_pub_results(jobs):
+    """Block on every submitted job; returns [(pub_result, job_id)] in PUB order"""
+    collected = []
+    for job, _start in jobs:
+        result = job.result()
+        collected.extend((pub_result, job.job_id()) for pub_result in result)
+    return collected
+
+
+def split_batched_results(pub_results, layout, register="meas"):
+    """
+    Split PUB results back per configuration (re-joining sharded PUBs).
+
+    Returns {key: {"bits": BitArray, "zeno": {name: BitArray}, "job_id": str}}
+    where key is (alpha, K) for grid points and the control name for
+    controls, and "zeno" holds the per-cycle Zeno registers (empty without
+    Zeno cycles). For sharded configurations "job_id" is the first shard's job.
+    """
+    shards = {}
+    for (pub_result, job_id), entry in zip(pub_results, layout):
+        data = pub_result.data
+        names = [register] + zeno_register_names(data)
+        if entry["kind"] == "control":
+            shards.setdefault(entry["control"], []).append(({n: data[n] for n in names}, job_id))
+            continue
+
+        for j, alpha_val in enumerate(entry["alphas"]):
+            per_alpha = {n: data[n][j] if data[n].ndim else data[n] for n in names}
+            shards.setdefault((alpha_val, entry["K"]), []).append((per_alpha, job_id))
+
+    split = {}
+    for key, parts in shards.items():
+        if len(parts) == 1:
+            registers = parts[0][0]
+        else:
+            registers = {n: BitArray.concatenate_shots([part[0][n] for part in parts])
+                         for n in parts[0][0]}
+        bits = registers.pop(register)
+        split[key] = {"bits": bits, "zeno": registers, "job_id": parts[0][1]}
+    return split
+
+
+def shard_sizes(total_shots, shard_shots):
+    """Split a shot budget into shards of at most `shard_shots`"""
+    full, rest = divmod(total_shots, shard_shots)
+    return [shard_shots] * full + ([rest] if rest else [])
+
+
+def total_shots(pubs):
+    """Shots requested by (circuit, values, shots) PUBs, over every parameter binding"""
+    return sum(shots * (len(values) if values is not None else 1) for _, values, shots in pubs)
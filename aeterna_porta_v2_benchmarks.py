@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+AETERNA-PORTA v2.1 — PERFORMANCE BENCHMARKS
+Framework: dna::}{::lang v51.843
+
+Time and peak memory of the sweep's hot paths, stored per run so commits can
+be compared:
+
+  build/…       build_parametric_circuit at 120/500/1000 qubits, K ≤ 64
+  transpile/…   K templates against the fake Heron r2 target (FakeFez)
+  execute/…     local execution (LocalBackend) of K templates and a control
+  analyze/…     Φ̂/Λ̂/Γ̂ at 10^3–10^6 shots (and 10^5 shots of a 1000-qubit
+                partition), regional marginals, streamed accumulation and
+                the bootstrap at the sweep's replicate count
+
+Every benchmark is timed `repeat` times (min and median are kept), then run
+once more under tracemalloc for its peak traced memory. tracemalloc sees
+Python and NumPy allocations only: qiskit's Rust-side circuit data and Aer's
+buffers are not counted, so build/… and execute/… peaks cover the Python
+side alone.
+
+Results are written to ~/.osiris/benchmarks/bench_<stamp>_<commit>.json and
+compared with the previous result file (or `--baseline`) and with the
+reference results committed next to this module
+(aeterna_porta_v2_benchmark_baseline.json), so a regression that has already
+become "the previous run" is still caught. The run fails (exit 1) when a
+benchmark's min time or peak memory grows by more than `threshold` (default
+20%) and by more than the noise floor (1 ms / 1 MiB) against either.
+`--record-reference` stores this run's results in the reference file.
+
+    python aeterna_porta_v2_benchmarks.py [--filter analyze] [--threshold 0.2]
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from aeterna_porta_v2_partition import Partition
+
+DEFAULT_RESULTS_DIR = Path.home() / ".osiris" / "benchmarks"
+REFERENCE_BASELINE = Path(__file__).with_name("aeterna_porta_v2_benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.20
+TIME_NOISE_FLOOR = 1e-3  # seconds
+MEMORY_NOISE_FLOOR = 1 << 20  # bytes
+
+BUILD_QUBITS = (120, 500, 1000)
+BUILD_K = (0, 16, 64)
+TRANSPILE_K = (0, 16)
+EXECUTE_K = (0, 16)
+ANALYZE_SHOTS = (10**3, 10**4, 10**5, 10**6)
+ANALYZE_WIDE_QUBITS = 1000
+ANALYZE_WIDE_SHOTS = 10**5
+ANALYZE_MARGINAL_SHOTS = 10**5
+
+
+class Benchmark:
+    """`fn(*setup())` timed `repeat` times; setup is not timed"""
+
+    def __init__(self, name, fn, setup=None, repeat=5):
+        self.name = name
+        self.fn = fn
+        self.setup = setup or (lambda: ())
+        self.repeat = repeat
+
+    def run(self):
+        args = self.setup()
+        times = []
+        for _ in range(self.repeat):
+            t0 = time.perf_counter()
+            self.fn(*args)
+            times.append(time.perf_counter() - t0)
+
+        tracemalloc.start()
+        try:
+            self.fn(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            "min_s": min(times),
+            "median_s": statistics.median(times),
+            "repeat": self.repeat,
+            "peak_bytes": peak,
+        }
+
+# ═══════════════════════════════════════════════════════════════════
+# BENCHMARKS
+# ═══════════════════════════════════════════════════════════════════
+
+def build_benchmarks():
+    from qiskit.circuit import Parameter
+
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+
+    def build(partition, K):
+        sweep.build_parametric_circuit(Parameter("α"), K, partition)
+
+    return [
+        Benchmark(f"build/{n}q/K{K}", build, lambda n=n, K=K: (Partition.from_total(n), K))
+        for n in BUILD_QUBITS for K in BUILD_K
+    ]
+
+
+def transpile_benchmarks():
+    from qiskit import transpile
+    from qiskit.circuit import Parameter
+    from qiskit_ibm_runtime.fake_provider import FakeFez
+
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+
+    backend = FakeFez()
+
+    def setup(K):
+        qc = sweep.build_parametric_circuit(Parameter("α"), K)
+        return qc, dict(sweep.TRANSPILE_OPTIONS, seed_transpiler=sweep.TRANSPILE_SEED)
+
+    def run(qc, options):
+        transpile(qc, target=backend.target, **options)
+
+    return [
+        Benchmark(f"transpile/fake_fez/K{K}", run, lambda K=K: setup(K), repeat=3)
+        for K in TRANSPILE_K
+    ]
+
+
+def execute_benchmarks():
+    from qiskit import transpile
+    from qiskit.circuit import Parameter
+
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+    from aeterna_porta_v2_local_backend import LocalBackend
+
+    backend = LocalBackend(seed=sweep.TRANSPILE_SEED)
+    sampler = backend.sampler()
+    alphas = np.asarray(sweep.ALPHA_SWEEP, dtype=float).reshape(-1, 1)
+
+    def template(K):
+        qc = transpile(sweep.build_parametric_circuit(Parameter("α"), K), target=backend.target)
+        return ([(qc, alphas, sweep.SHOTS)],)
+
+    def control(name):
+        return ([(transpile(sweep.build_control(name), target=backend.target), None, sweep.CONTROL_SHOTS)],)
+
+    def run(pubs):
+        sampler.run(pubs).result()
+
+    benchmarks = [
+        Benchmark(f"execute/local/K{K}x{len(alphas)}", run, lambda K=K: template(K), repeat=3)
+        for K in EXECUTE_K
+    ]
+    benchmarks.append(Benchmark("execute/local/C2", run, lambda: control("C2"), repeat=3))
+    return benchmarks
+
+
+def analyze_benchmarks():
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+    from aeterna_porta_v2_accumulators import ObservableAccumulator
+    from aeterna_porta_v2_factorized import FactorizedDistribution
+    from aeterna_porta_v2_marginals import MarginalEngine
+    from aeterna_porta_v2_observables import observables_from_bits, outcome_histogram
+    from aeterna_porta_v2_statistics import HistogramModel
+
+    shots_cache = {}
+
+    def sampled(shots, partition=sweep.PARTITION):
+        # Exact shots of a real grid point (α = 0.3π, K = 16), drawn once per partition
+        if partition not in shots_cache:
+            dist = FactorizedDistribution(sweep.build_parametric_circuit(0.3 * np.pi, 16, partition))
+            total = max(ANALYZE_SHOTS) if partition == sweep.PARTITION else ANALYZE_WIDE_SHOTS
+            shots_cache[partition] = dist.sample(total, seed=sweep.TRANSPILE_SEED,
+                                                 registers=["meas"])["meas"].array
+        return shots_cache[partition][:shots]
+
+    def accumulate(bits, chunk=1 << 16):
+        acc = ObservableAccumulator(sweep.PARTITION)
+        for start in range(0, len(bits), chunk):
+            acc.update(bits[start:start + chunk])
+        acc.observables()
+
+    def bootstrap_setup():
+        rows, counts = outcome_histogram(sampled(sweep.SHOTS))
+        return (HistogramModel(rows, counts, sweep.PARTITION, circuit_depth=100),)
+
+    benchmarks = [
+        Benchmark(f"analyze/observables/{shots:.0e}", observables_from_bits,
+                  lambda shots=shots: (sampled(shots), sweep.PARTITION),
+                  repeat=5 if shots < 10**6 else 3)
+        for shots in ANALYZE_SHOTS
+    ]
+    wide = Partition.from_total(ANALYZE_WIDE_QUBITS)
+    benchmarks.append(Benchmark(
+        f"analyze/observables/{ANALYZE_WIDE_QUBITS}q/{ANALYZE_WIDE_SHOTS:.0e}", observables_from_bits,
+        lambda: (sampled(ANALYZE_WIDE_SHOTS, wide), wide), repeat=3,
+    ))
+    benchmarks.append(Benchmark(
+        f"analyze/marginals/{ANALYZE_MARGINAL_SHOTS:.0e}",
+        lambda bits: MarginalEngine.from_bits(bits, sweep.PARTITION).summary(),
+        lambda: (sampled(ANALYZE_MARGINAL_SHOTS),), repeat=3,
+    ))
+    benchmarks.append(Benchmark(f"analyze/accumulator/{max(ANALYZE_SHOTS):.0e}", accumulate,
+                                lambda: (sampled(max(ANALYZE_SHOTS)),), repeat=3))
+    benchmarks.append(Benchmark(
+        f"analyze/bootstrap/{sweep.BOOTSTRAP_REPLICATES}x{sweep.SHOTS}",
+        lambda model: model.bootstrap(sweep.BOOTSTRAP_REPLICATES, seed=sweep.BOOTSTRAP_SEED),
+        bootstrap_setup, repeat=3,
+    ))
+    return benchmarks
+
+
+SUITES = {
+    "build": build_benchmarks,
+    "transpile": transpile_benchmarks,
+    "execute": execute_benchmarks,
+    "analyze": analyze_benchmarks,
+}
+
+# ═══════════════════════════════════════════════════════════════════
+# RESULTS + REGRESSION CHECK
+# ═══════════════════════════════════════════════════════════════════
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, cwd=Path(__file__).parent, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(name_filter=None, on_result=None):
+    """
+    {name: result} for every benchmark whose name starts with `name_filter`
+    (e.g. "analyze", "build/1000q"). Suites outside the filter are not set up.
+    """
+    results = {}
+    for suite, factory in SUITES.items():
+        if name_filter and not suite.startswith(name_filter.split("/")[0]):
+            continue
+        for benchmark in factory():
+            if name_filter and not benchmark.name.startswith(name_filter):
+                continue
+            results[benchmark.name] = benchmark.run()
+            if on_result is not None:
+                on_result(benchmark.name, results[benchmark.name])
+    return results
+
+
+def result_record(results):
+    return {
+        "timestamp": time.time(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "numpy": np.__version__,
+        "results": results,
+    }
+
+
+def save_results(results, results_dir=DEFAULT_RESULTS_DIR):
+    results_dir = Path(results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    record = result_record(results)
+    path = results_dir / f"bench_{int(record['timestamp'])}_{record['commit'] or 'nogit'}.json"
+    path.write_text(json.dumps(record, indent=2))
+    return path
+
+
+def record_reference(results, path=REFERENCE_BASELINE):
+    """Merge `results` into the committed reference file (other benchmarks are kept)"""
+    path = Path(path)
+    reference = json.loads(path.read_text())["results"] if path.exists() else {}
+    record = result_record({**reference, **results})
+    path.write_text(json.dumps(record, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def latest_results(results_dir=DEFAULT_RESULTS_DIR, exclude=None):
+    files = sorted(Path(results_dir).glob("bench_*.json"), key=lambda p: p.stat().st_mtime)
+    files = [f for f in files if f != exclude]
+    return files[-1] if files else None
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Per benchmark present in both: time/memory ratios and whether either
+    regressed past `threshold` (and the noise floor). Returns [row, ...].
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        dt = current["min_s"] - previous["min_s"]
+        dm = current["peak_bytes"] - previous["peak_bytes"]
+        time_ratio = current["min_s"] / previous["min_s"] if previous["min_s"] else None
+        mem_ratio = current["peak_bytes"] / previous["peak_bytes"] if previous["peak_bytes"] else None
+        rows.append({
+            "name": name,
+            "time_ratio": time_ratio,
+            "memory_ratio": mem_ratio,
+            "time_regressed": dt > TIME_NOISE_FLOOR and time_ratio is not None
+            and time_ratio > 1 + threshold,
+            "memory_regressed": dm > MEMORY_NOISE_FLOOR and mem_ratio is not None
+            and mem_ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _format(name, result):
+    return (f"  {name:<40} {result['min_s'] * 1e3:>10.2f} ms (median "
+            f"{result['median_s'] * 1e3:.2f})  peak {result['peak_bytes'] / 2**20:>8.1f} MiB")
+
+
+def report(results, baseline_path, threshold):
+    """Print the comparison against one result file; returns the number of regressions"""
+    baseline = json.loads(Path(baseline_path).read_text())
+    rows = compare(results, baseline["results"], threshold)
+    print(f"📊 Against {Path(baseline_path).name} (commit {baseline.get('commit')}), "
+          f"threshold +{threshold:.0%}:")
+    regressions = 0
+    for row in rows:
+        flags = [kind for kind in ("time", "memory") if row[f"{kind}_regressed"]]
+        regressions += bool(flags)
+        time_text = f"{row['time_ratio']:.2f}×" if row["time_ratio"] is not None else "n/a"
+        mem_text = f"{row['memory_ratio']:.2f}×" if row["memory_ratio"] is not None else "n/a"
+        print(f"  {row['name']:<40} time {time_text:>7}  memory {mem_text:>7}"
+              f"{'  ❌ ' + '+'.join(flags) if flags else ''}")
+    print()
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AETERNA-PORTA v2.1 benchmarks")
+    parser.add_argument("--filter", help="Only benchmarks whose name starts with this")
+    parser.add_argument("--baseline", help="Result file to compare with (default: the previous one)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown / memory growth (default: 0.2)")
+    parser.add_argument("--results-dir", default=DEFAULT_RESULTS_DIR,
+                        help="Where results are stored (default: ~/.osiris/benchmarks)")
+    parser.add_argument("--no-save", action="store_true", help="Do not store this run")
+    parser.add_argument("--record-reference", action="store_true",
+                        help=f"Store this run's results in {REFERENCE_BASELINE.name}")
+    args = parser.parse_args(argv)
+
+    baseline_path = Path(args.baseline) if args.baseline else latest_results(args.results_dir)
+
+    print("⏱️  BENCHMARKS")
+    results = run_benchmarks(args.filter, on_result=lambda name, r: print(_format(name, r)))
+    print()
+    if not args.no_save:
+        print(f"📦 Results: {save_results(results, args.results_dir)}")
+
+    baselines = [path for path in (baseline_path, REFERENCE_BASELINE)
+                 if path is not None and Path(path).exists()]
+    if not baselines:
+        print("  No baseline to compare with")
+    regressions = sum(report(results, path, args.threshold) for path in baselines)
+    if args.record_reference:
+        print(f"📌 Reference: {record_reference(results)}")
+    if regressions:
+        print(f"❌ {regressions} benchmark(s) regressed past +{args.threshold:.0%}")
+        return 1
+    print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+AETERNA-PORTA v2.1 — COMMAND-LINE ENTRY POINT
+Framework: dna::}{::lang v51.843
+
+    python aeterna_porta_v2_cli.py build    [--output DIR]
+    python aeterna_porta_v2_cli.py compile  [--local]
+    python aeterna_porta_v2_cli.py tune     [--local] [--family grid|controls] [--seeds N]
+    python aeterna_porta_v2_cli.py submit   [--local] [--mode MODE]
+    python aeterna_porta_v2_cli.py resume   [JOURNAL] [--local] [--mode MODE]
+    python aeterna_porta_v2_cli.py analyze  [EVIDENCE] [--replicates N] [--write]
+    python aeterna_porta_v2_cli.py bench    [--filter PREFIX] [--threshold 0.2]
+    python aeterna_porta_v2_cli.py index    [DIR ...] [--rebuild]
+    python aeterna_porta_v2_cli.py query    [--backend B] [--K N ...] [--since 30d] [--group-by K]
+
+Each subcommand imports only what it needs, inside its handler:
+
+  analyze            NumPy + the statistics/evidence modules (no qiskit)
+  index / query      NumPy + sqlite3 (no qiskit)
+  build              + qiskit circuits
+  compile / tune     + transpiler, the chosen provider
+  submit / resume    + qiskit_ibm_runtime, or qiskit_aer with --local
+  bench              whatever the selected benchmark suites exercise
+
+`--timing` reports how long the subcommand took to start (this module's
+import up to the handler being ready to work) against STARTUP_BUDGET_SECONDS.
+`analyze` on saved evidence is budgeted at 0.5 s; check a change with
+`python -X importtime aeterna_porta_v2_cli.py analyze --timing`.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_T0 = time.perf_counter()
+
+# Startup budget per subcommand (seconds); subcommands not listed are unbudgeted
+STARTUP_BUDGET_SECONDS = {"analyze": 0.5, "query": 0.5}
+
+
+def _started(args):
+    """Report startup time once a handler has finished its imports"""
+    elapsed = time.perf_counter() - _T0
+    budget = STARTUP_BUDGET_SECONDS.get(args.command)
+    if args.timing:
+        budget_text = f" (budget {budget:.2f}s)" if budget is not None else ""
+        print(f"⏱️  {args.command} started in {elapsed:.3f}s{budget_text}")
+    if budget is not None and elapsed > budget:
+        print(f"⚠️  {args.command} startup {elapsed:.3f}s exceeds its {budget:.2f}s budget",
+              file=sys.stderr)
+    return elapsed
+
+# ═══════════════════════════════════════════════════════════════════
+# SUBCOMMANDS
+# ═══════════════════════════════════════════════════════════════════
+
+def cmd_build(args):
+    """Build the logical K templates and C0/C1/C2 (optionally saved as QPY)"""
+    from qiskit import qpy
+    from qiskit.circuit import Parameter
+
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+    _started(args)
+
+    circuits = {f"K{K}": sweep.build_parametric_circuit(Parameter("α"), K) for K in sweep.K_SWEEP}
+    circuits.update({name: sweep.build_control(name) for name in sweep.CONTROL_LABELS})
+
+    output = Path(args.output) if args.output else None
+    if output is not None:
+        output.mkdir(parents=True, exist_ok=True)
+    for name, qc in circuits.items():
+        print(f"  {name}: {qc.num_qubits} qubits, depth {qc.depth()}, {qc.size()} ops")
+        if output is not None:
+            with open(output / f"{name}.qpy", "wb") as f:
+                qpy.dump(qc, f)
+    if output is not None:
+        print(f"  {len(circuits)} circuits written to {output}")
+    return 0
+
+
+def cmd_compile(args):
+    """Compile templates + controls for the backend (fills the transpile cache)"""
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+    from aeterna_porta_v2_transpile_cache import TranspileCache
+
+    _, backend = sweep.connect_backend(args.local)
+    _started(args)
+
+    cache = TranspileCache() if sweep.USE_TRANSPILE_CACHE else None
+    print(f"🛠️  COMPILING K TEMPLATES FOR {backend.name}...")
+    sweep.compile_sweep(backend, sweep.make_templates(backend, cache), cache)
+    if args.local:
+        backend.shutdown()
+    return 0
+
+
+def cmd_tune(args):
+    """Autotune transpile settings per circuit family and store the winners for the backend"""
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+    from aeterna_porta_v2_transpile_cache import TranspileCache
+
+    _, backend = sweep.connect_backend(args.local)
+    _started(args)
+
+    cache = TranspileCache() if sweep.USE_TRANSPILE_CACHE else None
+    print(f"🎛️  AUTOTUNING TRANSPILATION FOR {backend.name}...")
+    sweep.autotune_transpile(backend, families=args.family, max_seeds=args.seeds,
+                             transpile_cache=cache)
+    if args.local:
+        backend.shutdown()
+    return 0
+
+
+def cmd_submit(args):
+    """Run the full sweep (new run, or continue a journal with `resume`)"""
+    import deploy_aeterna_porta_v2_SWEEP as sweep
+    _started(args)
+
+    kwargs = {"evidence_dir": args.evidence_dir} if args.evidence_dir else {}
+    if args.telemetry_sink:
+        kwargs["telemetry_sink"] = args.telemetry_sink
+    if args.no_telemetry:
+        kwargs["telemetry"] = False
+    sweep.run_sweep(local=args.local, resume=getattr(args, "journal", None),
+                    execution_mode=args.mode, **kwargs)
+    return 0
+
+
+def cmd_analyze(args):
+    """Re-run statistics + decision rule on saved evidence"""
+    from aeterna_porta_v2_analysis import (
+        analyze_evidence,
+        best_configuration,
+        latest_evidence,
+        print_best_configuration,
+    )
+    from aeterna_porta_v2_evidence_store import DEFAULT_EVIDENCE_DIR
+    _started(args)
+
+    if args.evidence is not None:
+        path = args.evidence
+    else:
+        path = latest_evidence(args.evidence_dir or DEFAULT_EVIDENCE_DIR)
+        if path is None:
+            print(f"No sweep evidence found in {args.evidence_dir or DEFAULT_EVIDENCE_DIR}",
+                  file=sys.stderr)
+            return 1
+
+    t0 = time.perf_counter()
+    try:
+        evidence = analyze_evidence(
+            path, replicates=args.replicates, seed=args.seed, level=args.level,
+            z_threshold=args.z_threshold, max_workers=args.workers, write=args.write,
+        )
+    except ValueError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    statistics = evidence["statistics"]
+
+    print(f"📊 {path}")
+    print(f"  {statistics['replicates']} replicates × "
+          f"{len(evidence['results']) + len(evidence['controls'])} configurations in "
+          f"{time.perf_counter() - t0:.1f}s")
+    print(f"  Rule: {statistics['rule']}")
+    print()
+    for entry in evidence["results"]:
+        stats = entry["statistics"]
+        z = stats["decision"]["z_delta_tau"]
+        print(f"  α={entry['alpha']:.4f}, K={entry['K']:>2}: "
+              f"Φ̂={stats['phi']['estimate']:.4f}±{stats['phi']['se']:.4f} "
+              f"Γ̂={stats['gamma']['estimate']:.4f}±{stats['gamma']['se']:.4f} "
+              f"Z_Δτ={f'{z:.2f}' if z is not None else 'n/a'} "
+              f"{'🔥' if stats['decision']['ignite'] else '·'}")
+    print()
+    print(f"  Accepted by decision rule: {len(statistics['accepted'])}")
+    if args.write:
+        print(f"  Statistics written back to {path}")
+    print()
+
+    print_best_configuration(best_configuration(evidence["results"]),
+                             evidence["constants"]["PHI_THRESHOLD"])
+    return 0
+
+
+def _index_dirs(args):
+    from aeterna_porta_v2_evidence_store import DEFAULT_EVIDENCE_DIR
+    # Ignition artifacts are written to the working directory
+    return args.dirs or [DEFAULT_EVIDENCE_DIR, Path.cwd()]
+
+
+def cmd_index(args):
+    """Ingest new or changed evidence files into the SQLite index"""
+    from aeterna_porta_v2_evidence_index import DEFAULT_INDEX_PATH, EvidenceIndex
+    _started(args)
+
+    path = args.index or DEFAULT_INDEX_PATH
+    if args.rebuild and path.exists():
+        path.unlink()
+    t0 = time.perf_counter()
+    with EvidenceIndex(path) as index:
+        report = index.update(_index_dirs(args))
+        counts = index.counts()
+    print(f"🗂️  {path}: +{report['added']} new, {report['updated']} updated, "
+          f"{report['removed']} removed, {report['unchanged']} unchanged "
+          f"in {time.perf_counter() - t0:.2f}s")
+    print(f"  {counts['runs']} runs, {counts['entries']} entries indexed")
+    for failure in report["failed"]:
+        print(f"⚠️  skipped {failure}", file=sys.stderr)
+    return 0
+
+
+def cmd_query(args):
+    """Cross-run query over the evidence index"""
+    from datetime import datetime
+
+    import numpy as np
+
+    from aeterna_porta_v2_evidence_index import DEFAULT_INDEX_PATH, EvidenceIndex, parse_age
+    _started(args)
+
+    filters = {
+        "kind": args.kind, "backend": args.backend, "K": args.K, "control": args.control,
+        "since": parse_age(args.since) if args.since else None,
+    }
+    with EvidenceIndex(args.index or DEFAULT_INDEX_PATH) as index:
+        if not args.no_update:
+            index.update(_index_dirs(args))
+        t0 = time.perf_counter()
+        try:
+            if args.group_by:
+                rows = index.aggregate(args.group_by, args.value, **filters)
+            else:
+                columns = args.columns.split(",") if args.columns else None
+                rows = index.query(columns=columns, limit=args.limit, **filters)
+        except ValueError as exc:
+            print(f"❌ {exc}", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - t0
+
+    def cell(name, value):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return ""
+        if name == "timestamp":
+            return datetime.fromtimestamp(value).isoformat(timespec="seconds")
+        return f"{value:.6g}" if isinstance(value, float) else str(value)
+
+    names = rows.dtype.names
+    print("\t".join(names))
+    for row in rows:
+        print("\t".join(cell(name, value) for name, value in zip(names, row.tolist())))
+    print(f"({len(rows)} rows in {elapsed * 1000:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+def cmd_bench(args):
+    """Benchmark suite with regression check (see aeterna_porta_v2_benchmarks)"""
+    from aeterna_porta_v2_benchmarks import main as bench_main
+    _started(args)
+    return bench_main(args.bench_args)
+
+# ═══════════════════════════════════════════════════════════════════
+# ARGUMENTS
+# ═══════════════════════════════════════════════════════════════════
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="aeterna_porta_v2_cli", description="AETERNA-PORTA v2.1 ignition sweep"
+    )
+    parser.add_argument("--timing", action="store_true",
+                        help="Report subcommand startup time against its budget")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Build the logical sweep and control circuits")
+    build.add_argument("--output", metavar="DIR", help="Write each circuit as QPY into DIR")
+    build.set_defaults(handler=cmd_build)
+
+    def add_backend_options(sub):
+        sub.add_argument(
+            "--local", action="store_true",
+            help="Use the offline local simulator (no IBM Quantum account)",
+        )
+
+    compile_ = commands.add_parser("compile", help="Compile templates and controls into the transpile cache")
+    add_backend_options(compile_)
+    compile_.set_defaults(handler=cmd_compile)
+
+    tune = commands.add_parser("tune", help="Autotune transpile settings per circuit family for the backend")
+    add_backend_options(tune)
+    tune.add_argument("--family", nargs="+", choices=("grid", "controls"),
+                      help="Families to tune (default: all)")
+    tune.add_argument("--seeds", type=int, metavar="N",
+                      help="Seeds per surviving candidate in the last round (default: MAX_SEEDS)")
+    tune.set_defaults(handler=cmd_tune)
+
+    def add_run_options(sub, mode_help="Execution mode (default: EXECUTION_MODE)"):
+        add_backend_options(sub)
+        sub.add_argument("--mode", choices=("sequential", "batched", "pipeline", "adaptive", "fanout"),
+                         help=mode_help)
+        sub.add_argument("--evidence-dir", metavar="DIR",
+                         help="Evidence/journal directory (default: ~/.osiris/evidence/quantum)")
+        sub.add_argument("--telemetry-sink", metavar="PATH",
+                         help="Also write telemetry to PATH (*.jsonl events or *.prom metrics)")
+        sub.add_argument("--no-telemetry", action="store_true",
+                         help="Do not record per-stage telemetry")
+
+    submit = commands.add_parser("submit", help="Run the full sweep")
+    add_run_options(submit)
+    submit.set_defaults(handler=cmd_submit)
+
+    resume = commands.add_parser("resume", help="Resume an interrupted sweep from its journal")
+    resume.add_argument("journal", nargs="?", default="latest", metavar="JOURNAL",
+                        help="Journal to resume (default: the latest one)")
+    add_run_options(resume, mode_help="Execution mode (default and only accepted value: "
+                                      "the mode recorded in the journal)")
+    resume.set_defaults(handler=cmd_submit)
+
+    analyze = commands.add_parser("analyze", help="Bootstrap statistics + decision rule on saved evidence")
+    analyze.add_argument("evidence", nargs="?", metavar="EVIDENCE",
+                         help="Evidence JSON (default: the latest one)")
+    analyze.add_argument("--evidence-dir", metavar="DIR",
+                         help="Where to look for the latest evidence")
+    analyze.add_argument("--replicates", type=int, help="Bootstrap replicates (default: as recorded)")
+    analyze.add_argument("--seed", type=int, help="Bootstrap seed (default: as recorded)")
+    analyze.add_argument("--level", type=float, help="Confidence level (default: as recorded)")
+    analyze.add_argument("--z-threshold", type=float, help="Z_Δτ threshold (default: as recorded)")
+    analyze.add_argument("--workers", type=int, help="Bootstrap worker processes (default: all cores)")
+    analyze.add_argument("--write", action="store_true",
+                         help="Store the refreshed statistics back into the evidence file")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    def add_index_options(sub):
+        sub.add_argument("--index", type=Path, metavar="FILE",
+                         help="SQLite index (default: evidence_index.sqlite in the evidence directory)")
+
+    index = commands.add_parser("index", help="Ingest new/changed evidence into the SQLite index")
+    index.add_argument("dirs", nargs="*", metavar="DIR",
+                       help="Directories to scan (default: the evidence directory and the current one)")
+    add_index_options(index)
+    index.add_argument("--rebuild", action="store_true", help="Drop the index and ingest everything")
+    index.set_defaults(handler=cmd_index)
+
+    query = commands.add_parser("query", help="Query indexed configurations across runs")
+    add_index_options(query)
+    query.add_argument("--dirs", nargs="*", default=None, metavar="DIR",
+                       help="Directories to refresh before querying (default as for index)")
+    query.add_argument("--no-update", action="store_true", help="Query without refreshing the index")
+    query.add_argument("--kind", choices=("grid", "control", "ignition"))
+    query.add_argument("--backend", nargs="+", help="Backend name(s)")
+    query.add_argument("--K", type=int, nargs="+", help="Zeno cycle count(s)")
+    query.add_argument("--control", nargs="+", help="Control name(s)")
+    query.add_argument("--since", metavar="AGE", help="Only runs newer than AGE (30d, 12h, 45m)")
+    query.add_argument("--columns", metavar="A,B,…", help="Columns to print (default: all)")
+    query.add_argument("--limit", type=int, help="At most this many rows")
+    query.add_argument("--group-by", metavar="COLUMN", help="Aggregate --value per COLUMN")
+    query.add_argument("--value", default="phi", help="Column aggregated by --group-by (default: phi)")
+    query.set_defaults(handler=cmd_query)
+
+    bench = commands.add_parser("bench", add_help=False,
+                                help="Time/memory benchmarks, failing on regressions")
+    bench.set_defaults(handler=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # `bench` passes its own options through to the benchmark runner
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.bench_args = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
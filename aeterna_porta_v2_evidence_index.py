@@ -0,0 +1,393 @@
+"""
+AETERNA-PORTA v2.1 — EVIDENCE INDEX
+Framework: dna::}{::lang v51.843
+
+A local SQLite index over saved evidence, so cross-run questions
+("Φ̂ vs K on ibm_fez over the last month") are one query instead of
+parsing every JSON file:
+
+    index = EvidenceIndex()                       # ~/.osiris/evidence/quantum/evidence_index.sqlite
+    index.update([DEFAULT_EVIDENCE_DIR, "."])     # ingest new / changed files only
+    rows = index.query(backend="ibm_fez", since=timedelta(days=30), columns=["K", "phi"])
+    index.aggregate("K", "phi", backend="ibm_fez")
+
+Sources:
+  aeterna_porta_sweep_<ts>.json          one row per grid point and control
+  aeterna_ignition_artifact_<job>.json   one row per ignition run
+
+Each file is recorded with its mtime and size. `update` re-reads only files
+that are new or changed since the last scan, and drops rows of files that
+disappeared from a scanned directory. The per-configuration fields
+(backend, timestamp, K, Φ̂, …) are denormalised into one indexed table, so
+a query reads no JSON at all.
+
+Results are NumPy structured arrays: numeric columns are float64 with NaN
+for missing values, text columns are object. `as_frame=True` returns a
+pandas DataFrame when pandas is installed. Only the standard library and
+NumPy are needed.
+"""
+import json
+import re
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+from aeterna_porta_v2_evidence_store import DEFAULT_EVIDENCE_DIR
+
+DEFAULT_INDEX_PATH = DEFAULT_EVIDENCE_DIR / "evidence_index.sqlite"
+SWEEP_PATTERN = "aeterna_porta_sweep_*.json"
+IGNITION_PATTERN = "aeterna_ignition_artifact_*.json"
+SCHEMA_VERSION = 1  # Bump when the columns change; older indexes are rebuilt
+
+# (column, SQL type) of the entries table, in query order
+ENTRY_COLUMNS = (
+    ("run_id", "INTEGER"),
+    ("source", "TEXT"),             # sweep | ignition
+    ("kind", "TEXT"),               # grid | control | ignition
+    ("timestamp", "REAL"),          # run time, Unix seconds
+    ("backend", "TEXT"),
+    ("execution_mode", "TEXT"),
+    ("alpha", "REAL"),
+    ("K", "INTEGER"),
+    ("control", "TEXT"),
+    ("job_id", "TEXT"),
+    ("shots", "INTEGER"),
+    ("circuit_depth", "INTEGER"),
+    ("phi", "REAL"),
+    ("lambda", "REAL"),
+    ("gamma", "REAL"),
+    ("xi", "REAL"),
+    ("p_succ", "REAL"),
+    ("delta_tau_eff", "REAL"),
+    ("support", "INTEGER"),
+    ("conscious", "INTEGER"),
+    ("phi_se", "REAL"),
+    ("gamma_se", "REAL"),
+    ("z_delta_tau", "REAL"),
+    ("ignite", "INTEGER"),
+    ("lr_mutual_information", "REAL"),
+    ("bridge_zz", "REAL"),
+    ("zeno_click_rate", "REAL"),
+)
+COLUMN_NAMES = tuple(name for name, _ in ENTRY_COLUMNS)
+_TEXT_COLUMNS = {name for name, kind in ENTRY_COLUMNS if kind == "TEXT"}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    directory TEXT NOT NULL,
+    source TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    timestamp REAL,
+    backend TEXT,
+    execution_mode TEXT,
+    status TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    {", ".join(f'"{name}" {kind}' for name, kind in ENTRY_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS entries_run ON entries (run_id);
+CREATE INDEX IF NOT EXISTS entries_backend_time ON entries (backend, timestamp);
+CREATE INDEX IF NOT EXISTS entries_kind_k ON entries (kind, K);
+"""
+
+# ═══════════════════════════════════════════════════════════════════
+# EVIDENCE → ROWS
+# ═══════════════════════════════════════════════════════════════════
+
+def _get(data, *path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _epoch(timestamp):
+    """Unix seconds from a number or an ISO-8601 string (naive = UTC)"""
+    if timestamp is None or isinstance(timestamp, (int, float)):
+        return timestamp
+    stamp = datetime.fromisoformat(timestamp)
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.timestamp()
+
+
+def _entry_row(entry, run, kind):
+    ccce = entry.get("ccce") or {}
+    stats = entry.get("statistics") or {}
+    return {
+        "source": run["source"],
+        "kind": kind,
+        "timestamp": run["timestamp"],
+        "backend": entry.get("backend") or run["backend"],
+        "execution_mode": run["execution_mode"],
+        "alpha": entry.get("alpha"),
+        "K": entry.get("K"),
+        "control": entry.get("control"),
+        "job_id": entry.get("job_id"),
+        "shots": entry.get("shots"),
+        "circuit_depth": entry.get("circuit_depth"),
+        "phi": ccce.get("phi"),
+        "lambda": ccce.get("lambda"),
+        "gamma": ccce.get("gamma"),
+        "xi": ccce.get("xi"),
+        "p_succ": _get(entry, "observables", "p_succ"),
+        "delta_tau_eff": _get(entry, "observables", "delta_tau_eff"),
+        "support": _get(entry, "observables", "support"),
+        "conscious": ccce.get("conscious"),
+        "phi_se": _get(stats, "phi", "se"),
+        "gamma_se": _get(stats, "gamma", "se"),
+        "z_delta_tau": _get(stats, "decision", "z_delta_tau"),
+        "ignite": _get(stats, "decision", "ignite"),
+        "lr_mutual_information": _get(entry, "marginals", "pairs", "L|R", "mutual_information_bits"),
+        "bridge_zz": _get(entry, "marginals", "bridge_zz", "mean"),
+        "zeno_click_rate": _get(entry, "zeno", "click_rate"),
+    }
+
+
+def sweep_rows(evidence):
+    """(run fields, [entry rows]) of one sweep evidence dict"""
+    run = {
+        "source": "sweep",
+        "timestamp": _epoch(evidence.get("timestamp")),
+        "backend": evidence.get("backend"),
+        "execution_mode": _get(evidence, "sweep_parameters", "execution_mode"),
+        "status": "COMPLETED",
+    }
+    rows = [_entry_row(entry, run, "grid") for entry in evidence.get("results", [])]
+    rows += [_entry_row(entry, run, "control") for entry in evidence.get("controls", [])]
+    return run, rows
+
+
+def ignition_rows(artifact):
+    """(run fields, [entry row]) of one ignition artifact"""
+    config = artifact.get("config") or {}
+    run = {
+        "source": "ignition",
+        "timestamp": _epoch(artifact.get("timestamp")),
+        "backend": artifact.get("backend") or config.get("target_backend"),
+        "execution_mode": artifact.get("execution_mode"),
+        "status": artifact.get("status"),
+    }
+    entry = {"shots": config.get("shots"), **artifact}
+    return run, [_entry_row(entry, run, "ignition")]
+
+
+def rows_for(path, data):
+    """Run fields and entry rows for an evidence file of either kind"""
+    if Path(path).name.startswith("aeterna_ignition_artifact_"):
+        return ignition_rows(data)
+    return sweep_rows(data)
+
+# ═══════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════
+
+def parse_age(text):
+    """'30d' / '12h' / '45m' / '90s' → timedelta"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([dhms])\s*", text)
+    if match is None:
+        raise ValueError(f"Age must look like 30d, 12h, 45m or 90s: {text!r}")
+    value, unit = float(match.group(1)), match.group(2)
+    return timedelta(**{{"d": "days", "h": "hours", "m": "minutes", "s": "seconds"}[unit]: value})
+
+
+def _bound(value):
+    """Unix seconds from epoch seconds, a datetime, or a timedelta (that long ago)"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, timedelta):
+        return time.time() - value.total_seconds()
+    if isinstance(value, datetime):
+        return _epoch(value.isoformat())
+    raise TypeError(f"Expected seconds, datetime or timedelta, got {type(value).__name__}")
+
+
+def _quoted(names):
+    return ", ".join(f'"{name}"' for name in names)
+
+
+def _to_array(names, records, text_columns=_TEXT_COLUMNS):
+    """Structured array from SQL rows (NULL → NaN / None)"""
+    columns = list(zip(*records)) if records else [()] * len(names)
+    arrays = []
+    for name, values in zip(names, columns):
+        if name in text_columns:
+            arrays.append(np.array(values, dtype=object))
+        else:
+            arrays.append(np.array(values, dtype=np.float64))  # None → NaN
+    dtype = [(name, arr.dtype) for name, arr in zip(names, arrays)]
+    out = np.empty(len(records), dtype=dtype)
+    for name, arr in zip(names, arrays):
+        out[name] = arr
+    return out
+
+
+def _frame(array, as_frame):
+    if not as_frame:
+        return array
+    try:
+        import pandas as pd
+    except ImportError as exc:
+        raise ImportError("as_frame=True needs pandas (pip install pandas)") from exc
+    return pd.DataFrame({name: array[name] for name in array.dtype.names})
+
+
+class EvidenceIndex:
+    """Incremental SQLite index of sweep evidence and ignition artifacts"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._db.executescript("DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS runs;")
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── ingest ──
+
+    def ingest(self, path):
+        """(Re-)index one evidence file; returns the number of entry rows"""
+        path = Path(path).resolve()
+        stat = path.stat()
+        run, rows = rows_for(path, json.loads(path.read_text()))
+        with self._db:
+            self._forget(str(path))
+            cursor = self._db.execute(
+                "INSERT INTO runs (path, directory, source, mtime, size, timestamp, backend, "
+                "execution_mode, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(path), str(path.parent), run["source"], stat.st_mtime, stat.st_size,
+                 run["timestamp"], run["backend"], run["execution_mode"], run["status"]),
+            )
+            run_id = cursor.lastrowid
+            placeholders = ", ".join("?" * len(COLUMN_NAMES))
+            self._db.executemany(
+                f"INSERT INTO entries VALUES ({placeholders})",
+                [(run_id, *(row[name] for name in COLUMN_NAMES[1:])) for row in rows],
+            )
+        return len(rows)
+
+    def _forget(self, path):
+        self._db.execute("DELETE FROM entries WHERE run_id IN (SELECT run_id FROM runs WHERE path = ?)",
+                         (path,))
+        self._db.execute("DELETE FROM runs WHERE path = ?", (path,))
+
+    def update(self, directories=(DEFAULT_EVIDENCE_DIR,), patterns=(SWEEP_PATTERN, IGNITION_PATTERN)):
+        """
+        Ingest new or changed evidence files under `directories` and drop
+        files that were removed. Returns {"added", "updated", "removed",
+        "unchanged", "failed"} file counts.
+        """
+        report = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "failed": []}
+        for directory in directories:
+            directory = Path(directory).resolve()
+            known = {
+                path: (mtime, size) for path, mtime, size in self._db.execute(
+                    "SELECT path, mtime, size FROM runs WHERE directory = ?", (str(directory),))
+            }
+            seen = set()
+            for pattern in patterns:
+                for path in sorted(directory.glob(pattern)):
+                    seen.add(str(path))
+                    stat = path.stat()
+                    previous = known.get(str(path))
+                    if previous == (stat.st_mtime, stat.st_size):
+                        report["unchanged"] += 1
+                        continue
+                    try:
+                        self.ingest(path)
+                    except (OSError, ValueError) as exc:
+                        # Half-written or foreign JSON: skip it, retry on the next scan
+                        report["failed"].append(f"{path}: {exc}")
+                        continue
+                    report["updated" if previous else "added"] += 1
+            with self._db:
+                for path in set(known) - seen:
+                    self._forget(path)
+                    report["removed"] += 1
+        return report
+
+    # ── queries ──
+
+    def query(self, kind=None, backend=None, K=None, alpha=None, control=None, source=None,
+              since=None, until=None, columns=None, order_by="timestamp", limit=None,
+              as_frame=False):
+        """
+        Indexed entries matching every given filter, as a structured array
+        (or DataFrame). K / backend / control / kind accept a value or a list;
+        since / until take Unix seconds, a datetime, or a timedelta ago.
+        """
+        names = self._columns(columns or COLUMN_NAMES)
+        where, params = self._where(kind=kind, backend=backend, K=K, alpha=alpha,
+                                    control=control, source=source, since=since, until=until)
+        sql = f"SELECT {_quoted(names)} FROM entries{where}"
+        if order_by:
+            sql += f' ORDER BY "{self._columns([order_by])[0]}"'
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return _frame(_to_array(names, self._db.execute(sql, params).fetchall()), as_frame)
+
+    def aggregate(self, by, value, as_frame=False, **filters):
+        """Count, mean and standard deviation of `value` per `by` (filters as in query)"""
+        by, value = self._columns([by, value])
+        where, params = self._where(**filters)
+        sql = (f'SELECT "{by}", COUNT("{value}"), AVG("{value}"), '
+               f'AVG("{value}" * "{value}") - AVG("{value}") * AVG("{value}") '
+               f'FROM entries{where} GROUP BY "{by}" ORDER BY "{by}"')
+        records = [(key, n, mean, np.sqrt(max(var, 0.0)) if var is not None else None)
+                   for key, n, mean, var in self._db.execute(sql, params)]
+        out = _to_array([by, "count", "mean", "std"], records)
+        return _frame(out, as_frame)
+
+    def runs(self, as_frame=False):
+        """One row per indexed file"""
+        names = ["run_id", "path", "source", "timestamp", "backend", "execution_mode", "status"]
+        records = self._db.execute(f"SELECT {_quoted(names)} FROM runs ORDER BY timestamp").fetchall()
+        text = {"path", "source", "backend", "execution_mode", "status"}
+        return _frame(_to_array(names, records, text), as_frame)
+
+    def counts(self):
+        runs = self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"runs": runs, "entries": entries}
+
+    @staticmethod
+    def _columns(names):
+        unknown = [name for name in names if name not in COLUMN_NAMES]
+        if unknown:
+            raise ValueError(f"Unknown column(s) {', '.join(unknown)} (known: {', '.join(COLUMN_NAMES)})")
+        return list(names)
+
+    @classmethod
+    def _where(cls, since=None, until=None, **filters):
+        clauses, params = [], []
+        cls._columns(filters)
+        for name, value in filters.items():
+            if value is None:
+                continue
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            clauses.append(f'"{name}" IN ({", ".join("?" * len(values))})')
+            params += values
+        if since is not None:
+            clauses.append('"timestamp" >= ?')
+            params.append(_bound(since))
+        if until is not None:
+            clauses.append('"timestamp" <= ?')
+            params.append(_bound(until))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
@@ -0,0 +1,166 @@
+"""
+AETERNA-PORTA v2.1 — COMPACT FULL-SHOT EVIDENCE STORE
+Framework: dna::}{::lang v51.843
+
+Every configuration's shots are kept, not just a 10-entry counts sample:
+
+- One append-only `<run>.shots` file per sweep holding packed-uint8 rows
+  (BitArray layout: ⌈n/8⌉ bytes per shot, 15 bytes for 120 qubits)
+- The evidence JSON references each configuration's rows by byte offset
+- Readback memory-maps the file, so past runs can be re-analysed one
+  configuration (or one chunk) at a time without loading the whole archive
+
+Only NumPy is needed to read an archive back.
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from aeterna_porta_v2_accumulators import ObservableAccumulator
+from aeterna_porta_v2_partition import Partition
+
+ARCHIVE_FORMAT = "aeterna-porta-shots/packed-uint8-rows/v1"
+DEFAULT_EVIDENCE_DIR = Path.home() / ".osiris" / "evidence" / "quantum"
+
+
+class ShotArchiveWriter:
+    """Append packed shot arrays to one binary file; thread-safe"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._offset = self._file.tell()
+        self._lock = threading.Lock()
+
+    def append(self, bits):
+        """
+        Append one block of shots; returns its segment descriptor
+        {"offset", "shots", "n_bytes", "num_bits", "sha256"}.
+        """
+        array = np.ascontiguousarray(np.asarray(getattr(bits, "array", bits), dtype=np.uint8))
+        array = array.reshape(-1, array.shape[-1])
+        num_bits = getattr(bits, "num_bits", array.shape[1] * 8)
+        payload = array.tobytes()
+
+        with self._lock:
+            offset = self._offset
+            self._file.write(payload)
+            self._file.flush()
+            self._offset += len(payload)
+
+        return {
+            "offset": offset,
+            "shots": int(array.shape[0]),
+            "n_bytes": int(array.shape[1]),
+            "num_bits": int(num_bits),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+        }
+
+    def reference(self, segments):
+        """Manifest entry for a configuration stored as one or more segments"""
+        return {"file": self.path.name, "segments": list(segments)}
+
+    def manifest(self):
+        return {"file": self.path.name, "format": ARCHIVE_FORMAT, "bytes": self._offset}
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ═══════════════════════════════════════════════════════════════════
+# READBACK
+# ═══════════════════════════════════════════════════════════════════
+
+def map_segment(path, segment):
+    """Read-only memmap (shots, n_bytes) of one archived segment"""
+    return np.memmap(
+        path,
+        dtype=np.uint8,
+        mode="r",
+        offset=segment["offset"],
+        shape=(segment["shots"], segment["n_bytes"]),
+    )
+
+
+def iter_shot_chunks(reference, base_dir, chunk_shots=1 << 16):
+    """Yield memmapped (≤ chunk_shots, n_bytes) blocks of a configuration's shots"""
+    path = Path(base_dir) / reference["file"]
+    for segment in reference["segments"]:
+        rows = map_segment(path, segment)
+        for start in range(0, segment["shots"], chunk_shots):
+            yield rows[start:start + chunk_shots]
+
+
+def load_shots(reference, base_dir):
+    """
+    All shots of one configuration: a memmap for single-segment entries,
+    a concatenated in-memory array when the configuration was sharded.
+    """
+    path = Path(base_dir) / reference["file"]
+    segments = [map_segment(path, segment) for segment in reference["segments"]]
+    if len(segments) == 1:
+        return segments[0]
+    return np.concatenate(segments)
+
+
+def verify_reference(reference, base_dir):
+    """True if every segment still matches its recorded sha256"""
+    path = Path(base_dir) / reference["file"]
+    for segment in reference["segments"]:
+        digest = hashlib.sha256(map_segment(path, segment).tobytes()).hexdigest()
+        if digest != segment["sha256"]:
+            return False
+    return True
+
+
+def accumulate_archive(reference, base_dir, num_qubits, chunk_shots=1 << 16):
+    """ObservableAccumulator over an archived configuration, streamed chunk by chunk"""
+    acc = ObservableAccumulator(num_qubits)
+    acc.num_bits = reference["segments"][0]["num_bits"]
+    for chunk in iter_shot_chunks(reference, base_dir, chunk_shots):
+        acc.update(chunk)
+    return acc
+
+
+def observables_from_archive(reference, base_dir, num_qubits, chunk_shots=1 << 16):
+    """
+    Φ̂/Λ̂/Γ̂/p_succ for an archived configuration, streamed chunk by chunk
+    through an ObservableAccumulator (memory ∝ distinct outcomes).
+    """
+    return accumulate_archive(reference, base_dir, num_qubits, chunk_shots).observables()
+
+
+def histogram_from_archive(reference, base_dir, chunk_shots=1 << 16):
+    """(rows, counts) outcome histogram of an archived configuration"""
+    return accumulate_archive(reference, base_dir, 0, chunk_shots).histogram_arrays()
+
+
+def reanalyse_evidence(evidence_path, num_qubits=None, chunk_shots=1 << 16):
+    """
+    Recompute observables for every archived configuration/control of a
+    saved sweep. Returns [(entry, observables), ...] in manifest order.
+    `num_qubits` (count or Partition) defaults to the recorded partition.
+    """
+    evidence_path = Path(evidence_path)
+    evidence = json.loads(evidence_path.read_text())
+    base_dir = evidence_path.parent
+    if num_qubits is None:
+        num_qubits = Partition.from_dict(evidence.get("partition") or {"L": 50, "R": 50, "Anc": 20})
+
+    out = []
+    for entry in evidence.get("results", []) + evidence.get("controls", []):
+        reference = entry.get("shots_ref")
+        if reference is None:
+            continue
+        out.append((entry, observables_from_archive(reference, base_dir, num_qubits, chunk_shots)))
+    return out
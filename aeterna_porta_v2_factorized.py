@@ -0,0 +1,449 @@
+"""
+AETERNA-PORTA v2.1 — EXACT FACTORIZED SAMPLER
+Framework: dna::}{::lang v51.843
+
+The sweep's circuits split into many small independent pieces: the TFD stage
+is a product of (ℓ, L+ℓ) pairs, the Floquet rz gates stay inside single
+qubits, and each Zeno guard only talks to its own ancilla. This module
+
+1. factorizes a circuit into connected components of its qubit/clbit
+   interaction graph (gates, measurements and if_test conditions all link)
+2. computes each component's exact distribution over its classical bits by
+   evolving classical-record-indexed density matrices (mid-circuit
+   measure/reset and if_else supported)
+3. samples any number of shots with vectorized NumPy, writing packed
+   BitArray rows per classical register
+4. gives exact (noise-free, infinite-shot) Φ̂/Λ̂/Γ̂/p_succ baselines from
+   the factor distributions without enumerating the 2^n outcome space
+
+Identical factors (e.g. the 50 ER-bridge pairs) are simulated once.
+"""
+import math
+from collections import defaultdict
+
+import numpy as np
+from qiskit.circuit import ClassicalRegister, Clbit, ControlFlowOp, IfElseOp, QuantumCircuit
+from qiskit.primitives.containers import BitArray
+from qiskit.quantum_info import Operator
+
+from aeterna_porta_v2_observables import gamma_from_rates, leakage_from_log2_support, popcount_rows
+
+MAX_FACTOR_QUBITS = 10
+MAX_FACTOR_CLBITS = 20
+SAMPLE_BLOCK_OUTCOMES = 4096
+
+# Trace below which a measurement branch is treated as impossible
+_TOL = 1e-14
+
+_SKIP = {"barrier", "delay"}
+
+
+class FactorizationError(ValueError):
+    """Circuit does not split into small enough factors (or uses unsupported ops)"""
+
+# ═══════════════════════════════════════════════════════════════════
+# FACTORIZATION
+# ═══════════════════════════════════════════════════════════════════
+
+def _find(parent, x):
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def factorize(circuit, max_factor_qubits=MAX_FACTOR_QUBITS, max_factor_clbits=MAX_FACTOR_CLBITS):
+    """
+    Split `circuit` into independent factors.
+
+    Returns [(qubit indices, clbit indices, [instruction, ...]), ...]; the
+    instructions of each factor keep circuit order. Raises FactorizationError
+    if a factor exceeds the size limits or an instruction is unsupported.
+    """
+    nq = circuit.num_qubits
+    parent = list(range(nq + circuit.num_clbits))
+
+    def nodes(inst):
+        return ([circuit.find_bit(q).index for q in inst.qubits]
+                + [nq + circuit.find_bit(c).index for c in inst.clbits])
+
+    for inst in circuit.data:
+        name = inst.operation.name
+        if name in _SKIP:
+            continue
+        if isinstance(inst.operation, ControlFlowOp) and not isinstance(inst.operation, IfElseOp):
+            raise FactorizationError(f"Unsupported control flow: {name}")
+        linked = nodes(inst)
+        root = _find(parent, linked[0])
+        for node in linked[1:]:
+            parent[_find(parent, node)] = root
+
+    groups = defaultdict(lambda: ([], [], []))
+    for node in range(len(parent)):
+        qubits, clbits, _ = groups[_find(parent, node)]
+        (qubits if node < nq else clbits).append(node if node < nq else node - nq)
+
+    for inst in circuit.data:
+        if inst.operation.name not in _SKIP:
+            groups[_find(parent, nodes(inst)[0])][2].append(inst)
+
+    factors = list(groups.values())
+    for qubits, clbits, _ in factors:
+        if len(qubits) > max_factor_qubits or len(clbits) > max_factor_clbits:
+            raise FactorizationError(
+                f"Factor with {len(qubits)} qubits / {len(clbits)} clbits exceeds the limit"
+            )
+    return factors
+
+
+def is_factorizable(circuit, max_factor_qubits=MAX_FACTOR_QUBITS):
+    try:
+        factorize(circuit, max_factor_qubits)
+    except FactorizationError:
+        return False
+    return True
+
+# ═══════════════════════════════════════════════════════════════════
+# EXACT FACTOR DISTRIBUTIONS
+# ═══════════════════════════════════════════════════════════════════
+#
+# A factor's state is a batch of (classical record, unnormalised density
+# matrix) pairs: `records` is an int64 array of bitmasks over the factor's
+# clbits and `rho` the matching (n_records, 2, …, 2) stack, so every gate,
+# projection and reset is one NumPy call over all records. The trace of each
+# matrix is the probability of its record. Matrix axes (after the record
+# axis) are [row q_{m-1} … q_0, col q_{m-1} … q_0] (qiskit little-endian order).
+
+def _apply_gate(rho, matrix, targets, m):
+    k = len(targets)
+    u = matrix.reshape((2,) * (2 * k))
+    in_axes = [2 * k - 1 - j for j in range(k)]
+
+    rows = [m - t for t in targets]
+    rho = np.tensordot(u, rho, axes=(in_axes, rows))
+    rho = np.moveaxis(rho, [k - 1 - j for j in range(k)], rows)
+
+    cols = [2 * m - t for t in targets]
+    rho = np.tensordot(rho, u.conj(), axes=(cols, in_axes))
+    return np.moveaxis(rho, [2 * m - j for j in range(k)], cols)
+
+
+def _diagonal_index(target, bit, m):
+    index = [slice(None)] * (2 * m + 1)
+    index[m - target] = index[2 * m - target] = bit
+    return tuple(index)
+
+
+def _project(rho, target, bit, m):
+    index = _diagonal_index(target, bit, m)
+    projected = np.zeros_like(rho)
+    projected[index] = rho[index]
+    return projected
+
+
+def _reset(rho, target, m):
+    zero = _diagonal_index(target, 0, m)
+    out = np.zeros_like(rho)
+    out[zero] = rho[zero] + rho[_diagonal_index(target, 1, m)]
+    return out
+
+
+def _trace(rho, m):
+    return np.trace(rho.reshape(len(rho), 2 ** m, 2 ** m), axis1=1, axis2=2).real
+
+
+def _merge(records, rho):
+    """Sum the matrices of equal records"""
+    unique, inverse = np.unique(records, return_inverse=True)
+    if len(unique) == len(records):
+        return records, rho
+    merged = np.zeros((len(unique),) + rho.shape[1:], dtype=rho.dtype)
+    np.add.at(merged, inverse.ravel(), rho)
+    return unique, merged
+
+
+def _condition_holds(condition, records, cmap):
+    target, value = condition
+    if isinstance(target, Clbit):
+        return ((records >> cmap[target]) & 1) == value
+    if isinstance(target, ClassicalRegister):
+        register_value = sum(((records >> cmap[bit]) & 1) << i for i, bit in enumerate(target))
+        return register_value == value
+    raise FactorizationError("Only (clbit, value) / (register, value) conditions are supported")
+
+
+def _evolve(instructions, records, rho, qmap, cmap, m):
+    """Run `instructions` on every record's density matrix; returns the new (records, rho)"""
+    for inst in instructions:
+        if not len(records):
+            break
+        op = inst.operation
+        name = op.name
+        if name in _SKIP:
+            continue
+        qubits = [qmap[q] for q in inst.qubits]
+
+        if name == "measure":
+            target, clbit = qubits[0], cmap[inst.clbits[0]]
+            cleared = records & ~(1 << clbit)
+            branches = [_project(rho, target, bit, m) for bit in (0, 1)]
+            records = np.concatenate([cleared, cleared | (1 << clbit)])
+            rho = np.concatenate(branches)
+            possible = _trace(rho, m) > _TOL
+            records, rho = _merge(records[possible], rho[possible])
+
+        elif name == "reset":
+            rho = _reset(rho, qubits[0], m)
+
+        elif isinstance(op, IfElseOp):
+            taken = _condition_holds(op.condition, records, cmap)
+            true_body, false_body = op.blocks[0], (op.blocks[1] if len(op.blocks) > 1 else None)
+
+            def run_block(block, mask):
+                if block is None or not mask.any():
+                    return records[mask], rho[mask]
+                inner_q = {bq: qmap[oq] for bq, oq in zip(block.qubits, inst.qubits)}
+                inner_c = {bc: cmap[oc] for bc, oc in zip(block.clbits, inst.clbits)}
+                return _evolve(block.data, records[mask], rho[mask], inner_q, inner_c, m)
+
+            parts = [run_block(true_body, taken), run_block(false_body, ~taken)]
+            records, rho = _merge(np.concatenate([r for r, _ in parts]),
+                                  np.concatenate([d for _, d in parts]))
+
+        elif op.num_clbits == 0 and not getattr(op, "is_parameterized", lambda: False)():
+            try:
+                matrix = op.to_matrix()
+            except Exception:
+                matrix = Operator(op).data
+            rho = _apply_gate(rho, matrix, qubits, m)
+
+        else:
+            raise FactorizationError(f"Unsupported instruction in exact sampler: {name}")
+    return records, rho
+
+
+class Factor:
+    """Exact distribution of one factor over its clbits"""
+
+    def __init__(self, clbits, outcomes, probs):
+        self.clbits = list(clbits)
+        self.outcomes = outcomes   # (n_outcomes, len(clbits)) uint8
+        self.probs = probs         # (n_outcomes,) float64, sums to 1
+
+    def marginal(self, clbits):
+        """(outcomes, probs) over a subset of this factor's clbits (in the given order)"""
+        columns = [self.clbits.index(c) for c in clbits]
+        sub = np.ascontiguousarray(self.outcomes[:, columns])
+        if not columns:
+            return sub[:1], np.ones(1)
+        keys = sub.view(np.dtype((np.void, sub.shape[1]))).ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        probs = np.bincount(inverse.ravel(), weights=self.probs, minlength=len(first))
+        return sub[first], probs
+
+
+def _param_key(param):
+    if isinstance(param, QuantumCircuit):
+        return _block_key(param)
+    if isinstance(param, np.ndarray):
+        return param.shape, param.tobytes()
+    return repr(param)
+
+
+def _block_key(block):
+    return tuple(
+        (inst.operation.name,
+         tuple(_param_key(p) for p in inst.operation.params),
+         tuple(block.find_bit(q).index for q in inst.qubits),
+         tuple(block.find_bit(c).index for c in inst.clbits))
+        for inst in block.data
+    )
+
+
+def _factor_signature(qubits, clbits, instructions, circuit):
+    """Position-independent description of a factor (memoization key)"""
+    q_local = {q: i for i, q in enumerate(qubits)}
+    c_local = {c: i for i, c in enumerate(clbits)}
+
+    def condition_key(op):
+        if not isinstance(op, IfElseOp):
+            return None
+        target, value = op.condition
+        bits = [target] if isinstance(target, Clbit) else list(target)
+        return tuple(c_local[circuit.find_bit(b).index] for b in bits), value
+
+    return len(qubits), len(clbits), tuple(
+        (inst.operation.name,
+         tuple(_param_key(p) for p in inst.operation.params),
+         condition_key(inst.operation),
+         tuple(q_local[circuit.find_bit(q).index] for q in inst.qubits),
+         tuple(c_local[circuit.find_bit(c).index] for c in inst.clbits))
+        for inst in instructions
+    )
+
+
+def simulate_factor(circuit, qubits, clbits, instructions):
+    """Exact Factor for one component returned by `factorize`"""
+    m = len(qubits)
+    qmap = {circuit.qubits[q]: i for i, q in enumerate(qubits)}
+    cmap = {circuit.clbits[c]: i for i, c in enumerate(clbits)}
+
+    rho = np.zeros((1,) + (2,) * (2 * m), dtype=complex)
+    rho[(0,) * (2 * m + 1)] = 1.0
+    records, rho = _evolve(instructions, np.zeros(1, dtype=np.int64), rho, qmap, cmap, m)
+
+    probs = _trace(rho, m)
+    keep = probs > _TOL
+    records, probs = records[keep], probs[keep] / probs[keep].sum()
+    outcomes = ((records[:, None] >> np.arange(len(clbits))) & 1).astype(np.uint8)
+    return Factor(clbits, outcomes, probs)
+
+# ═══════════════════════════════════════════════════════════════════
+# FACTORIZED DISTRIBUTION
+# ═══════════════════════════════════════════════════════════════════
+
+class FactorizedDistribution:
+    """Exact output distribution of a circuit as a product of small factors"""
+
+    def __init__(self, circuit, max_factor_qubits=MAX_FACTOR_QUBITS):
+        if circuit.num_parameters:
+            raise FactorizationError("Bind all parameters before exact sampling")
+
+        self.num_qubits = circuit.num_qubits
+        self.factors = []
+        memo = {}
+        for qubits, clbits, instructions in factorize(circuit, max_factor_qubits):
+            if not clbits or not instructions:
+                continue  # Nothing observable, or clbits that always read 0
+            signature = _factor_signature(qubits, clbits, instructions, circuit)
+            if signature not in memo:
+                memo[signature] = simulate_factor(circuit, qubits, clbits, instructions)
+            shared = memo[signature]
+            self.factors.append(Factor(clbits, shared.outcomes, shared.probs))
+        self.distinct_factors = len(memo)
+
+        # register name → (num_bits, {global clbit: bit position in register})
+        self.registers = {
+            creg.name: (creg.size, {circuit.find_bit(bit).index: j for j, bit in enumerate(creg)})
+            for creg in circuit.cregs
+        }
+
+    def _factors_on(self, register):
+        _, positions = self.registers[register]
+        for factor in self.factors:
+            clbits = [c for c in factor.clbits if c in positions]
+            if clbits:
+                yield factor, clbits, [positions[c] for c in clbits]
+
+    def _tables(self, factor, names):
+        """Per register: (n_outcomes, n_bytes) packed contribution of each outcome"""
+        tables = {}
+        for name in names:
+            num_bits, positions = self.registers[name]
+            table = np.zeros((len(factor.probs), max(1, (num_bits + 7) // 8)), dtype=np.uint8)
+            for column, c in enumerate(factor.clbits):
+                if c in positions:
+                    j = positions[c]
+                    table[:, -1 - j // 8] |= factor.outcomes[:, column] << (j % 8)
+            tables[name] = table
+        return tables
+
+    def _blocks(self, names):
+        """
+        Group factors into sampling blocks of ≤ SAMPLE_BLOCK_OUTCOMES joint
+        outcomes (product distribution, OR-ed tables) so each block costs one
+        draw and one gather instead of one per factor.
+        """
+        wanted = set().union(*(self.registers[name][1] for name in names))
+        block = None
+        for factor in self.factors:
+            if wanted.isdisjoint(factor.clbits):
+                continue
+            probs, tables = factor.probs, self._tables(factor, names)
+            if block is not None and len(block[0]) * len(probs) <= SAMPLE_BLOCK_OUTCOMES:
+                block = (
+                    np.outer(block[0], probs).ravel(),
+                    {name: (block[1][name][:, None, :] | tables[name][None, :, :])
+                     .reshape(-1, tables[name].shape[1]) for name in names},
+                )
+                continue
+            if block is not None:
+                yield block
+            block = (probs, tables)
+        if block is not None:
+            yield block
+
+    def sample(self, shots, seed=None, registers=None):
+        """
+        Draw `shots` shots; returns {register name: BitArray}.
+
+        `seed` may be an int or a numpy Generator. Every block contributes a
+        lookup table (joint outcome → packed bytes) per register, so drawing
+        is one rng.choice + one gather/OR per block.
+        """
+        rng = np.random.default_rng(seed)
+        names = list(registers or self.registers)
+        packed = {
+            name: np.zeros((shots, max(1, (self.registers[name][0] + 7) // 8)), dtype=np.uint8)
+            for name in names
+        }
+        for probs, tables in self._blocks(names):
+            draw = rng.choice(len(probs), size=shots, p=probs)
+            for name in names:
+                np.bitwise_or(packed[name], tables[name][draw], out=packed[name])
+        return {name: BitArray(packed[name], self.registers[name][0]) for name in names}
+
+    def exact_observables(self, register="meas", num_qubits=None):
+        """
+        Population (infinite-shot) Φ̂, Λ̂, Γ̂, p_succ over `register`.
+
+        Product structure makes every term factor-wise: entropy and log-support
+        add, p_ref / p_max / Σ√p and the parity bias multiply. Γ̂ keeps the
+        operational leakage term |supp| / 2^n, taken from log₂|supp| so the
+        support size itself is never formed. `num_qubits` may be a Partition.
+        """
+        num_qubits = num_qubits or self.registers[register][0]
+        entropy = 0.0
+        log2_support = 0.0
+        p_ref = 1.0
+        p_max = 1.0
+        sqrt_sum = 1.0
+        parity_bias = 1.0
+        for factor, clbits, _ in self._factors_on(register):
+            outcomes, probs = factor.marginal(clbits)
+            nz = probs > 0
+            outcomes, probs = outcomes[nz], probs[nz]
+            entropy -= float(np.sum(probs * np.log2(probs)))
+            log2_support += math.log2(len(probs))
+            is_ref = ~outcomes.any(axis=1)
+            p_ref *= float(probs[is_ref].sum())
+            p_max *= float(probs.max())
+            sqrt_sum *= float(np.sqrt(probs).sum())
+            signs = 1 - 2 * (popcount_rows(outcomes) % 2)
+            parity_bias *= float(np.sum(probs * signs))
+
+        phi = entropy / log2_support if log2_support >= 1 else 0.0
+        lam = min(1.0, math.sqrt(p_ref) + 0.1 * (sqrt_sum - math.sqrt(p_ref)))
+        p_even = (1 + parity_bias) / 2
+        gamma = gamma_from_rates(p_even, leakage_from_log2_support(log2_support, num_qubits))
+        return {
+            "phi": float(phi),
+            "lambda": float(lam),
+            "gamma": gamma,
+            "p_succ": p_max,
+            "log2_support": log2_support,
+            "entropy_bits": entropy,
+        }
+
+# ═══════════════════════════════════════════════════════════════════
+# ENTRY POINTS
+# ═══════════════════════════════════════════════════════════════════
+
+def sample_factorized(circuit, shots, seed=None, registers=None):
+    """Exact shots of a bound circuit: {register name: BitArray}"""
+    return FactorizedDistribution(circuit).sample(shots, seed, registers)
+
+
+def exact_observables(circuit, register="meas", num_qubits=None):
+    """Noise-free Φ̂/Λ̂/Γ̂/p_succ baseline of a bound circuit"""
+    return FactorizedDistribution(circuit).exact_observables(register, num_qubits)
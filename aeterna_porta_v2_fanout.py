@@ -0,0 +1,230 @@
+"""
+AETERNA-PORTA v2.1 — MULTI-BACKEND FAN-OUT SCHEDULER
+Framework: dna::}{::lang v51.843
+
+Spreads one-job-per-configuration work over every eligible backend instead
+of queueing the whole sweep on the first backend that answers:
+
+- Eligible: wide enough for the partition and reporting itself operational
+- Each backend is a lane with its own compiled templates and controls
+- Dispatch is late: the next configuration goes to the lane with the
+  lowest expected completion
+
+      (queue depth + 1) × service time
+
+  and only once that lane has a free slot (≤ max_in_flight jobs each).
+  A slower lane therefore only takes work while it would still finish
+  before the faster lanes' queues, which keeps the tail short
+
+  queue depth   the backend's reported pending_jobs plus our submissions
+                since that report (never less than our own jobs in flight)
+  service time  EWMA of our recent turnarounds, each divided by the queue
+                position the job was submitted at
+
+  Lanes without history borrow the fastest known service time, so every
+  lane is probed early; ties go to the larger device.
+
+Lanes with shorter queues drain more configurations, so when queue wait
+dominates the makespan drops roughly by the number of lanes. Cancelling
+(Ctrl-C or a failed job) cancels every job still on any backend.
+"""
+import time
+from collections import deque
+
+from aeterna_porta_v2_batch import make_sampler
+
+DEFAULT_SERVICE_SECONDS = 60.0  # Service-time guess before any lane has finished a job
+SERVICE_SMOOTHING = 0.5  # EWMA weight of the newest turnaround
+
+
+def backend_status(backend):
+    """backend.status() (None for backends that do not report one)"""
+    try:
+        return backend.status()
+    except Exception:
+        return None
+
+
+def eligible_backends(backends, num_qubits):
+    """Backends with at least `num_qubits` qubits that are not reported down"""
+    eligible = []
+    for backend in backends:
+        if backend.num_qubits < num_qubits:
+            continue
+        status = backend_status(backend)
+        if status is not None and not getattr(status, "operational", True):
+            continue
+        eligible.append(backend)
+    return eligible
+
+
+class BackendLane:
+    """One backend's share of the sweep: compiled context, jobs in flight, service estimate"""
+
+    def __init__(self, backend, context=None, max_in_flight=4):
+        self.backend = backend
+        self.name = backend.name
+        self.context = context
+        self.max_in_flight = max_in_flight
+        self.in_flight = {}
+        self.service_seconds = None
+        self.reported_depth = None
+        self.submitted_since_report = 0
+        self.jobs = 0
+        self.keys = []
+        self.turnaround_s = 0.0
+        self._sampler = None
+
+    @property
+    def num_qubits(self):
+        return self.backend.num_qubits
+
+    def has_slot(self):
+        return len(self.in_flight) < self.max_in_flight
+
+    def refresh(self):
+        """Re-read the backend's reported queue depth"""
+        status = backend_status(self.backend)
+        pending = getattr(status, "pending_jobs", None)
+        self.reported_depth = int(pending) if pending is not None else None
+        self.submitted_since_report = 0
+
+    def depth(self):
+        reported = (self.reported_depth or 0) + self.submitted_since_report
+        return max(reported, len(self.in_flight))
+
+    def expected_seconds(self, fallback_service):
+        service = self.service_seconds if self.service_seconds is not None else fallback_service
+        return (self.depth() + 1) * service
+
+    def submit(self, key, circuit, shots, meta):
+        if self._sampler is None:
+            self._sampler = make_sampler(self.backend)
+        position = self.depth()
+        job = self._sampler.run([circuit], shots=shots)
+        self.track(key, job, meta, position)
+        self.submitted_since_report += 1
+        return job
+
+    def track(self, key, job, meta, position=0):
+        self.in_flight[job.job_id()] = (key, job, meta, time.monotonic(), position)
+
+    def finished(self):
+        """In-flight records whose job reached a final state"""
+        return [record for record in self.in_flight.values() if record[1].in_final_state()]
+
+    def complete(self, record):
+        key, job, _, submitted, position = record
+        del self.in_flight[job.job_id()]
+        turnaround = time.monotonic() - submitted
+        service = turnaround / (position + 1)
+        if self.service_seconds is None:
+            self.service_seconds = service
+        else:
+            self.service_seconds += SERVICE_SMOOTHING * (service - self.service_seconds)
+        self.jobs += 1
+        self.keys.append(key)
+        self.turnaround_s += turnaround
+
+    def summary(self):
+        return {
+            "backend": self.name,
+            "num_qubits": self.num_qubits,
+            "jobs": self.jobs,
+            "configurations": [list(key) for key in self.keys],
+            "mean_turnaround_s": self.turnaround_s / self.jobs if self.jobs else None,
+            "service_seconds": self.service_seconds,
+        }
+
+
+class FanoutScheduler:
+    """
+    Queue-aware dispatch of single-configuration jobs over several lanes.
+
+    compile_fn(lane, key) -> (circuit, shots, meta)      circuit compiled for lane.backend
+    process_fn(lane, key, pub_result, job, meta) -> entry
+    on_submit(lane, key, job)                           right after submission (journal)
+    on_result(lane, key, entry)                         after processing
+    attached: {key: (lane, job, meta)}                  jobs submitted earlier (resume)
+    """
+
+    def __init__(self, lanes, poll_interval=5.0, status_interval=None):
+        if not lanes:
+            raise ValueError("Fan-out needs at least one eligible backend")
+        self.lanes = list(lanes)
+        self.poll_interval = poll_interval
+        self.status_interval = poll_interval if status_interval is None else status_interval
+        self.makespan_s = None
+        self._last_refresh = None
+
+    def pick(self):
+        """Lane with the lowest expected completion (None while that lane is full)"""
+        known = [lane.service_seconds for lane in self.lanes if lane.service_seconds is not None]
+        fallback = min(known) if known else DEFAULT_SERVICE_SECONDS
+        best = min(self.lanes, key=lambda lane: (lane.expected_seconds(fallback), -lane.num_qubits,
+                                                 self.lanes.index(lane)))
+        return best if best.has_slot() else None
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._last_refresh is None or now - self._last_refresh >= self.status_interval:
+            for lane in self.lanes:
+                lane.refresh()
+            self._last_refresh = now
+
+    def run(self, keys, compile_fn, process_fn, on_submit=None, on_result=None, attached=None):
+        """Run every key on some lane; returns {key: process_fn(...)}"""
+        t0 = time.monotonic()
+        results = {}
+        pending = deque(keys)
+        for key, (lane, job, meta) in (attached or {}).items():
+            lane.track(key, job, meta)
+
+        try:
+            while pending or any(lane.in_flight for lane in self.lanes):
+                self._refresh()
+                while pending:
+                    lane = self.pick()
+                    if lane is None:
+                        break
+                    key = pending.popleft()
+                    circuit, shots, meta = compile_fn(lane, key)
+                    job = lane.submit(key, circuit, shots, meta)
+                    if on_submit is not None:
+                        on_submit(lane, key, job)
+
+                done = [(lane, record) for lane in self.lanes for record in lane.finished()]
+                if not done:
+                    time.sleep(self.poll_interval)
+                    continue
+                for lane, record in done:
+                    key, job, meta = record[:3]
+                    pub_result = job.result()[0]
+                    lane.complete(record)
+                    results[key] = process_fn(lane, key, pub_result, job, meta)
+                    if on_result is not None:
+                        on_result(lane, key, results[key])
+        except BaseException:
+            self.cancel()
+            raise
+
+        self.makespan_s = time.monotonic() - t0
+        return results
+
+    def cancel(self):
+        """Cancel every job still queued or running on any lane"""
+        for lane in self.lanes:
+            for _, job, *_ in list(lane.in_flight.values()):
+                try:
+                    job.cancel()
+                except Exception:
+                    # Already finished or not cancellable any more
+                    pass
+            lane.in_flight.clear()
+
+    def summary(self):
+        return {
+            "policy": "min (queue depth + 1) × service time, ties to the larger device",
+            "makespan_s": self.makespan_s,
+            "lanes": [lane.summary() for lane in self.lanes],
+        }
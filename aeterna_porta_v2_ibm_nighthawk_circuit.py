@@ -1,7 +1,32 @@
+"""
+AETERNA-PORTA v2.1 — IBM NIGHTHAWK CIRCUIT FACTORY
+Framework: dna::}{::lang v51.843
+
+`build_nighthawk_circuit(...)` builds the TFD → Zeno → Floquet → feed-forward
+circuit for any partition and drive settings:
+
+- Each repeated block (one Zeno cycle) is built once and composed in place
+  per cycle, so build time and memory stay flat per cycle (1000+ cycles)
+- The Floquet timesteps act back to back on the same throat qubits, so their
+  rz angles are summed at build time into ONE rz per qubit
+- Coupling strength and drive amplitude can be left as `Parameter`
+  placeholders (`parametric=True`) and bound later
+- Results are memoized per parameter set; callers get a copy
+- The geometry can be given as a Partition (`partition=Partition(60, 60, 10)`)
+  instead of l_qubits / r_qubits / anc_qubits
+- Zeno cycle c measures into its own register zeno_<c>
+  (aeterna_porta_v2_zeno.decode_zeno_records)
+
+Nothing is built at import time. The legacy module attributes `circuit` / `qc`
+are built lazily with the original defaults on first access.
+"""
+from functools import lru_cache
 
-from qiskit import QuantumCircuit
-from qiskit.circuit import Parameter
 import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+
+from aeterna_porta_v2_zeno import zeno_register_name
 
 # Constants
 THETA_LOCK = 51.843
@@ -16,100 +41,147 @@ ANC_QUBITS = 10
 n_L = L_QUBITS
 n_R = R_QUBITS
 
-# Create circuit with derived total
 TOTAL_QUBITS = L_QUBITS + R_QUBITS + ANC_QUBITS
-qc = QuantumCircuit(TOTAL_QUBITS, TOTAL_QUBITS)
-
-# Stage 1: TFD Preparation (ER Bridge)
-for i in range(min(n_L, n_R)):
-    ℓ = i          # Left cluster qubit
-    r = n_L + i    # Right cluster qubit
-
-    # H on left (create superposition)
-    qc.h(ℓ)
-
-    # Rotation with θ_lock (Lenoir frequency)
-    qc.ry(np.deg2rad(THETA_LOCK), ℓ)
-
-    # Entangle with right (create ER bridge)
-    qc.cx(ℓ, r)
-
-    # Calibration rotation on right
-    qc.ry(np.deg2rad(THETA_LOCK / 2), r)
-
-# Barrier (mark end of TFD stage)
-qc.barrier()
-
-# Stage 2: Zeno Monitoring (Continuous Weak Measurement)
-# Implements stroboscopic Kraus map via ancilla coupling
-
-n_anc = ANC_QUBITS
-anc_start = L_QUBITS + R_QUBITS
 
 # Zeno cycle parameters
-zeno_cycles = int(1000000.0 * 1e-6)  # Number of cycles in 1μs window
-coupling_strength = 0.1  # Weak coupling (α parameter)
-
-for cycle in range(min(zeno_cycles, 100)):  # Cap at 100 for circuit depth
-    for i in range(min(n_L, n_anc)):
-        data_qubit = i
-        anc_qubit = anc_start + (i % n_anc)
-
-        # Weak Z⊗Y coupling: exp(-i α Z_q ⊗ Y_a)
-        qc.cry(coupling_strength, data_qubit, anc_qubit)
-
-        # Mid-circuit measurement (requires dynamic circuits)
-        qc.measure(anc_qubit, anc_qubit)
-
-        # Reset ancilla for next cycle
-        qc.reset(anc_qubit)
-
-qc.barrier()
-
-# Stage 3: Floquet Drive (Pilot-Wave Injection)
-# Periodic modulation H_drive to create eternal wormhole
-
-drive_amplitude = 0.5
-drive_frequency = 2 * np.pi * 1.0e9  # 1 GHz (microwave)
-timesteps = 10
-
-for step in range(timesteps):
-    phase = drive_frequency * step * 1e-9  # Timestep in ns
-
-    # Apply parametric drive to throat region
-    throat_start = n_L - 5
-    throat_end = n_L + 5
-
-    for q in range(max(0, throat_start), min(qc.num_qubits, throat_end)):
-        qc.rz(drive_amplitude * np.sin(phase), q)
-
-qc.barrier()
-
-# Stage 4: Feed-Forward (Classical Control with <300.0ns latency)
-# Conditional corrections based on mid-circuit measurements
-
-from qiskit.circuit import IfElseOp
-
-# Measurement on left cluster
-meas_qubits = list(range(min(10, n_L)))  # Sample subset
-meas_clbits = list(range(len(meas_qubits)))
-
-for i, q in enumerate(meas_qubits):
-    qc.measure(q, meas_clbits[i])
-
-# Conditional corrections on right cluster
-for i, m_bit in enumerate(meas_clbits[:min(n_R, len(meas_clbits))]):
-    target_qubit = n_L + i
-
-    # If measurement = 1, apply correction
-    with qc.if_test((m_bit, 1)):
-        qc.x(target_qubit)
-        qc.rz(np.deg2rad(THETA_LOCK), target_qubit)
-
-qc.barrier()
-
-# Stage 5: Full Readout
-qc.measure_all()
-
-# Export circuit
-circuit = qc
+ZENO_CYCLES = int(1000000.0 * 1e-6)  # Number of cycles in 1μs window
+MAX_DEFAULT_ZENO_CYCLES = 100  # Cap for the default circuit's depth
+COUPLING_STRENGTH = 0.1  # Weak coupling (α parameter)
+
+# Floquet drive parameters
+DRIVE_AMPLITUDE = 0.5
+DRIVE_FREQUENCY = 2 * np.pi * 1.0e9  # 1 GHz (microwave)
+TIMESTEPS = 10
+TIMESTEP = 1e-9  # ns
+
+# Feed-forward (classical control with <300.0ns latency)
+FEEDFORWARD_QUBITS = 10
+
+
+def tfd_block(l_qubits, r_qubits, theta_lock=THETA_LOCK):
+    """Stage 1: TFD preparation (ER bridge) on L + R qubits"""
+    block = QuantumCircuit(l_qubits + r_qubits)
+    theta = np.deg2rad(theta_lock)
+    for i in range(min(l_qubits, r_qubits)):
+        ℓ = i              # Left cluster qubit
+        r = l_qubits + i   # Right cluster qubit
+
+        block.h(ℓ)                  # Superposition
+        block.ry(theta, ℓ)          # Rotation with θ_lock (Lenoir frequency)
+        block.cx(ℓ, r)              # Entangle with right (ER bridge)
+        block.ry(theta / 2, r)      # Calibration rotation on right
+    return block
+
+
+def zeno_cycle_block(n_data, n_anc, coupling):
+    """
+    Stage 2, one cycle: weak Z⊗Y coupling of each data qubit to its ancilla,
+    mid-circuit measurement and ancilla reset.
+
+    Block qubits are [data 0..n_data-1, anc 0..n_anc-1]; clbits are the
+    ancilla measurement bits [0..n_anc-1].
+    """
+    block = QuantumCircuit(n_data + n_anc, n_anc)
+    for i in range(n_data):
+        anc = i % n_anc
+        block.cry(coupling, i, n_data + anc)     # exp(-i α Z_q ⊗ Y_a)
+        block.measure(n_data + anc, anc)         # Mid-circuit measurement
+        block.reset(n_data + anc)                # Reset ancilla for next cycle
+    return block
+
+
+def floquet_angle(amplitude, frequency=DRIVE_FREQUENCY, timesteps=TIMESTEPS, timestep=TIMESTEP):
+    """
+    Total rz angle of `timesteps` Floquet steps amplitude·sin(ω t): the steps
+    commute (all rz on the same qubit), so they merge into one rotation.
+    """
+    weight = float(sum(np.sin(frequency * step * timestep) for step in range(timesteps)))
+    return amplitude * weight
+
+
+@lru_cache(maxsize=32)
+def _build(l_qubits, r_qubits, anc_qubits, theta_lock, zeno_cycles, coupling_strength,
+           drive_amplitude, drive_frequency, timesteps, timestep, feedforward_qubits,
+           parametric):
+    total = l_qubits + r_qubits + anc_qubits
+    qc = QuantumCircuit(total, total)
+
+    # Stage 1: TFD Preparation (ER Bridge)
+    qc.compose(tfd_block(l_qubits, r_qubits, theta_lock), range(l_qubits + r_qubits), inplace=True)
+    qc.barrier()
+
+    # Stage 2: Zeno Monitoring (stroboscopic Kraus map via ancilla coupling)
+    coupling = Parameter("g_zeno") if parametric else coupling_strength
+    n_data = min(l_qubits, anc_qubits)
+    anc_start = l_qubits + r_qubits
+    if zeno_cycles and n_data:
+        cycle = zeno_cycle_block(n_data, anc_qubits, coupling)
+        qubits = list(range(n_data)) + list(range(anc_start, anc_start + anc_qubits))
+        # One register per cycle so no cycle's record overwrites another's;
+        # added in one call (adding them one by one is quadratic in cycles)
+        records = [ClassicalRegister(anc_qubits, zeno_register_name(c)) for c in range(zeno_cycles)]
+        qc.add_register(*records)
+        for record in records:
+            qc.compose(cycle, qubits, record, inplace=True)
+    qc.barrier()
+
+    # Stage 3: Floquet Drive (Pilot-Wave Injection), timesteps merged per qubit
+    amplitude = Parameter("A_drive") if parametric else drive_amplitude
+    angle = floquet_angle(amplitude, drive_frequency, timesteps, timestep)
+    throat_start = l_qubits - 5
+    throat_end = l_qubits + 5
+    for q in range(max(0, throat_start), min(total, throat_end)):
+        qc.rz(angle, q)
+    qc.barrier()
+
+    # Stage 4: Feed-Forward (conditional corrections from mid-circuit measurements)
+    meas_qubits = list(range(min(feedforward_qubits, l_qubits)))
+    for i, q in enumerate(meas_qubits):
+        qc.measure(q, i)
+
+    theta = np.deg2rad(theta_lock)
+    for m_bit in range(min(r_qubits, len(meas_qubits))):
+        target_qubit = l_qubits + m_bit
+        with qc.if_test((m_bit, 1)):
+            qc.x(target_qubit)
+            qc.rz(theta, target_qubit)
+    qc.barrier()
+
+    # Stage 5: Full Readout
+    qc.measure_all()
+    return qc
+
+
+def build_nighthawk_circuit(l_qubits=L_QUBITS, r_qubits=R_QUBITS, anc_qubits=ANC_QUBITS,
+                            theta_lock=THETA_LOCK, zeno_cycles=ZENO_CYCLES,
+                            coupling_strength=COUPLING_STRENGTH,
+                            drive_amplitude=DRIVE_AMPLITUDE, drive_frequency=DRIVE_FREQUENCY,
+                            timesteps=TIMESTEPS, timestep=TIMESTEP,
+                            feedforward_qubits=FEEDFORWARD_QUBITS, parametric=False,
+                            partition=None):
+    """
+    Nighthawk circuit for one parameter set (memoized; returns a copy).
+
+    With `parametric=True` the Zeno coupling and the drive amplitude are the
+    Parameters "g_zeno" and "A_drive" instead of numbers. A `partition`
+    overrides l_qubits / r_qubits / anc_qubits.
+    """
+    if partition is not None:
+        l_qubits, r_qubits, anc_qubits = partition.l_qubits, partition.r_qubits, partition.anc_qubits
+    return _build(
+        l_qubits, r_qubits, anc_qubits, float(theta_lock), int(zeno_cycles),
+        float(coupling_strength), float(drive_amplitude), float(drive_frequency),
+        int(timesteps), float(timestep), int(feedforward_qubits), bool(parametric),
+    ).copy()
+
+
+def default_circuit():
+    """The original module-level circuit (Zeno cycles capped for depth)"""
+    return build_nighthawk_circuit(zeno_cycles=min(ZENO_CYCLES, MAX_DEFAULT_ZENO_CYCLES))
+
+
+def __getattr__(name):
+    # Export circuit (built on first access, not at import)
+    if name in ("circuit", "qc"):
+        return default_circuit()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,159 @@
+"""
+AETERNA-PORTA v2.1 — CRASH-SAFE SWEEP JOURNAL
+Framework: dna::}{::lang v51.843
+
+Append-only JSON-lines record of a sweep as it happens, fsync'd per event:
+
+  {"event": "run",       "run_stamp": ..., "config": {...}}
+  {"event": "submitted", "job_id": ..., "keys": [...], "layout": [...]}
+  {"event": "completed", "key": [...], "entry": {...}}
+  {"event": "finished",  "evidence": "<path>"}
+
+Configuration keys are ["grid", α, K] or ["control", name]. Replaying the
+journal yields the finished entries plus the jobs that were submitted but
+never completed, so `--resume` skips done work and re-attaches to pending
+jobs by ID instead of resubmitting them. Reopening a journal first cuts off
+a torn final line left by a crash, so appended records stay parseable.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+def grid_key(alpha_val, K):
+    return ("grid", alpha_val, K)
+
+
+def control_key(name):
+    return ("control", name)
+
+
+def _as_key(value):
+    return tuple(value)
+
+
+def truncate_torn_tail(path):
+    """
+    Cut a torn final line (crash mid-write) off the journal, so the next
+    record starts on a line of its own instead of being glued onto the
+    unparseable fragment and lost on replay. Returns the bytes removed.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return 0
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            chunk = f.read(end - start)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        if end == size:
+            return 0
+        f.truncate(end)
+        f.flush()
+        os.fsync(f.fileno())
+    return size - end
+
+
+class SweepJournal:
+    """Append-only, fsync-per-event JSONL journal (safe to share between threads)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        truncate_torn_tail(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def record(self, event, **fields):
+        line = json.dumps({"event": event, "t": time.time(), **fields})
+        # One whole line per event: writers in pipeline worker threads and on
+        # the event loop must not interleave
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def run(self, run_stamp, config):
+        self.record("run", run_stamp=run_stamp, config=config)
+
+    def submitted(self, job_id, keys, layout=None, **meta):
+        self.record("submitted", job_id=job_id, keys=[list(k) for k in keys],
+                    layout=layout, **meta)
+
+    def completed(self, key, entry):
+        self.record("completed", key=list(key), entry=entry)
+
+    def finished(self, evidence_path):
+        self.record("finished", evidence=str(evidence_path))
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class JournalState:
+    """Replayed view of a journal"""
+
+    def __init__(self):
+        self.run_stamp = None
+        self.config = {}
+        self.completed = {}
+        self.submissions = []
+        self.finished = None
+
+    def pending_jobs(self):
+        """
+        Submitted jobs that still owe at least one configuration.
+
+        Returns [{"job_id", "keys", "layout", ...}] with `keys` reduced to the
+        configurations not yet completed.
+        """
+        pending = []
+        for submission in self.submissions:
+            owed = [k for k in submission["keys"] if k not in self.completed]
+            if owed:
+                pending.append(dict(submission, keys=owed))
+        return pending
+
+    def pending_keys(self):
+        return {k for submission in self.pending_jobs() for k in submission["keys"]}
+
+
+def load_journal(path):
+    """Replay a journal; a torn final line (crash mid-write) is ignored"""
+    state = JournalState()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            kind = event.get("event")
+            if kind == "run":
+                state.run_stamp = event["run_stamp"]
+                state.config = event.get("config", {})
+            elif kind == "submitted":
+                event["keys"] = [_as_key(k) for k in event["keys"]]
+                state.submissions.append(event)
+            elif kind == "completed":
+                state.completed[_as_key(event["key"])] = event["entry"]
+            elif kind == "finished":
+                state.finished = event["evidence"]
+    return state
+
+
+def latest_journal(directory, pattern="aeterna_porta_sweep_*.journal.jsonl"):
+    """Most recently modified journal in `directory` (None if there is none)"""
+    journals = sorted(Path(directory).glob(pattern), key=lambda p: p.stat().st_mtime)
+    return journals[-1] if journals else None
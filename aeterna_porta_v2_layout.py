@@ -0,0 +1,430 @@
+"""
+AETERNA-PORTA v2.1 — PHYSICAL LAYOUT PLANNER
+Framework: dna::}{::lang v51.843
+
+Plans one physical embedding of the partition for a backend calibration,
+so every template and control is compiled onto the same qubits with no
+layout search and (for the grid) no routing SWAPs:
+
+    plan = plan_for(backend, partition)      # LayoutIndex lookup, else plan + store
+    transpile(qc, target=backend.target, initial_layout=plan.layout)
+
+The interaction graph comes from the partition: the (ℓ, L + ℓ) TFD pairs
+and the guard → ancilla Zeno couplings. Its components are short paths
+(R – guard – ancilla, L – R, lone ancillas), each embedded on adjacent
+physical qubits:
+
+1. Throat: the components touching the Floquet throat go first, into the
+   connected region of the coupling map with the lowest readout + 1q error
+   (grown greedily from every seed qubit, cheapest region wins)
+2. The other guard chains, cheapest embedding first
+   (qubit cost = readout + sx error, edge cost = 2q gate error)
+3. The remaining TFD pairs on the cheapest edges of a maximum-cardinality
+   matching of the free qubits (rustworkx), so greedy choices cannot strand
+   a pair while adjacent free qubits remain
+4. Lone ancillas on the cheapest qubits left
+
+A component that cannot be embedded on adjacent qubits is placed next to
+its neighbours and counted in `plan.routed_edges` (it then needs SWAPs).
+
+Plans are stored in ~/.osiris/layouts/layout_index.json per backend and
+partition, keyed by the calibration fingerprint of the transpile cache;
+a recalibration drops the backend's plans. Backends without a coupling
+map (the local simulator) get no plan.
+"""
+import json
+import os
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+import rustworkx
+
+from aeterna_porta_v2_transpile_cache import backend_fingerprint
+
+DEFAULT_LAYOUT_INDEX = Path.home() / ".osiris" / "layouts" / "layout_index.json"
+ROUTED_EDGE_PENALTY = 1.0  # Cost of a non-adjacent interaction edge (errors are ≪ 1)
+MATCHING_SCALE = 10**6  # Integer weight resolution of the pair matching
+
+# ═══════════════════════════════════════════════════════════════════
+# GRAPHS
+# ═══════════════════════════════════════════════════════════════════
+
+def _error(target, name, qargs):
+    try:
+        props = target[name].get(qargs)
+    except KeyError:
+        return None
+    return getattr(props, "error", None)
+
+
+def device_graph(backend):
+    """
+    (adjacency {q: set}, qubit cost [q], edge cost {(a, b): cost} with a < b)
+    from the backend target; None when the target has no coupling map.
+    """
+    target = backend.target
+    coupling = target.build_coupling_map()
+    if coupling is None:
+        return None
+
+    qubit_cost = []
+    for q in range(target.num_qubits):
+        single = _error(target, "sx", (q,))
+        if single is None:
+            single = _error(target, "x", (q,))
+        qubit_cost.append((_error(target, "measure", (q,)) or 0.0) + (single or 0.0))
+
+    two_qubit = [name for name in target.operation_names
+                 if getattr(target.operation_from_name(name), "num_qubits", 0) == 2]
+    adjacency = {q: set() for q in range(target.num_qubits)}
+    edge_cost = {}
+    for a, b in coupling.get_edges():
+        key = (min(a, b), max(a, b))
+        errors = [e for name in two_qubit for e in (_error(target, name, (a, b)),) if e is not None]
+        cost = min(errors) if errors else 0.0
+        edge_cost[key] = min(cost, edge_cost.get(key, cost))
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    return adjacency, qubit_cost, edge_cost
+
+
+def interaction_edges(partition):
+    """Logical two-qubit couplings: TFD pairs and guard → ancilla Zeno couplings"""
+    edges = set(partition.bridge_pairs())
+    edges.update((g, partition.ancilla(i)) for i, g in enumerate(partition.guard_qubits()))
+    return sorted(edges)
+
+
+def circuit_interactions(circuit):
+    """Logical qubit pairs acted on by the two-qubit gates of `circuit`"""
+    edges = set()
+    for inst in circuit.data:
+        if len(inst.qubits) != 2 or inst.operation.name == "barrier":
+            continue
+        a, b = (circuit.find_bit(q).index for q in inst.qubits)
+        edges.add((min(a, b), max(a, b)))
+    return sorted(edges)
+
+
+def components(num_qubits, edges):
+    """Connected components of the interaction graph ({logical: set of neighbours} each)"""
+    neighbours = {q: set() for q in range(num_qubits)}
+    for a, b in edges:
+        neighbours[a].add(b)
+        neighbours[b].add(a)
+    seen, result = set(), []
+    for start in range(num_qubits):
+        if start in seen:
+            continue
+        seen.add(start)
+        members, queue = {}, deque([start])
+        while queue:
+            q = queue.popleft()
+            members[q] = neighbours[q]
+            for n in neighbours[q] - seen:
+                seen.add(n)
+                queue.append(n)
+        result.append(members)
+    return result
+
+
+def distances_from(adjacency, sources, allowed=None):
+    """BFS hop count from the nearest source (restricted to `allowed` when given)"""
+    dist = {q: 0 for q in sources}
+    queue = deque(sources)
+    while queue:
+        q = queue.popleft()
+        for n in adjacency[q]:
+            if n not in dist and (allowed is None or n in allowed):
+                dist[n] = dist[q] + 1
+                queue.append(n)
+    return dist
+
+# ═══════════════════════════════════════════════════════════════════
+# PLANNER
+# ═══════════════════════════════════════════════════════════════════
+
+class LayoutPlan:
+    """Physical qubit of every logical qubit, plus how well the embedding fits"""
+
+    def __init__(self, layout, throat, routed_edges, interaction_edges, error_cost,
+                 backend=None, calibration=None, partition=None):
+        self.layout = list(layout)
+        self.throat = list(throat)
+        self.routed_edges = int(routed_edges)
+        self.interaction_edges = int(interaction_edges)
+        self.error_cost = float(error_cost)
+        self.backend = backend
+        self.calibration = calibration
+        self.partition = partition
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["layout"], data["throat"], data["routed_edges"], data["interaction_edges"],
+                   data["error_cost"], data.get("backend"), data.get("calibration"),
+                   data.get("partition"))
+
+    def to_dict(self):
+        return {
+            "backend": self.backend,
+            "calibration": self.calibration,
+            "partition": self.partition,
+            "layout": self.layout,
+            "throat": self.throat,
+            "routed_edges": self.routed_edges,
+            "interaction_edges": self.interaction_edges,
+            "error_cost": self.error_cost,
+        }
+
+    def summary(self):
+        """Evidence block (without the full layout)"""
+        return {
+            "backend": self.backend,
+            "throat": self.throat,
+            "adjacent_edges": self.interaction_edges - self.routed_edges,
+            "interaction_edges": self.interaction_edges,
+            "error_cost": self.error_cost,
+        }
+
+
+class _Embedder:
+    """Greedy component embedding on one device graph"""
+
+    def __init__(self, adjacency, qubit_cost, edge_cost, qubits=None):
+        self.adjacency = adjacency
+        self.qubit_cost = qubit_cost
+        self.edge_cost = edge_cost
+        self.free = set(adjacency if qubits is None else qubits)
+        self.placement = {}
+
+    def edge(self, a, b):
+        return self.edge_cost.get((min(a, b), max(a, b)), ROUTED_EDGE_PENALTY)
+
+    def throat_region(self, size):
+        """Cheapest connected region of `size` qubits (greedy growth from every seed)"""
+        best, best_cost = None, None
+        for seed in sorted(self.free):
+            region, cost = {seed}, self.qubit_cost[seed]
+            while len(region) < size:
+                frontier = {n for q in region for n in self.adjacency[q]
+                            if n in self.free and n not in region}
+                if not frontier:
+                    break
+                step = {
+                    n: self.qubit_cost[n] + min(self.edge(n, q) for q in self.adjacency[n] & region)
+                    for n in frontier
+                }
+                n = min(step, key=lambda q: (step[q], q))
+                region.add(n)
+                cost += step[n]
+            if len(region) == size and (best_cost is None or cost < best_cost):
+                best, best_cost = region, cost
+        return best
+
+    def _grow(self, component, root, root_phys, allowed):
+        """Place `component` from `root` at `root_phys` → (cost, routed, {logical: physical})"""
+        mapping, used = {root: root_phys}, {root_phys}
+        cost, routed = self.qubit_cost[root_phys], 0
+        queue = deque([root])
+        while queue:
+            logical = queue.popleft()
+            phys = mapping[logical]
+            for child in sorted(component[logical]):
+                if child in mapping:
+                    continue
+                options = [n for n in self.adjacency[phys]
+                           if n in self.free and n not in used and n in allowed]
+                if options:
+                    target = min(options, key=lambda n: (self.qubit_cost[n] + self.edge(phys, n), n))
+                    cost += self.edge(phys, target)
+                else:
+                    dist = distances_from(self.adjacency, [phys])
+                    candidates = [n for n in self.free if n not in used and n in dist]
+                    if not candidates:
+                        candidates = [n for n in self.free if n not in used]
+                    target = min(candidates, key=lambda n: (dist.get(n, len(dist)), self.qubit_cost[n], n))
+                    cost += ROUTED_EDGE_PENALTY
+                    routed += 1
+                cost += self.qubit_cost[target]
+                mapping[child] = target
+                used.add(target)
+                queue.append(child)
+        return cost, routed, mapping
+
+    def _best(self, component, allowed):
+        """(routed, cost, mapping) of the cheapest placement rooted inside `allowed`"""
+        root = max(component, key=lambda q: (len(component[q]), -q))
+        best = None
+        for root_phys in sorted(allowed):
+            cost, routed, mapping = self._grow(component, root, root_phys, allowed)
+            if best is None or (routed, cost) < best[:2]:
+                best = (routed, cost, mapping)
+        return best
+
+    def embed(self, component, region=None):
+        """
+        Place one component (cheapest over every root qubit); returns its
+        routed edge count. With a `region`, placement stays inside it, and the
+        region grows by one hop at a time until the component fits on
+        adjacent qubits (or covers the device).
+        """
+        allowed = set(self.free) if region is None else set(region) & self.free
+        while True:
+            best = self._best(component, allowed) if allowed else None
+            if best is not None and best[0] == 0:
+                break
+            grown = allowed | {n for q in allowed for n in self.adjacency[q] if n in self.free}
+            if not allowed:
+                grown = set(self.free)
+            if grown == allowed:
+                break
+            allowed = grown
+        routed, _, mapping = best
+        self.place(mapping)
+        return routed
+
+    def place(self, mapping):
+        self.placement.update(mapping)
+        self.free.difference_update(mapping.values())
+
+    def match_pairs(self, pairs):
+        """
+        Put two-qubit components on the cheapest edges of a maximum-cardinality
+        matching of the free qubits; returns the pairs that did not fit.
+        """
+        nodes = sorted(self.free)
+        index = {q: i for i, q in enumerate(nodes)}
+        graph = rustworkx.PyGraph()
+        graph.add_nodes_from(nodes)
+        costs = {}
+        for (a, b), edge in self.edge_cost.items():
+            if a in index and b in index:
+                costs[(a, b)] = edge + self.qubit_cost[a] + self.qubit_cost[b]
+                weight = round((3 * ROUTED_EDGE_PENALTY - costs[(a, b)]) * MATCHING_SCALE)
+                graph.add_edge(index[a], index[b], max(weight, 1))
+        matching = rustworkx.max_weight_matching(graph, max_cardinality=True, weight_fn=int)
+        edges = sorted((tuple(sorted((nodes[i], nodes[j]))) for i, j in matching),
+                       key=lambda e: (costs[e], e))
+        for component, (a, b) in zip(pairs, edges):
+            first, second = sorted(component)
+            self.place({first: a, second: b})
+        return pairs[len(edges):]
+
+
+def plan_layout(backend, partition, edges=None, qubits=None):
+    """
+    Plan a physical layout of `partition` on `backend` (None without a
+    coupling map). `edges` overrides the partition's interaction graph (e.g.
+    circuit_interactions of a permuted control); `qubits` restricts the plan
+    to those physical qubits.
+    """
+    graph = device_graph(backend)
+    if graph is None:
+        return None
+    adjacency, qubit_cost, edge_cost = graph
+    available = len(adjacency) if qubits is None else len(set(qubits))
+    if partition.total > available:
+        raise ValueError(f"{partition.total} qubits do not fit on {backend.name} ({available})")
+
+    edges = interaction_edges(partition) if edges is None else sorted(edges)
+    parts = components(partition.total, edges)
+    throat = set(partition.throat())
+    throat_parts = [c for c in parts if throat & set(c)]
+    other_parts = [c for c in parts if not throat & set(c)]
+    other_parts.sort(key=lambda c: (-len(c), min(c)))
+
+    embedder = _Embedder(adjacency, qubit_cost, edge_cost, qubits)
+    routed = 0
+    region = embedder.throat_region(sum(len(c) for c in throat_parts)) if throat_parts else None
+    for component in sorted(throat_parts, key=lambda c: (-len(c), min(c))):
+        routed += embedder.embed(component, region=region)
+    # Longer chains greedily, then the TFD pairs by matching, then lone qubits
+    for component in other_parts:
+        if len(component) > 2:
+            routed += embedder.embed(component)
+    pairs = [component for component in other_parts if len(component) == 2]
+    for component in embedder.match_pairs(pairs):
+        routed += embedder.embed(component)
+    for component in other_parts:
+        if len(component) == 1:
+            routed += embedder.embed(component)
+
+    layout = [embedder.placement[q] for q in range(partition.total)]
+    error_cost = sum(qubit_cost[p] for p in layout) + sum(
+        edge_cost.get((min(layout[a], layout[b]), max(layout[a], layout[b])), 0.0) for a, b in edges
+    )
+    return LayoutPlan(
+        layout, [layout[q] for q in sorted(throat)], routed, len(edges), error_cost,
+        backend=backend.name, partition=partition.to_dict(),
+    )
+
+# ═══════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════
+
+def partition_key(partition, variant=None):
+    key = f"{partition.l_qubits}|{partition.r_qubits}|{partition.anc_qubits}"
+    return f"{key}/{variant}" if variant else key
+
+
+class LayoutIndex:
+    """
+    Planned layouts per backend calibration (one JSON file):
+
+    {backend: {"calibration", "plans": {"L|R|Anc" or "L|R|Anc/variant": plan}}}
+    """
+
+    def __init__(self, path=DEFAULT_LAYOUT_INDEX):
+        self.path = Path(path)
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.data, indent=2))
+        os.replace(tmp, self.path)
+
+    def lookup(self, backend, partition, calibration=None, variant=None):
+        """Stored plan for this calibration of `backend` (None if absent or stale)"""
+        entry = self.data.get(backend.name)
+        calibration = calibration or backend_fingerprint(backend)
+        if entry is None or entry.get("calibration") != calibration:
+            return None
+        plan = entry["plans"].get(partition_key(partition, variant))
+        return LayoutPlan.from_dict(plan) if plan is not None else None
+
+    def save(self, backend, partition, plan, calibration=None, variant=None):
+        calibration = calibration or backend_fingerprint(backend)
+        entry = self.data.get(backend.name)
+        if entry is None or entry.get("calibration") != calibration:
+            # New calibration: plans for the old one no longer apply
+            entry = self.data[backend.name] = {"calibration": calibration, "plans": {}}
+        plan.calibration = calibration
+        entry["plans"][partition_key(partition, variant)] = {
+            **plan.to_dict(), "planned_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._save()
+
+
+def plan_for(backend, partition, index=None, variant=None, edges=None, qubits=None):
+    """
+    Stored plan for the backend's current calibration, else a new plan
+    (stored). A `variant` (e.g. a control with its own `edges`) is stored
+    beside the partition's main plan.
+    """
+    if backend.target.build_coupling_map() is None:
+        return None
+    index = index or LayoutIndex()
+    calibration = backend_fingerprint(backend)
+    plan = index.lookup(backend, partition, calibration, variant)
+    if plan is None:
+        plan = plan_layout(backend, partition, edges, qubits)
+        index.save(backend, partition, plan, calibration, variant)
+    return plan
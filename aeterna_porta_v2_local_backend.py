@@ -0,0 +1,374 @@
+"""
+AETERNA-PORTA v2.1 — OFFLINE LOCAL SIMULATION BACKEND
+Framework: dna::}{::lang v51.843
+
+A network-free stand-in for the IBM backends, so full 120/130-qubit dress
+rehearsals of the sweep, the C0/C1/C2 controls and the Nighthawk circuit run
+on a CI box. Each circuit is simulated with a method chosen from its structure:
+
+- factorized            circuits that split into small independent factors
+                        (exact per-factor distributions, NumPy sampling;
+                        see aeterna_porta_v2_factorized)
+- stabilizer            Clifford-only circuits (any width)
+- statevector           small circuits (≤ STATEVECTOR_MAX_QUBITS)
+- matrix_product_state  everything else, e.g. low-entanglement TFD + throat
+                        variants whose factors are too large to enumerate
+
+Mid-circuit measure/reset and `if_test` blocks are supported by all four.
+
+For MPS the qubits are first relabelled along the circuit's interaction graph
+so coupled qubits (ℓ, L+ℓ) and guard/ancilla pairs sit next to each other in
+the chain. In the natural order every ER-bridge pair crosses the L|R cut and
+the bond dimension grows as 2^L; in interaction order it stays tiny.
+
+`LocalBackend` is a BackendV2 (so transpile(target=backend.target) and the
+transpile cache treat it like any other backend) with its own SamplerV2-shaped
+front end whose jobs expose job_id/status/result/in_final_state/cancel (and
+IBM-style metrics() timestamps), so make_sampler/submit_batched/run_pipeline/
+run_sharded and the telemetry work unchanged.
+
+For offline tests of multi-backend scheduling, `queue_delay` holds every job
+in the (serial) queue for that many seconds before it starts, and status()
+reports the number of queued + running jobs as `pending_jobs`, like an IBM
+backend's status().
+"""
+import itertools
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+from qiskit.circuit import ControlFlowOp, IfElseOp
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.primitives import PrimitiveResult
+from qiskit.primitives.containers import BitArray, DataBin, SamplerPubResult
+from qiskit.primitives.containers.sampler_pub import SamplerPub
+from qiskit.providers import BackendV2, Options
+from qiskit.transpiler import Target
+from qiskit_aer.primitives import SamplerV2 as AerSamplerV2
+
+from aeterna_porta_v2_factorized import FactorizedDistribution, is_factorizable
+from aeterna_porta_v2_parallel_compile import deterministic_seed
+
+# Native instruction set of the local target (all supported by every method)
+LOCAL_BASIS = ["h", "x", "y", "z", "s", "sdg", "sx", "rx", "ry", "rz", "cx", "cz",
+               "measure", "reset", "delay"]
+
+CLIFFORD_GATES = {"id", "h", "x", "y", "z", "s", "sdg", "sx", "sxdg", "cx", "cy", "cz",
+                  "swap", "ecr"}
+NON_UNITARY = {"measure", "reset", "barrier", "delay"}
+
+STATEVECTOR_MAX_QUBITS = 24
+DEFAULT_NUM_QUBITS = 156
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def build_local_target(num_qubits):
+    """All-to-all Target over LOCAL_BASIS plus if_else (no coupling constraints)"""
+    target = Target(num_qubits=num_qubits, description="aeterna-porta local simulator")
+    gates = get_standard_gate_name_mapping()
+    for name in LOCAL_BASIS:
+        target.add_instruction(gates[name])
+    target.add_instruction(IfElseOp, name="if_else")
+    return target
+
+# ═══════════════════════════════════════════════════════════════════
+# METHOD SELECTION
+# ═══════════════════════════════════════════════════════════════════
+
+def iter_instructions(circuit):
+    """Every instruction, descending into control-flow blocks"""
+    for instruction in circuit.data:
+        if isinstance(instruction.operation, ControlFlowOp):
+            for block in instruction.operation.blocks:
+                yield from iter_instructions(block)
+        else:
+            yield instruction
+
+
+def is_clifford(circuit):
+    return all(
+        inst.operation.name in CLIFFORD_GATES or inst.operation.name in NON_UNITARY
+        for inst in iter_instructions(circuit)
+    )
+
+
+def select_method(circuit):
+    """Simulation method for `circuit` (see module docstring)"""
+    if is_factorizable(circuit):
+        return "factorized"
+    if is_clifford(circuit):
+        return "stabilizer"
+    if circuit.num_qubits <= STATEVECTOR_MAX_QUBITS:
+        return "statevector"
+    return "matrix_product_state"
+
+# ═══════════════════════════════════════════════════════════════════
+# MPS QUBIT ORDERING
+# ═══════════════════════════════════════════════════════════════════
+
+def interaction_order(circuit):
+    """
+    Qubit order that keeps interacting qubits adjacent: a depth-first walk of
+    the two-qubit interaction graph (control-flow blocks included), lowest
+    index first. Returns [old index, ...] in chain order.
+    """
+    neighbours = defaultdict(set)
+
+    def visit(block, qubit_map):
+        for inst in block.data:
+            qubits = [qubit_map[q] for q in inst.qubits]
+            if isinstance(inst.operation, ControlFlowOp):
+                for inner in inst.operation.blocks:
+                    visit(inner, dict(zip(inner.qubits, qubits)))
+            elif len(qubits) == 2 and inst.operation.name != "barrier":
+                a, b = qubits
+                neighbours[a].add(b)
+                neighbours[b].add(a)
+
+    visit(circuit, {q: i for i, q in enumerate(circuit.qubits)})
+
+    order = []
+    seen = set()
+    for root in range(circuit.num_qubits):
+        stack = [root]
+        while stack:
+            q = stack.pop()
+            if q in seen:
+                continue
+            seen.add(q)
+            order.append(q)
+            stack.extend(sorted(neighbours[q] - seen, reverse=True))
+    return order
+
+
+def chain_ordered(circuit):
+    """
+    Copy of `circuit` with qubits relabelled into interaction order.
+    Classical bits are untouched, so sampled registers are unchanged.
+    """
+    order = interaction_order(circuit)
+    if order == list(range(circuit.num_qubits)):
+        return circuit
+    position = {old: new for new, old in enumerate(order)}
+    relabelled = circuit.copy_empty_like()
+    relabelled.compose(
+        circuit, qubits=[position[i] for i in range(circuit.num_qubits)], inplace=True
+    )
+    return relabelled
+
+def _sample_factorized_pub(pub, rng):
+    """SamplerPubResult for one PUB via the exact factorized sampler"""
+    bound = pub.parameter_values.bind_all(pub.circuit)
+    shape = pub.shape
+    registers = {creg.name: [] for creg in pub.circuit.cregs}
+    for index in np.ndindex(shape):
+        sampled = FactorizedDistribution(bound[index]).sample(pub.shots, rng)
+        for name, bits in sampled.items():
+            registers[name].append(bits.array)
+
+    data = {}
+    for creg in pub.circuit.cregs:
+        arrays = np.stack(registers[creg.name]).reshape(shape + (pub.shots, -1))
+        data[creg.name] = BitArray(arrays, creg.size)
+    return SamplerPubResult(
+        DataBin(**data, shape=shape),
+        metadata={"shots": pub.shots, "circuit_metadata": pub.circuit.metadata},
+    )
+
+# ═══════════════════════════════════════════════════════════════════
+# BACKEND / SAMPLER / JOB
+# ═══════════════════════════════════════════════════════════════════
+
+class LocalJob:
+    """Runtime-job look-alike wrapping a simulation future"""
+
+    def __init__(self, future, job_id, timestamps):
+        self._future = future
+        self._job_id = job_id
+        self._timestamps = timestamps
+
+    def job_id(self):
+        return self._job_id
+
+    def status(self):
+        if self._future.cancelled():
+            return "CANCELLED"
+        if self._future.running():
+            return "RUNNING"
+        if not self._future.done():
+            return "QUEUED"
+        return "ERROR" if self._future.exception() is not None else "DONE"
+
+    def in_final_state(self):
+        return self._future.done()
+
+    def done(self):
+        return self._future.done()
+
+    def result(self, timeout=None):
+        try:
+            return self._future.result(timeout)
+        except CancelledError:
+            raise RuntimeError(f"Job {self._job_id} was cancelled") from None
+
+    def cancel(self):
+        """Cancel a job that has not started simulating yet"""
+        return self._future.cancel()
+
+    def metrics(self):
+        """Same shape as RuntimeJobV2.metrics(): created/running/finished timestamps"""
+        stamps = dict(self._timestamps)
+        usage = {}
+        if "running" in stamps and "finished" in stamps:
+            usage["seconds"] = (datetime.fromisoformat(stamps["finished"])
+                                - datetime.fromisoformat(stamps["running"])).total_seconds()
+        return {"timestamps": stamps, "usage": usage}
+
+
+class LocalBackendStatus:
+    """The BackendStatus fields the fan-out scheduler reads"""
+
+    def __init__(self, backend_name, pending_jobs, operational=True):
+        self.backend_name = backend_name
+        self.pending_jobs = pending_jobs
+        self.operational = operational
+        self.status_msg = "active" if operational else "offline"
+
+
+class LocalSampler:
+    """SamplerV2-compatible front end of a LocalBackend"""
+
+    def __init__(self, backend, default_shots=1024):
+        self.backend = backend
+        self.default_shots = default_shots
+
+    def run(self, pubs, *, shots=None):
+        coerced = [SamplerPub.coerce(pub, shots or self.default_shots) for pub in pubs]
+        return self.backend.submit(coerced)
+
+
+class LocalBackend(BackendV2):
+    """
+    Offline simulator backend for the sweep.
+
+    Jobs run in a small thread pool (`max_parallel_jobs`); Aer parallelises
+    each simulation internally. With `seed` set, job n is simulated with
+    deterministic_seed(("local", n), seed), so a run is reproducible while
+    shards of the same circuit still draw independent shots. `queue_delay`
+    (seconds) simulates a device queue ahead of every job.
+    """
+
+    local = True
+
+    def __init__(self, num_qubits=DEFAULT_NUM_QUBITS, name="aer_local", seed=None,
+                 max_parallel_jobs=1, queue_delay=0.0):
+        super().__init__(name=name, description="AETERNA-PORTA offline simulator")
+        self._target = build_local_target(num_qubits)
+        self.seed = seed
+        self.queue_delay = queue_delay
+        self._pool = ThreadPoolExecutor(max_workers=max_parallel_jobs,
+                                        thread_name_prefix="aer-local")
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def target(self):
+        return self._target
+
+    @property
+    def max_circuits(self):
+        return None
+
+    @classmethod
+    def _default_options(cls):
+        return Options(shots=1024)
+
+    def run(self, run_input, **options):
+        """BackendV2 entry point: sample circuit(s) as PUBs without parameters"""
+        circuits = run_input if isinstance(run_input, (list, tuple)) else [run_input]
+        return self.sampler(options.get("shots", self.options.shots)).run(circuits)
+
+    def sampler(self, default_shots=1024):
+        return LocalSampler(self, default_shots)
+
+    def submit(self, pubs):
+        """Queue coerced SamplerPubs; returns a LocalJob"""
+        with self._lock:
+            n = next(self._counter)
+        seed = deterministic_seed(("local", n), self.seed) if self.seed is not None else None
+        job_id = f"local-{uuid.uuid4().hex[:12]}"
+        timestamps = {"created": _now()}
+        with self._lock:
+            self._pending += 1
+        future = self._pool.submit(self._simulate, pubs, seed, job_id, timestamps)
+        future.add_done_callback(self._job_done)
+        return LocalJob(future, job_id, timestamps)
+
+    def _job_done(self, future):
+        with self._lock:
+            self._pending -= 1
+
+    def status(self):
+        """Queued + running jobs, in the shape of an IBM backend's status()"""
+        with self._lock:
+            return LocalBackendStatus(self.name, self._pending)
+
+    def _simulate(self, pubs, seed, job_id, timestamps):
+        if self.queue_delay:
+            time.sleep(self.queue_delay)
+        timestamps["running"] = _now()
+        try:
+            return self._simulate_pubs(pubs, seed, job_id)
+        finally:
+            timestamps["finished"] = _now()
+
+    def _simulate_pubs(self, pubs, seed, job_id):
+        # Group PUBs per method: one Aer primitive call each, results reassembled in order
+        groups = defaultdict(list)
+        for i, pub in enumerate(pubs):
+            groups[select_method(pub.circuit)].append(i)
+
+        pub_results = [None] * len(pubs)
+        for method, indices in groups.items():
+            if method == "factorized":
+                rng = np.random.default_rng(seed)
+                for i in indices:
+                    pub_results[i] = _sample_factorized_pub(pubs[i], rng)
+                continue
+
+            backend_options = {"method": method}
+            if seed is not None:
+                backend_options["seed_simulator"] = seed
+            sampler = AerSamplerV2(options={"backend_options": backend_options})
+
+            group = []
+            for i in indices:
+                circuit = pubs[i].circuit
+                if method == "matrix_product_state":
+                    circuit = chain_ordered(circuit)
+                group.append(SamplerPub(circuit, pubs[i].parameter_values, pubs[i].shots))
+
+            for i, pub_result in zip(indices, sampler.run(group).result()):
+                pub_results[i] = pub_result
+
+        return PrimitiveResult(
+            pub_results,
+            metadata={"backend": self.name, "job_id": job_id,
+                      "methods": {method: len(ix) for method, ix in groups.items()}},
+        )
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def is_local(backend):
+    """True for LocalBackend (and anything else flagged `local`)"""
+    return getattr(backend, "local", False)
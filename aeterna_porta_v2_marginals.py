@@ -0,0 +1,218 @@
+"""
+AETERNA-PORTA v2.1 — REGIONAL MARGINAL ENGINE
+Framework: dna::}{::lang v51.843
+
+Marginal outcome distributions of one run's shots over sub-registers (L, R,
+the Floquet throat, the Zeno guards, the ancillas, or any list of bits), and
+the L ↔ R bridge statistics built on them:
+
+    engine = MarginalEngine.from_bits(bits, partition)
+    engine.marginal("throat")                 # (rows, counts), cached
+    engine.mutual_information("L", "R")       # I(L:R) in bits
+    engine.parity_correlator("L", "R")        # ⟨P_L P_R⟩ − ⟨P_L⟩⟨P_R⟩
+    engine.summary()                          # evidence block
+
+The shot array is reduced to its outcome histogram once; marginals are then
+built on the distinct rows with their counts as weights, so the cost scales
+with the support rather than the shot count. Register bits are gathered
+straight from the packed rows with a (byte column, shift) mask per bit — all
+requested regions in one fancy-index pass — and re-packed in BitArray
+layout, so the observable engine's histogram functions apply unchanged.
+
+Marginals are cached per register set on the engine (one engine per run),
+so every observable on the same region reuses the same histogram.
+
+Entropies and I(L:R) are plug-in estimates: for regions whose support
+approaches the shot count they saturate near log₂(shots).
+NumPy only, like the observable engine.
+"""
+import numpy as np
+
+from aeterna_porta_v2_observables import (
+    observables_from_histogram,
+    outcome_histogram,
+    phi_from_histogram,
+    popcount_rows,
+)
+from aeterna_porta_v2_partition import register_width
+
+SUMMARY_PAIRS = (("L", "R"),)  # Region pairs reported in summary()
+
+# ═══════════════════════════════════════════════════════════════════
+# BIT GATHER / PACK
+# ═══════════════════════════════════════════════════════════════════
+
+def bit_masks(bit_indices, n_bytes):
+    """(byte column, shift) of each register bit in a packed row (bit 0 = LSB of the last byte)"""
+    indices = np.asarray(bit_indices, dtype=np.int64)
+    return n_bytes - 1 - indices // 8, (indices % 8).astype(np.uint8)
+
+
+def gather_bits(rows, bit_indices):
+    """(n_rows, k) uint8 values of the selected register bits of packed rows"""
+    columns, shifts = bit_masks(bit_indices, rows.shape[1])
+    return (rows[:, columns] >> shifts) & 1
+
+
+def pack_bits(columns):
+    """(n, k) 0/1 columns (column i = bit i) → packed rows in BitArray layout"""
+    k = columns.shape[1]
+    padded = np.zeros((columns.shape[0], -(-k // 8) * 8), dtype=np.uint8)
+    padded[:, padded.shape[1] - k:] = columns[:, ::-1]
+    return np.packbits(padded, axis=1)
+
+
+def weighted_histogram(rows, weights):
+    """Merge identical packed rows, summing their weights → (rows, counts)"""
+    if rows.shape[1] == 0:
+        return rows[:1], np.array([weights.sum()], dtype=np.int64)
+    keys = np.ascontiguousarray(rows).view(np.dtype((np.void, rows.shape[1]))).ravel()
+    unique, inverse = np.unique(keys, return_inverse=True)
+    counts = np.zeros(len(unique), dtype=np.int64)
+    np.add.at(counts, inverse.ravel(), weights)
+    return unique.view(np.uint8).reshape(len(unique), rows.shape[1]), counts
+
+
+def entropy_bits(counts):
+    """Shannon entropy (bits) of a count histogram"""
+    counts = counts[counts > 0]
+    probs = counts / counts.sum()
+    return float(-np.sum(probs * np.log2(probs)))
+
+# ═══════════════════════════════════════════════════════════════════
+# ENGINE
+# ═══════════════════════════════════════════════════════════════════
+
+class MarginalEngine:
+    """Cached marginal histograms of one run's outcome histogram"""
+
+    def __init__(self, rows, counts, num_qubits, num_bits=None):
+        self.rows = rows
+        self.counts = counts
+        self.num_qubits = num_qubits
+        self.num_bits = num_bits or register_width(num_qubits)
+        self.shots = int(counts.sum())
+        regions = num_qubits.regions() if hasattr(num_qubits, "regions") else {}
+        self.regions = {name: tuple(bits) for name, bits in regions.items()}
+        self._marginals = {}
+
+    @classmethod
+    def from_bits(cls, bits, num_qubits):
+        """Engine over a BitArray / packed shot array (histogrammed once)"""
+        rows, counts = outcome_histogram(bits)
+        return cls(rows, counts, num_qubits, getattr(bits, "num_bits", None))
+
+    @classmethod
+    def from_accumulator(cls, accumulator):
+        """Engine over an ObservableAccumulator's merged histogram"""
+        rows, counts = accumulator.histogram_arrays()
+        return cls(rows, counts, accumulator.num_qubits, accumulator.num_bits)
+
+    def register_bits(self, region):
+        """Bit indices of a region name or an iterable of bits"""
+        if isinstance(region, str):
+            if region not in self.regions:
+                raise KeyError(f"Unknown region {region!r} (known: {', '.join(self.regions)})")
+            return self.regions[region]
+        bits = tuple(int(b) for b in region)
+        if any(not 0 <= b < self.num_bits for b in bits):
+            raise ValueError(f"Register bits outside 0..{self.num_bits - 1}: {bits}")
+        return bits
+
+    def marginals(self, *regions):
+        """(rows, counts) per region; uncached regions are gathered in one pass"""
+        keys = [self.register_bits(region) for region in regions]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._marginals]
+        if missing:
+            columns = gather_bits(self.rows, [bit for key in missing for bit in key])
+            start = 0
+            for key in missing:
+                part = columns[:, start:start + len(key)]
+                start += len(key)
+                self._marginals[key] = weighted_histogram(pack_bits(part), self.counts)
+        return [self._marginals[key] for key in keys]
+
+    def marginal(self, region):
+        return self.marginals(region)[0]
+
+    def _union(self, a, b):
+        bits_a = self.register_bits(a)
+        return bits_a + tuple(bit for bit in self.register_bits(b) if bit not in set(bits_a))
+
+    def _symmetric_difference(self, a, b):
+        return tuple(sorted(set(self.register_bits(a)) ^ set(self.register_bits(b))))
+
+    # ── observables on marginals ──
+
+    def entropy(self, region):
+        """H(region) in bits"""
+        return entropy_bits(self.marginal(region)[1])
+
+    def phi(self, region):
+        """Φ̂ of the region's marginal distribution"""
+        return phi_from_histogram(self.marginal(region)[1])
+
+    def parity(self, region):
+        """⟨(−1)^|x|⟩ over the region's bits"""
+        rows, counts = self.marginal(region)
+        signs = 1 - 2 * (popcount_rows(rows) % 2)
+        return float(signs @ counts / self.shots)
+
+    def mutual_information(self, a, b):
+        """I(a:b) = H(a) + H(b) − H(a ∪ b) in bits"""
+        (_, counts_a), (_, counts_b), (_, counts_ab) = self.marginals(a, b, self._union(a, b))
+        return max(0.0, entropy_bits(counts_a) + entropy_bits(counts_b) - entropy_bits(counts_ab))
+
+    def parity_correlator(self, a, b):
+        """⟨P_a P_b⟩ − ⟨P_a⟩⟨P_b⟩ with P = (−1)^|x| (P_a P_b is the parity of a △ b)"""
+        self.marginals(a, b, self._symmetric_difference(a, b))
+        return self.parity(self._symmetric_difference(a, b)) - self.parity(a) * self.parity(b)
+
+    def pair_correlators(self, pairs):
+        """Connected ⟨Z_i Z_j⟩ − ⟨Z_i⟩⟨Z_j⟩ for each (i, j) bit pair (array)"""
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        z = 1.0 - 2.0 * gather_bits(self.rows, pairs.ravel()).reshape(len(self.rows), -1, 2)
+        weights = self.counts / self.shots
+        mean_i = weights @ z[:, :, 0]
+        mean_j = weights @ z[:, :, 1]
+        return weights @ (z[:, :, 0] * z[:, :, 1]) - mean_i * mean_j
+
+    def observables(self, top=10):
+        """Full-register Φ̂, Λ̂, Γ̂, p_succ (same dict as observables_from_bits)"""
+        return observables_from_histogram(self.rows, self.counts, self.num_qubits, self.num_bits, top)
+
+    # ── evidence ──
+
+    def region_summary(self, region):
+        rows, counts = self.marginal(region)
+        return {
+            "qubits": len(self.register_bits(region)),
+            "support": int(len(counts)),
+            "entropy_bits": entropy_bits(counts),
+            "phi": phi_from_histogram(counts),
+            "parity": self.parity(region),
+        }
+
+    def summary(self, regions=None, pairs=SUMMARY_PAIRS):
+        """Per-region and L ↔ R statistics for the evidence entry"""
+        names = [name for name in (regions or self.regions) if self.regions.get(name)]
+        pairs = [(a, b) for a, b in pairs if a in names and b in names]
+        self.marginals(*names, *(self._union(a, b) for a, b in pairs),
+                       *(self._symmetric_difference(a, b) for a, b in pairs))
+
+        summary = {
+            "regions": {name: self.region_summary(name) for name in names},
+            "pairs": {
+                f"{a}|{b}": {
+                    "mutual_information_bits": self.mutual_information(a, b),
+                    "parity_correlator": self.parity_correlator(a, b),
+                }
+                for a, b in pairs
+            },
+        }
+        bridge = self.num_qubits.bridge_pairs() if hasattr(self.num_qubits, "bridge_pairs") else []
+        if bridge:
+            zz = self.pair_correlators(bridge)
+            summary["bridge_zz"] = {"pairs": len(bridge), "mean": float(zz.mean()),
+                                    "max_abs": float(np.abs(zz).max())}
+        return summary
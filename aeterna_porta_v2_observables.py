@@ -0,0 +1,186 @@
+"""
+AETERNA-PORTA v2.1 — VECTORIZED OBSERVABLE ENGINE
+Framework: dna::}{::lang v51.843
+
+Φ̂, Λ̂, Γ̂ and p_succ computed directly on the packed-uint8 shot array of a
+SamplerV2 `BitArray` (pub_result.data.meas), never materialising
+120-character bitstrings or a `get_counts()` dict:
+
+- unique outcomes: np.unique over packed rows viewed as fixed-width bytes
+- parity:          popcount of packed rows (byte lookup table)
+- entropy / Λ̂:     vectorized NumPy over the outcome histogram
+
+The operational definitions are exactly those of compute_*_operational in
+deploy_aeterna_porta_v2_SWEEP.py; results agree to floating-point rounding.
+Only NumPy is required, so saved shot arrays can be analysed without qiskit.
+
+`num_qubits` may be a qubit count or a Partition. The Γ̂ leakage term
+|supp| / 2^n is evaluated as 2^(log₂|supp| − n), so cost is O(shots × qubits)
+at any width and the term underflows cleanly to 0 instead of forming 2^n.
+"""
+import numpy as np
+
+from aeterna_porta_v2_partition import leakage_width, register_width
+
+# Set-bit count of every byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# ═══════════════════════════════════════════════════════════════════
+# PACKED SHOT ARRAYS
+# ═══════════════════════════════════════════════════════════════════
+
+def packed_shots(bits):
+    """
+    (shots, n_bytes) uint8 view of a BitArray or packed ndarray.
+
+    Row layout follows BitArray: big-endian bytes, bit 0 of the register is
+    the least-significant bit of the LAST byte.
+    """
+    array = np.asarray(getattr(bits, "array", bits), dtype=np.uint8)
+    return array.reshape(-1, array.shape[-1])
+
+
+def pack_bitstring(bitstring, n_bytes):
+    """Packed row for a `get_counts()`-style bitstring (bit 0 rightmost)"""
+    value = int(bitstring, 2) if bitstring else 0
+    return np.frombuffer(value.to_bytes(n_bytes, "big"), dtype=np.uint8)
+
+
+def unpack_bitstring(row, num_bits):
+    """Inverse of pack_bitstring"""
+    return format(int.from_bytes(bytes(row), "big"), f"0{num_bits}b")
+
+
+def popcount_rows(packed):
+    """Number of set bits in each packed row"""
+    return _POPCOUNT[packed].sum(axis=-1, dtype=np.int64)
+
+
+def outcome_histogram(bits):
+    """
+    Distinct outcomes and their shot counts.
+
+    Returns (rows, counts): rows is (n_unique, n_bytes) uint8, counts is int64.
+    """
+    packed = np.ascontiguousarray(packed_shots(bits))
+    n_bytes = packed.shape[1]
+    keys = packed.view(np.dtype((np.void, n_bytes))).ravel()
+    unique, counts = np.unique(keys, return_counts=True)
+    rows = unique.view(np.uint8).reshape(-1, n_bytes)
+    return rows, counts.astype(np.int64)
+
+# ═══════════════════════════════════════════════════════════════════
+# OBSERVABLES ON A HISTOGRAM
+# ═══════════════════════════════════════════════════════════════════
+
+def phi_from_histogram(counts):
+    """Φ̂ = H(p) / log₂|supp(p)|"""
+    counts = counts[counts > 0]
+    if counts.size < 2:
+        return 0.0
+    probs = counts / counts.sum()
+    H = -np.sum(probs * np.log(probs)) / np.log(2)
+    return float(H / np.log2(counts.size))
+
+
+def reference_mask(rows, reference_row=None):
+    """Rows equal to the reference outcome (|0…0⟩ by default)"""
+    if reference_row is None:
+        return ~rows.any(axis=1)
+    return (rows == reference_row).all(axis=1)
+
+
+def lambda_from_tallies(reference_hits, off_counts, total):
+    """Λ̂ from the reference-state hit count and the non-reference outcome counts"""
+    p_ref = reference_hits / total
+    p_off = np.sqrt(off_counts / total).sum()
+    return float(min(1.0, np.sqrt(p_ref) + 0.1 * p_off))
+
+
+def lambda_from_histogram(rows, counts, reference_row=None):
+    """Λ̂ = √p_ref + 0.1·Σ_{i≠ref} √p_i  (clamped to 1); reference defaults to |0…0⟩"""
+    is_ref = reference_mask(rows, reference_row)
+    return lambda_from_tallies(counts[is_ref].sum(), counts[~is_ref], counts.sum())
+
+
+def parity_hits(rows, counts, expected_parity=0):
+    """Shots whose outcome has the expected parity"""
+    parity = popcount_rows(rows) % 2
+    return int(counts[parity == expected_parity].sum())
+
+
+def leakage_from_log2_support(log2_support, num_qubits):
+    """|supp| / 2^n as 2^(log₂|supp| − n) (scalar or array; never forms 2^n)"""
+    return np.exp2(log2_support - leakage_width(num_qubits))
+
+
+def leakage_fraction(support, num_qubits):
+    """|supp| / 2^n for a support size (scalar or array)"""
+    with np.errstate(divide="ignore"):
+        return leakage_from_log2_support(np.log2(support), num_qubits)
+
+
+def gamma_from_rates(p_parity, leakage):
+    """Γ̂ = 0.7·(1 − p_parity) + 0.3·leakage  (clamped to [0, 1])"""
+    gamma = (1 - p_parity) * 0.7 + leakage * 0.3
+    return float(max(0.0, min(1.0, gamma)))
+
+
+def gamma_from_tallies(correct_parity, support, total, num_qubits):
+    """Γ̂ from the parity tally and support size"""
+    return gamma_from_rates(correct_parity / total, leakage_fraction(support, num_qubits))
+
+
+def gamma_from_histogram(rows, counts, num_qubits, expected_parity=0):
+    """Γ̂ = 0.7·(1 − p_correct_parity) + 0.3·|supp| / 2^n  (clamped to [0, 1])"""
+    return gamma_from_tallies(
+        parity_hits(rows, counts, expected_parity), len(counts), counts.sum(), num_qubits
+    )
+
+
+def p_succ_from_histogram(counts):
+    """Dominant-outcome probability (the sweep's p_succ placeholder)"""
+    return float(counts.max() / counts.sum())
+
+# ═══════════════════════════════════════════════════════════════════
+# ONE-PASS ENTRY POINTS
+# ═══════════════════════════════════════════════════════════════════
+
+def compute_phi_bits(bits):
+    return phi_from_histogram(outcome_histogram(bits)[1])
+
+
+def compute_lambda_bits(bits, reference_row=None):
+    rows, counts = outcome_histogram(bits)
+    return lambda_from_histogram(rows, counts, reference_row)
+
+
+def compute_gamma_bits(bits, num_qubits, expected_parity=0):
+    rows, counts = outcome_histogram(bits)
+    return gamma_from_histogram(rows, counts, num_qubits, expected_parity)
+
+
+def observables_from_bits(bits, num_qubits, top=10):
+    """
+    Φ̂, Λ̂, Γ̂, p_succ and the `top` most frequent outcomes from one histogram.
+    """
+    rows, counts = outcome_histogram(bits)
+    num_bits = getattr(bits, "num_bits", register_width(num_qubits))
+    return observables_from_histogram(rows, counts, num_qubits, num_bits, top)
+
+
+def observables_from_histogram(rows, counts, num_qubits, num_bits=None, top=10):
+    """observables_from_bits for an already-built (rows, counts) histogram"""
+    order = np.argsort(counts)[::-1][:top]
+    num_bits = num_bits or register_width(num_qubits)
+    sample = {unpack_bitstring(rows[i], num_bits): int(counts[i]) for i in order}
+
+    return {
+        "phi": phi_from_histogram(counts),
+        "lambda": lambda_from_histogram(rows, counts),
+        "gamma": gamma_from_histogram(rows, counts, num_qubits),
+        "p_succ": p_succ_from_histogram(counts),
+        "support": int(len(counts)),
+        "shots": int(counts.sum()),
+        "counts_sample": sample,
+    }
@@ -0,0 +1,98 @@
+"""
+AETERNA-PORTA v2.1 — PROCESS-POOL PARALLEL TRANSPILATION
+Framework: dna::}{::lang v51.843
+
+Grid templates and C0/C1/C2 controls are independent compile units. They
+are fanned out over a ProcessPoolExecutor so one SABRE pass runs per core:
+
+- The backend Target is shipped to each worker ONCE (pool initializer)
+- Each unit gets a deterministic seed derived from (base seed, unit key),
+  so results are reproducible and independent of worker count/order
+- Units already in the TranspileCache are never sent to the pool
+"""
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from qiskit import transpile
+
+from aeterna_porta_v2_transpile_cache import cache_key
+
+# Per-worker backend target (set once by the pool initializer)
+_WORKER_TARGET = None
+
+
+def _init_worker(target):
+    global _WORKER_TARGET
+    _WORKER_TARGET = target
+
+
+def _compile_in_worker(circuit, options):
+    return transpile(circuit, target=_WORKER_TARGET, **options)
+
+
+def deterministic_seed(key, base_seed):
+    """Stable 31-bit transpiler seed for compile unit `key`"""
+    digest = hashlib.sha256(f"{base_seed}|{key!r}".encode()).digest()
+    return int.from_bytes(digest[:4], "big") & 0x7FFFFFFF
+
+
+def resolve_workers(max_workers):
+    """None → one worker per core; 0/1 → compile in-process"""
+    if max_workers is None:
+        return os.cpu_count() or 1
+    return max(1, int(max_workers))
+
+
+def compile_parallel(units, backend, max_workers=None, cache=None):
+    """
+    Transpile independent compile units.
+
+    units: {key: (logical circuit, transpile options)}. Options should already
+    carry `seed_transpiler` (see `deterministic_seed`) for reproducibility.
+
+    Returns {key: compiled circuit}.
+    """
+    compiled = {}
+    pending = {}
+
+    calibration = cache.calibration(backend) if cache is not None else None
+    for key, (circuit, options) in units.items():
+        if cache is not None:
+            ckey = cache_key(circuit, calibration, options)
+            hit = cache.get(ckey)
+            if hit is not None:
+                cache.hits += 1
+                compiled[key] = hit
+                continue
+            cache.misses += 1
+        pending[key] = (circuit, options)
+
+    if not pending:
+        return compiled
+
+    workers = min(resolve_workers(max_workers), len(pending))
+    if workers == 1:
+        results = {
+            key: transpile(circuit, target=backend.target, **options)
+            for key, (circuit, options) in pending.items()
+        }
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(backend.target,),
+        ) as pool:
+            futures = {
+                key: pool.submit(_compile_in_worker, circuit, options)
+                for key, (circuit, options) in pending.items()
+            }
+            results = {key: future.result() for key, future in futures.items()}
+
+    for key, result in results.items():
+        if cache is not None:
+            circuit, options = pending[key]
+            cache.put(cache_key(circuit, calibration, options), result, backend.name, calibration)
+        compiled[key] = result
+
+    return compiled
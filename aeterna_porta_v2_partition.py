@@ -0,0 +1,139 @@
+"""
+AETERNA-PORTA v2.1 — REGISTER PARTITION
+Framework: dna::}{::lang v51.843
+
+One object for the L | R | ancilla geometry, accepted by every circuit
+builder (sweep templates, controls, Nighthawk factory) and by every
+observable in place of a bare qubit count:
+
+    partition = Partition(50, 50, 20)        # the 120-qubit default
+    partition = Partition.from_total(1000)   # 417 | 417 | 166
+    qc = build_parametric_circuit(alpha, K, partition)
+    obs = observables_from_bits(bits, partition)
+
+Qubit layout: L = [0, L), R = [L, L + R), ancillas = [L + R, total).
+
+The Γ̂ leakage term |supp| / 2^n is evaluated in log space over the full
+register width. Sweeps recorded before this used 2^min(n, 20) as the
+denominator; `leakage_cap_qubits=LEGACY_LEAKAGE_CAP_QUBITS` reproduces
+them, and `from_dict` applies it to evidence written without the field.
+
+Pure Python (no NumPy or qiskit), so it can travel into worker processes
+and saved evidence.
+"""
+
+ANC_FRACTION = 1 / 6  # 50 | 50 | 20
+THROAT_HALF_WIDTH = 5  # Floquet throat: L - 5 … L + 4
+GUARD_QUBITS = 8  # Zeno guards: the first 8 L qubits
+LEGACY_LEAKAGE_CAP_QUBITS = 20  # Leakage denominator cap of earlier evidence
+
+
+class Partition:
+    """L | R | ancilla split of one register"""
+
+    __slots__ = ("l_qubits", "r_qubits", "anc_qubits", "leakage_cap_qubits")
+
+    def __init__(self, l_qubits, r_qubits, anc_qubits, leakage_cap_qubits=None):
+        if min(l_qubits, r_qubits, anc_qubits) < 0:
+            raise ValueError(f"Negative partition: {l_qubits} | {r_qubits} | {anc_qubits}")
+        self.l_qubits = int(l_qubits)
+        self.r_qubits = int(r_qubits)
+        self.anc_qubits = int(anc_qubits)
+        self.leakage_cap_qubits = None if leakage_cap_qubits is None else int(leakage_cap_qubits)
+
+    @classmethod
+    def from_total(cls, total, anc_fraction=ANC_FRACTION, leakage_cap_qubits=None):
+        """Split `total` qubits into anc ≈ anc_fraction·total and L ≈ R"""
+        anc = int(total * anc_fraction)
+        left = (total - anc) // 2
+        return cls(left, total - anc - left, anc, leakage_cap_qubits)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Inverse of to_dict (evidence without the cap field gets the legacy cap)"""
+        return cls(data["L"], data["R"], data["Anc"],
+                   data.get("leakage_cap_qubits", LEGACY_LEAKAGE_CAP_QUBITS))
+
+    def to_dict(self):
+        return {
+            "L": self.l_qubits,
+            "R": self.r_qubits,
+            "Anc": self.anc_qubits,
+            "total": self.total,
+            "leakage_cap_qubits": self.leakage_cap_qubits,
+        }
+
+    @property
+    def total(self):
+        return self.l_qubits + self.r_qubits + self.anc_qubits
+
+    @property
+    def leakage_qubits(self):
+        """Width n of the Γ̂ leakage denominator 2^n"""
+        if self.leakage_cap_qubits is None:
+            return self.total
+        return min(self.total, self.leakage_cap_qubits)
+
+    @property
+    def anc_start(self):
+        return self.l_qubits + self.r_qubits
+
+    def bridge_pairs(self):
+        """(ℓ, r) TFD pairs across the L ↔ R bridge"""
+        return [(i, self.l_qubits + i) for i in range(min(self.l_qubits, self.r_qubits))]
+
+    def throat(self, half_width=THROAT_HALF_WIDTH):
+        """Qubits on either side of the L | R boundary driven by the Floquet stage"""
+        return range(max(0, self.l_qubits - half_width),
+                     min(self.total, self.l_qubits + half_width))
+
+    def guard_qubits(self, count=GUARD_QUBITS):
+        """L qubits weakly measured through the ancillas in each Zeno cycle (none without ancillas)"""
+        if not self.anc_qubits:
+            return []
+        return list(range(min(count, self.l_qubits)))
+
+    def regions(self):
+        """Named qubit subsets used for regional statistics (aeterna_porta_v2_marginals)"""
+        return {
+            "L": range(self.l_qubits),
+            "R": range(self.l_qubits, self.anc_start),
+            "throat": self.throat(),
+            "guards": range(len(self.guard_qubits())),
+            "ancilla": range(self.anc_start, self.total),
+        }
+
+    def ancilla(self, i):
+        """Ancilla serving the i-th guard (round robin)"""
+        return self.anc_start + i % self.anc_qubits
+
+    def __eq__(self, other):
+        if not isinstance(other, Partition):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return (self.l_qubits, self.r_qubits, self.anc_qubits, self.leakage_cap_qubits)
+
+    def __getstate__(self):
+        return self._key()
+
+    def __setstate__(self, state):
+        self.l_qubits, self.r_qubits, self.anc_qubits, self.leakage_cap_qubits = state
+
+    def __repr__(self):
+        cap = f", leakage_cap_qubits={self.leakage_cap_qubits}" if self.leakage_cap_qubits is not None else ""
+        return f"Partition({self.l_qubits}, {self.r_qubits}, {self.anc_qubits}{cap})"
+
+
+def register_width(num_qubits):
+    """Register width of a qubit count or a Partition"""
+    return getattr(num_qubits, "total", num_qubits)
+
+
+def leakage_width(num_qubits):
+    """Leakage denominator width of a qubit count or a Partition"""
+    return getattr(num_qubits, "leakage_qubits", num_qubits)
@@ -0,0 +1,152 @@
+"""
+AETERNA-PORTA v2.1 — ASYNCHRONOUS SUBMIT/POLL/PROCESS PIPELINE
+Framework: dna::}{::lang v51.843
+
+Overlaps the three sweep stages instead of running them strictly in turn:
+
+  [compile]  build + transpile config i+1   (worker thread)
+  [submit]   at most `max_in_flight` jobs queued on the backend
+  [process]  observables for each job as soon as IT finishes (any order)
+
+Cancelling the pipeline (Ctrl-C, task cancellation or a stage error)
+cancels every job that is still queued or running on the backend.
+"""
+import asyncio
+
+from aeterna_porta_v2_batch import make_sampler
+
+_END = object()
+
+
+def _is_final(job):
+    """True once a primitive job reached DONE / ERROR / CANCELLED"""
+    return job.in_final_state()
+
+
+class SweepPipeline:
+    """
+    Bounded, cancellable compile → submit → poll → process pipeline.
+
+    compile_fn(key) -> (circuit, shots, meta)     runs in a worker thread
+    process_fn(key, pub_result, job_id, meta)     runs in a worker thread as
+                                                  soon as that key's job ends
+    on_submit(key, job)                           called right after submission
+                                                  (e.g. to journal the job ID)
+    on_result(key, entry)                         called with process_fn's entry
+    attached: {key: (job, meta)}                  jobs submitted earlier (resume);
+                                                  polled and processed, not resubmitted
+
+    compile_fn and process_fn run concurrently with each other and with the
+    callbacks, so they must be thread-safe: keep them to computing their
+    result. on_submit and on_result run on the event-loop thread, one at a
+    time; side effects on shared state (journal, bookkeeping) belong there.
+    """
+
+    def __init__(self, backend, max_in_flight=4, poll_interval=5.0,
+                 dynamical_decoupling=True):
+        self.backend = backend
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.dynamical_decoupling = dynamical_decoupling
+        self.in_flight = {}
+        self.results = {}
+
+    async def run(self, keys, compile_fn, process_fn, on_result=None, on_submit=None,
+                  attached=None):
+        """Run every key through the pipeline; returns {key: process_fn(...)}"""
+        self.results = {}
+        slots = asyncio.Semaphore(self.max_in_flight)
+        # Compile at most one config ahead of the submission window
+        compiled_q = asyncio.Queue(maxsize=1)
+        job_tasks = []
+
+        # Re-attached jobs already sit on the backend: they queue for slots
+        # ahead of any new submission, then are polled like fresh ones
+        for key, (job, meta) in (attached or {}).items():
+            self.in_flight[key] = job
+            job_tasks.append(asyncio.create_task(
+                self._job_stage(key, job, meta, slots, process_fn, on_result, acquire=True)
+            ))
+
+        producer = asyncio.create_task(self._compile_stage(keys, compile_fn, compiled_q))
+        submitter = asyncio.create_task(
+            self._submit_stage(compiled_q, slots, process_fn, on_result, on_submit, job_tasks)
+        )
+        try:
+            await asyncio.gather(producer, submitter)
+            await asyncio.gather(*job_tasks)
+        except BaseException:
+            for task in [producer, submitter, *job_tasks]:
+                task.cancel()
+            await asyncio.gather(producer, submitter, *job_tasks, return_exceptions=True)
+            await self._cancel_in_flight()
+            raise
+
+        return self.results
+
+    async def _compile_stage(self, keys, compile_fn, compiled_q):
+        for key in keys:
+            compiled = await asyncio.to_thread(compile_fn, key)
+            await compiled_q.put((key, compiled))
+        await compiled_q.put(_END)
+
+    async def _submit_stage(self, compiled_q, slots, process_fn, on_result, on_submit,
+                            job_tasks):
+        sampler = make_sampler(self.backend, self.dynamical_decoupling)
+        while True:
+            item = await compiled_q.get()
+            if item is _END:
+                return
+
+            key, (circuit, shots, meta) = item
+            await slots.acquire()
+            try:
+                job = await asyncio.to_thread(sampler.run, [circuit], shots=shots)
+            except BaseException:
+                slots.release()
+                raise
+
+            self.in_flight[key] = job
+            if on_submit is not None:
+                on_submit(key, job)
+            job_tasks.append(asyncio.create_task(
+                self._job_stage(key, job, meta, slots, process_fn, on_result)
+            ))
+
+    async def _job_stage(self, key, job, meta, slots, process_fn, on_result, acquire=False):
+        if acquire:
+            await slots.acquire()
+        try:
+            while not await asyncio.to_thread(_is_final, job):
+                await asyncio.sleep(self.poll_interval)
+            result = await asyncio.to_thread(job.result)
+        finally:
+            slots.release()
+        # Only drop the job once it has finished: on cancellation it must stay
+        # registered so _cancel_in_flight can cancel it on the backend.
+        self.in_flight.pop(key, None)
+
+        entry = await asyncio.to_thread(process_fn, key, result[0], job.job_id(), meta)
+        self.results[key] = entry
+        if on_result is not None:
+            on_result(key, entry)
+
+    async def _cancel_in_flight(self):
+        jobs = list(self.in_flight.values())
+        self.in_flight.clear()
+        for job in jobs:
+            try:
+                await asyncio.to_thread(job.cancel)
+            except Exception:
+                # Already finished or not cancellable any more
+                pass
+
+
+def run_pipeline(backend, keys, compile_fn, process_fn, on_result=None, on_submit=None,
+                 attached=None, max_in_flight=4, poll_interval=5.0):
+    """Synchronous entry point: run a SweepPipeline to completion"""
+    pipeline = SweepPipeline(backend, max_in_flight=max_in_flight, poll_interval=poll_interval)
+    return asyncio.run(pipeline.run(
+        keys, compile_fn, process_fn,
+        on_result=on_result, on_submit=on_submit, attached=attached,
+    ))
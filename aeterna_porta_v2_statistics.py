@@ -0,0 +1,238 @@
+"""
+AETERNA-PORTA v2.1 — BOOTSTRAP / Z-SCORE STATISTICS ENGINE
+Framework: dna::}{::lang v51.843
+
+Uncertainties for the ignition decision rule
+
+    ignite ⇔ (Φ̂ ≥ 0.7734) ∧ (Γ̂ ≤ 0.3) ∧ (Z_Δτ ≥ 5)
+
+computed from each configuration's outcome histogram:
+
+- Bootstrap replicates are multinomial resamples of the histogram (N shots
+  redrawn with replacement) as a (replicates, n_outcomes) count matrix per
+  chunk: rng.multinomial over the rows when the support is small next to
+  N, otherwise the shots themselves are redrawn and bincounted a few
+  replicate rows at a time. Both the count matrix and the shot-index
+  block stay under CHUNK_CELLS entries at any shot count or support size.
+  Φ̂/Λ̂/Γ̂/p_succ/Δτ_eff are evaluated for every replicate at once through
+  k·log k and √k lookup tables
+- Bootstrap standard errors and percentile confidence intervals (plus their
+  bias-corrected shift, clipped to the observable's range) per observable
+- Z-scores of every configuration against C0/C1/C2, per observable
+- Configurations are spread over a process pool, one seed stream each
+
+Only NumPy is required, so archived sweeps can be re-analysed offline.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from aeterna_porta_v2_observables import leakage_fraction, popcount_rows, reference_mask
+
+DEFAULT_REPLICATES = 2000
+DEFAULT_LEVEL = 0.95
+CHUNK_CELLS = 2**22  # Entries per count matrix / shot-index block (32 MiB as int64)
+MULTINOMIAL_SHOTS_PER_OUTCOME = 16  # rng.multinomial when shots ≥ this × support, else redraw shots
+
+# Range of each observable (Δτ_eff has no fixed range: its ceiling depends on depth)
+OBSERVABLE_BOUNDS = {
+    "phi": (0.0, 1.0),
+    "lambda": (0.0, 1.0),
+    "gamma": (0.0, 1.0),
+    "p_succ": (0.0, 1.0),
+}
+
+
+def tau_eff(circuit_depth, success_prob, baseline_depth=49):
+    """Vectorized compute_tau_eff: τ_baseline − depth / p_succ (0 when p_succ < 1%)"""
+    success_prob = np.asarray(success_prob, dtype=float)
+    tau_baseline = baseline_depth / 0.5
+    with np.errstate(divide="ignore"):
+        delta_tau = tau_baseline - circuit_depth / success_prob
+    return np.where(success_prob < 0.01, 0.0, delta_tau)
+
+# ═══════════════════════════════════════════════════════════════════
+# REPLICATE OBSERVABLES
+# ═══════════════════════════════════════════════════════════════════
+
+class HistogramModel:
+    """Per-histogram lookup tables shared by the point estimate and all replicates"""
+
+    def __init__(self, rows, counts, num_qubits, circuit_depth=None):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.shots = int(self.counts.sum())
+        self.num_qubits = num_qubits
+        self.circuit_depth = circuit_depth
+        self.is_ref = reference_mask(rows)
+        self.even = popcount_rows(rows) % 2 == 0
+
+        k = np.arange(self.shots + 1, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.klogk = np.where(k > 0, k * np.log(k), 0.0)
+        self.sqrtk = np.sqrt(k)
+        self._source = None
+
+    def observables(self, C):
+        """Φ̂, Λ̂, Γ̂, p_succ, Δτ_eff for each row of a (replicates, n_outcomes) count matrix"""
+        n = self.shots
+        support = (C > 0).sum(axis=1)
+
+        H = (np.log(n) - self.klogk[C].sum(axis=1) / n) / np.log(2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            phi = np.where(support >= 2, H / np.log2(np.maximum(support, 2)), 0.0)
+
+        p_ref = C[:, self.is_ref].sum(axis=1) / n
+        p_off = self.sqrtk[C[:, ~self.is_ref]].sum(axis=1) / np.sqrt(n)
+        lam = np.minimum(1.0, np.sqrt(p_ref) + 0.1 * p_off)
+
+        p_parity = C[:, self.even].sum(axis=1) / n
+        leakage = leakage_fraction(support, self.num_qubits)
+        gamma = np.clip((1 - p_parity) * 0.7 + leakage * 0.3, 0.0, 1.0)
+
+        p_succ = C.max(axis=1) / n
+        out = {"phi": phi, "lambda": lam, "gamma": gamma, "p_succ": p_succ}
+        if self.circuit_depth is not None:
+            out["delta_tau_eff"] = tau_eff(self.circuit_depth, p_succ)
+        return out
+
+    def point(self):
+        return {name: float(v[0]) for name, v in self.observables(self.counts[None, :]).items()}
+
+    def resample(self, rng, replicates):
+        """(replicates, n_outcomes) multinomial resamples of the histogram"""
+        u = len(self.counts)
+        if u * MULTINOMIAL_SHOTS_PER_OUTCOME <= self.shots:
+            # Cost O(replicates·u): cheap while the support is small
+            return rng.multinomial(self.shots, self.counts / self.shots, size=replicates)
+
+        # Redraw the N shots themselves: same multinomial, O(replicates·N),
+        # in blocks of rows so the index array stays under CHUNK_CELLS
+        if self._source is None:
+            self._source = np.repeat(np.arange(u), self.counts)
+        C = np.empty((replicates, u), dtype=np.int64)
+        block = max(1, CHUNK_CELLS // self.shots)
+        for start in range(0, replicates, block):
+            rows = min(block, replicates - start)
+            draws = self._source[rng.integers(0, self.shots, size=(rows, self.shots))]
+            draws += (np.arange(rows) * u)[:, None]
+            C[start:start + rows] = np.bincount(draws.ravel(), minlength=rows * u).reshape(rows, u)
+        return C
+
+    def bootstrap(self, replicates=DEFAULT_REPLICATES, seed=None, chunk=500):
+        """{observable: (replicates,) array}, at most `chunk` replicates (and CHUNK_CELLS counts) at a time"""
+        rng = np.random.default_rng(seed)
+        chunk = max(1, min(chunk, CHUNK_CELLS // max(1, len(self.counts))))
+        parts = []
+        for start in range(0, replicates, chunk):
+            parts.append(self.observables(self.resample(rng, min(chunk, replicates - start))))
+        return {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+
+# ═══════════════════════════════════════════════════════════════════
+# SUMMARIES
+# ═══════════════════════════════════════════════════════════════════
+
+def summarize(point, replicates, level=DEFAULT_LEVEL, bounds=OBSERVABLE_BOUNDS):
+    """
+    Per observable: {"estimate", "se", "bias", "ci", "ci_bias_corrected"}.
+
+    `ci` is the percentile interval. Support-driven observables (Φ̂, the Γ̂
+    leakage term) are biased under resampling, since a resample repeats
+    outcomes and so has a smaller support. `bias` = replicate mean − estimate,
+    and `ci_bias_corrected` is the percentile interval shifted by −bias,
+    clipped to the observable's range in `bounds` (a shift can push e.g.
+    Φ̂ ≈ 1 past 1).
+    """
+    tail = (1 - level) / 2 * 100
+    out = {}
+    for name, estimate in point.items():
+        values = replicates[name]
+        lo, hi = np.percentile(values, [tail, 100 - tail])
+        bias = float(values.mean() - estimate)
+        corrected = np.array([lo - bias, hi - bias])
+        if name in bounds:
+            corrected = np.clip(corrected, *bounds[name])
+        out[name] = {
+            "estimate": estimate,
+            "se": float(values.std(ddof=1)),
+            "bias": bias,
+            "ci": [float(lo), float(hi)],
+            "ci_bias_corrected": [float(corrected[0]), float(corrected[1])],
+        }
+    return out
+
+
+def analyse_histogram(rows, counts, num_qubits, circuit_depth=None,
+                      replicates=DEFAULT_REPLICATES, seed=None, level=DEFAULT_LEVEL):
+    """Point estimates + bootstrap SE/CI for one configuration"""
+    model = HistogramModel(rows, counts, num_qubits, circuit_depth)
+    return summarize(model.point(), model.bootstrap(replicates, seed), level)
+
+
+def _analyse_job(job):
+    return analyse_histogram(*job)
+
+
+def analyse_histograms(histograms, num_qubits, replicates=DEFAULT_REPLICATES, seed=None,
+                       level=DEFAULT_LEVEL, max_workers=None):
+    """
+    Bootstrap many configurations, one process per core.
+
+    histograms: {key: (rows, counts, circuit_depth)}. Each key gets its own
+    child seed of `seed`, so results do not depend on the worker count.
+    Returns {key: summary}.
+    """
+    keys = list(histograms)
+    seeds = np.random.SeedSequence(seed).spawn(len(keys))
+    jobs = [
+        (rows, counts, num_qubits, depth, replicates, child_seed, level)
+        for (rows, counts, depth), child_seed in zip((histograms[k] for k in keys), seeds)
+    ]
+
+    workers = max(1, min(len(jobs), max_workers or os.cpu_count() or 1))
+    if workers == 1:
+        summaries = [_analyse_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(_analyse_job, jobs))
+    return dict(zip(keys, summaries))
+
+# ═══════════════════════════════════════════════════════════════════
+# Z-SCORES + DECISION RULE
+# ═══════════════════════════════════════════════════════════════════
+
+def z_score(a, b):
+    """(a − b) / √(se_a² + se_b²) for two {"estimate", "se"} summaries"""
+    diff = a["estimate"] - b["estimate"]
+    se = np.hypot(a["se"], b["se"])
+    if se == 0:
+        return 0.0 if diff == 0 else float(np.copysign(np.inf, diff))
+    return float(diff / se)
+
+
+def z_vs_controls(summary, control_summaries):
+    """{control: {observable: Z}} for every observable both summaries carry"""
+    return {
+        name: {obs: z_score(summary[obs], control[obs]) for obs in summary if obs in control}
+        for name, control in control_summaries.items()
+    }
+
+
+def ignition_decision(summary, z_scores, phi_threshold, gamma_critical, z_threshold=5.0):
+    """
+    (Φ̂ ≥ phi_threshold) ∧ (Γ̂ ≤ gamma_critical) ∧ (Z_Δτ ≥ z_threshold), where
+    Z_Δτ is the smallest Δτ_eff Z-score against any control.
+    """
+    z_delta_tau = [z["delta_tau_eff"] for z in z_scores.values() if "delta_tau_eff" in z]
+    z_min = min(z_delta_tau) if z_delta_tau else None
+
+    phi_ok = summary["phi"]["estimate"] >= phi_threshold
+    gamma_ok = summary["gamma"]["estimate"] <= gamma_critical
+    z_ok = z_min is not None and z_min >= z_threshold
+    return {
+        "phi_ok": bool(phi_ok),
+        "gamma_ok": bool(gamma_ok),
+        "z_delta_tau": z_min,
+        "z_ok": bool(z_ok),
+        "ignite": bool(phi_ok and gamma_ok and z_ok),
+    }
@@ -0,0 +1,303 @@
+"""
+AETERNA-PORTA v2.1 — STAGE TELEMETRY
+Framework: dna::}{::lang v51.843
+
+Span timers and counters for the sweep and ignition flows:
+
+    telemetry = Telemetry(sink=JsonlSink(path))
+    with telemetry.span("compile"):
+        ...
+    telemetry.circuit("K16", compiled)   # compiled depth / gate counts
+    telemetry.job(job)                   # queue vs run time from job metrics
+    evidence["telemetry"] = telemetry.to_dict()
+
+Per span: wall time, CPU time (all threads plus reaped child processes, so
+simulator threads and the bootstrap/compile process pools count), and the
+process peak RSS high-water mark when the span ends.
+Spans nest by name ("execute/wait"); repeated spans are aggregated per path
+in the evidence (count, totals, max), while a sink gets every occurrence.
+
+Sinks: JsonlSink appends one JSON line per event; PrometheusTextSink writes a
+text-exposition file (node_exporter textfile collector) on close.
+
+`Telemetry(enabled=False)` (or DISABLED) hands out one shared no-op span and
+ignores every record call, so instrumented code costs a method call per
+stage when telemetry is off.
+"""
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# ru_maxrss is in kilobytes on Linux, bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def peak_rss_bytes():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+def cpu_seconds():
+    """User + system CPU of this process and its finished child processes"""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _seconds_between(start, end):
+    if not start or not end:
+        return None
+    return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+
+
+def job_timing(job):
+    """
+    {"job_id", "queue_s", "run_s", "quantum_seconds"} from a job's metrics()
+    (IBM Runtime and LocalJob). Jobs without metrics give just the job ID.
+    """
+    record = {"job_id": job.job_id()}
+    try:
+        metrics = job.metrics()
+    except AttributeError:
+        return record
+    except Exception as exc:
+        # Metrics are informational: a failed lookup must not fail the sweep
+        record["error"] = str(exc)
+        return record
+
+    stamps = metrics.get("timestamps") or {}
+    usage = metrics.get("usage") or {}
+    record.update({
+        "queue_s": _seconds_between(stamps.get("created"), stamps.get("running")),
+        "run_s": _seconds_between(stamps.get("running"), stamps.get("finished")),
+        "quantum_seconds": usage.get("quantum_seconds"),
+    })
+    return record
+
+
+def circuit_profile(circuit):
+    """Compiled size figures for one circuit"""
+    return {
+        "num_qubits": circuit.num_qubits,
+        "depth": circuit.depth(),
+        "size": circuit.size(),
+        "two_qubit_gates": circuit.num_nonlocal_gates(),
+        "ops": {name: int(n) for name, n in circuit.count_ops().items()},
+    }
+
+# ═══════════════════════════════════════════════════════════════════
+# SINKS
+# ═══════════════════════════════════════════════════════════════════
+
+class JsonlSink:
+    """Append every span/counter/job event as one JSON line"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def emit(self, event):
+        line = json.dumps(event)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self, telemetry):
+        self._file.close()
+
+
+class PrometheusTextSink:
+    """Write aggregated stage metrics in Prometheus text format on close"""
+
+    def __init__(self, path, prefix="aeterna"):
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def emit(self, event):
+        pass
+
+    def close(self, telemetry):
+        labels = {"run": str(telemetry.run)} if telemetry.run is not None else {}
+
+        def line(metric, value, **extra):
+            tags = ",".join(f'{k}="{v}"' for k, v in {**labels, **extra}.items())
+            return f"{self.prefix}_{metric}{{{tags}}} {value}"
+
+        data = telemetry.to_dict()
+        lines = []
+        for metric, field, help_text in (
+            ("stage_wall_seconds", "wall_s", "Wall time spent in each stage"),
+            ("stage_cpu_seconds", "cpu_s", "CPU time spent in each stage"),
+            ("stage_count", "count", "Times each stage ran"),
+        ):
+            lines += [f"# HELP {self.prefix}_{metric} {help_text}",
+                      f"# TYPE {self.prefix}_{metric} gauge"]
+            lines += [line(metric, stage[field], stage=path) for path, stage in data["stages"].items()]
+        lines += [f"# TYPE {self.prefix}_counter gauge"]
+        lines += [line("counter", value, name=name) for name, value in data["counters"].items()]
+        lines += [f"# TYPE {self.prefix}_peak_rss_bytes gauge",
+                  line("peak_rss_bytes", data["process"]["peak_rss_bytes"])]
+        for kind in ("queue_s", "run_s"):
+            values = [job[kind] for job in data["jobs"] if job.get(kind) is not None]
+            if values:
+                lines += [f"# TYPE {self.prefix}_job_{kind[:-2]}_seconds_total gauge",
+                          line(f"job_{kind[:-2]}_seconds_total", sum(values))]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text("\n".join(lines) + "\n")
+        tmp.replace(self.path)
+
+
+def sink_for(path):
+    """JsonlSink for *.jsonl, PrometheusTextSink for *.prom (None for no path)"""
+    if path is None:
+        return None
+    path = Path(path)
+    if path.suffix == ".prom":
+        return PrometheusTextSink(path)
+    if path.suffix == ".jsonl":
+        return JsonlSink(path)
+    raise ValueError(f"Unknown telemetry sink (use .jsonl or .prom): {path}")
+
+# ═══════════════════════════════════════════════════════════════════
+# TELEMETRY
+# ═══════════════════════════════════════════════════════════════════
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, telemetry, name, attrs):
+        self.telemetry = telemetry
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        stack = self.telemetry._stack()
+        stack.append(self.name)
+        self.path = "/".join(stack)
+        self.wall0 = time.perf_counter()
+        self.cpu0 = cpu_seconds()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self.wall0
+        cpu = cpu_seconds() - self.cpu0
+        self.telemetry._stack().pop()
+        self.telemetry._close_span(self.path, wall, cpu, peak_rss_bytes(), self.attrs,
+                                   failed=exc_type is not None)
+        return False
+
+
+class Telemetry:
+    """Span timers, counters, compiled-circuit and job records for one run"""
+
+    def __init__(self, enabled=True, sink=None, run=None):
+        self.enabled = enabled
+        self.sink = sink if enabled else None
+        self.run = run
+        self.stages = {}
+        self.counters = {}
+        self.circuits = {}
+        self.jobs = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wall0 = time.perf_counter()
+        self._cpu0 = cpu_seconds()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _emit(self, kind, **fields):
+        if self.sink is not None:
+            self.sink.emit({"event": kind, "time": time.time(), "run": self.run, **fields})
+
+    def span(self, name, **attrs):
+        """Context manager timing one stage (nested under any open span)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, attrs)
+
+    def _close_span(self, path, wall, cpu, rss, attrs, failed):
+        with self._lock:
+            stage = self.stages.setdefault(
+                path, {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "max_wall_s": 0.0,
+                       "peak_rss_bytes": 0, "failed": 0}
+            )
+            stage["count"] += 1
+            stage["wall_s"] += wall
+            stage["cpu_s"] += cpu
+            stage["max_wall_s"] = max(stage["max_wall_s"], wall)
+            stage["peak_rss_bytes"] = max(stage["peak_rss_bytes"], rss)
+            stage["failed"] += failed
+        self._emit("span", stage=path, wall_s=wall, cpu_s=cpu, peak_rss_bytes=rss,
+                   failed=failed, **attrs)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        self._emit("counter", name=name, value=value)
+
+    def circuit(self, label, circuit):
+        """Record a compiled circuit's depth and gate counts"""
+        if not self.enabled:
+            return
+        profile = circuit_profile(circuit)
+        with self._lock:
+            self.circuits[str(label)] = profile
+        self._emit("circuit", label=str(label), **profile)
+
+    def job(self, job, **attrs):
+        """Record a finished job's queue/run time (from its metrics)"""
+        if not self.enabled:
+            return
+        record = {**job_timing(job), **attrs}
+        with self._lock:
+            self.jobs.append(record)
+        self._emit("job", **record)
+
+    def to_dict(self):
+        """Evidence block ({"enabled": False} when telemetry is off)"""
+        if not self.enabled:
+            return {"enabled": False}
+        queue = [j["queue_s"] for j in self.jobs if j.get("queue_s") is not None]
+        run = [j["run_s"] for j in self.jobs if j.get("run_s") is not None]
+        return {
+            "enabled": True,
+            "stages": {path: dict(stage) for path, stage in self.stages.items()},
+            "counters": dict(self.counters),
+            "circuits": dict(self.circuits),
+            "jobs": list(self.jobs),
+            "job_totals": {"jobs": len(self.jobs), "queue_s": sum(queue), "run_s": sum(run)},
+            "process": {
+                "wall_s": time.perf_counter() - self._wall0,
+                "cpu_s": cpu_seconds() - self._cpu0,
+                "peak_rss_bytes": peak_rss_bytes(),
+            },
+        }
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close(self)
+            self.sink = None
+
+
+DISABLED = Telemetry(enabled=False)
@@ -0,0 +1,274 @@
+"""
+AETERNA-PORTA v2.1 — PERSISTENT CONTENT-ADDRESSED TRANSPILATION CACHE
+Framework: dna::}{::lang v51.843
+
+Compiled circuits are stored as QPY under ~/.osiris/transpile_cache (next to
+~/.osiris/evidence). The cache key is
+
+  sha256( canonical pre-transpile circuit structure
+        ⊕ backend target + calibration fingerprint
+        ⊕ transpile options ⊕ qiskit version )
+
+Every compile path (this cache, the process pool, the autotuner, uncached
+fallbacks) calls `transpile(circuit, target=backend.target, **options)`, so
+one key always names one compilation.
+
+Re-running a sweep with an unchanged configuration skips transpilation
+entirely. Entries are evicted least-recently-used once the size or entry
+limit is exceeded, and every entry for a backend is dropped as soon as that
+backend reports a new calibration. Sweeps in several processes may share the
+directory: every index.json update is a read-modify-write under an flock on
+index.lock, written back through a temp file + os.replace.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import qiskit
+from qiskit import QuantumCircuit, qpy, transpile
+from qiskit.circuit import ParameterExpression
+
+DEFAULT_CACHE_DIR = Path.home() / ".osiris" / "transpile_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 4096
+
+# ═══════════════════════════════════════════════════════════════════
+# FINGERPRINTS
+# ═══════════════════════════════════════════════════════════════════
+
+def _canonical_value(value):
+    if isinstance(value, QuantumCircuit):
+        return ["block", _canonical_circuit(value)]
+    if isinstance(value, ParameterExpression):
+        # Parameter names are stable across runs; Parameter UUIDs are not
+        return ["expr", str(value)]
+    if isinstance(value, float):
+        return ["f", value.hex()]
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(v) for v in value]
+    return ["r", repr(value)]
+
+
+def _canonical_condition(circuit, condition):
+    if condition is None:
+        return None
+    if isinstance(condition, tuple):
+        target, val = condition
+        if hasattr(target, "name") and hasattr(target, "size"):
+            return ["creg", target.name, int(val)]
+        return ["clbit", circuit.find_bit(target).index, int(val)]
+    return ["expr", repr(condition)]
+
+
+def _canonical_circuit(circuit):
+    """Nested lists describing `circuit` independently of object identity"""
+    ops = []
+    for inst in circuit.data:
+        op = inst.operation
+        ops.append([
+            op.name,
+            [_canonical_value(p) for p in op.params],
+            [circuit.find_bit(q).index for q in inst.qubits],
+            [circuit.find_bit(c).index for c in inst.clbits],
+            _canonical_condition(circuit, getattr(op, "condition", None)),
+        ])
+    return {
+        "num_qubits": circuit.num_qubits,
+        "cregs": [[reg.name, reg.size] for reg in circuit.cregs],
+        "global_phase": _canonical_value(circuit.global_phase),
+        "ops": ops,
+    }
+
+
+def circuit_fingerprint(circuit):
+    """Canonical sha256 of a circuit's structure (gates, params, wiring, registers)"""
+    blob = json.dumps(_canonical_circuit(circuit), separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def backend_fingerprint(backend):
+    """
+    Calibration fingerprint of a backend: sha256 over its target's
+    instruction set, qubit connectivity, per-instruction error/duration and
+    qubit T1/T2. Changes whenever the backend is recalibrated.
+    """
+    target = backend.target
+    h = hashlib.sha256()
+    h.update(f"{backend.name}|{target.num_qubits}".encode())
+
+    for op_name in sorted(target.operation_names):
+        props = target[op_name]
+        for qargs in sorted(props, key=lambda q: (q is None, q or ())):
+            inst_props = props[qargs]
+            error = getattr(inst_props, "error", None)
+            duration = getattr(inst_props, "duration", None)
+            h.update(repr((op_name, qargs, error, duration)).encode())
+
+    for i, qprops in enumerate(target.qubit_properties or []):
+        if qprops is not None:
+            h.update(repr((i, qprops.t1, qprops.t2, qprops.frequency)).encode())
+
+    return h.hexdigest()
+
+
+def topology_fingerprint(backend):
+    """
+    sha256 over a backend's name, width, instruction set and coupling edges:
+    stable across recalibrations, changes only when the device itself does.
+    """
+    target = backend.target
+    h = hashlib.sha256()
+    h.update(f"{backend.name}|{target.num_qubits}".encode())
+    h.update(repr(sorted(target.operation_names)).encode())
+    coupling = target.build_coupling_map()
+    edges = sorted(coupling.get_edges()) if coupling is not None else []
+    h.update(repr(edges).encode())
+    return h.hexdigest()
+
+
+def options_fingerprint(options):
+    return json.dumps(options, sort_keys=True, default=repr)
+
+
+def cache_key(circuit, calibration, options):
+    h = hashlib.sha256()
+    h.update(circuit_fingerprint(circuit).encode())
+    h.update(calibration.encode())
+    h.update(options_fingerprint(options).encode())
+    h.update(qiskit.__version__.encode())
+    return h.hexdigest()
+
+# ═══════════════════════════════════════════════════════════════════
+# CACHE
+# ═══════════════════════════════════════════════════════════════════
+
+class TranspileCache:
+    """
+    On-disk LRU cache of compiled circuits (QPY files + JSON index).
+
+    index.json maps key → {"file", "size", "last_access", "backend",
+    "calibration"}; each compiled circuit lives in <key>.qpy.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.index_path = self.root / "index.json"
+        self.lock_path = self.root / "index.lock"
+        self.index = self._load_index()
+        self.hits = 0
+        self.misses = 0
+        self._calibrations = {}
+
+    def _load_index(self):
+        try:
+            return json.loads(self.index_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.index))
+        os.replace(tmp, self.index_path)
+
+    @contextmanager
+    def _locked_index(self):
+        """
+        Exclusive read-modify-write of index.json: reload it under the lock
+        (other processes may have written since), yield it, write it back.
+        """
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self.index = self._load_index()
+                yield self.index
+                self._save_index()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _drop(self, key):
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            (self.root / entry["file"]).unlink(missing_ok=True)
+
+    def calibration(self, backend):
+        """Backend fingerprint, computed once per backend per process"""
+        if backend.name not in self._calibrations:
+            calibration = backend_fingerprint(backend)
+            self._calibrations[backend.name] = calibration
+            self.invalidate_stale(backend.name, calibration)
+        return self._calibrations[backend.name]
+
+    def invalidate_stale(self, backend_name, calibration):
+        """Drop every entry compiled for `backend_name` under another calibration"""
+        with self._locked_index() as index:
+            stale = [
+                key for key, entry in index.items()
+                if entry["backend"] == backend_name and entry["calibration"] != calibration
+            ]
+            for key in stale:
+                self._drop(key)
+        return len(stale)
+
+    def get(self, key):
+        if key not in self._load_index():
+            return None  # Misses never take the lock or rewrite the index
+        with self._locked_index() as index:
+            entry = index.get(key)
+            if entry is None:
+                return None
+            try:
+                with open(self.root / entry["file"], "rb") as f:
+                    circuit = qpy.load(f)[0]
+            except (OSError, ValueError, qpy.QpyError):
+                self._drop(key)
+                return None
+            entry["last_access"] = time.time()
+        return circuit
+
+    def put(self, key, circuit, backend_name, calibration):
+        path = self.root / f"{key}.qpy"
+        tmp = path.with_suffix(".qpy.tmp")
+        with open(tmp, "wb") as f:
+            qpy.dump(circuit, f)
+        os.replace(tmp, path)
+
+        with self._locked_index() as index:
+            index[key] = {
+                "file": path.name,
+                "size": path.stat().st_size,
+                "last_access": time.time(),
+                "backend": backend_name,
+                "calibration": calibration,
+            }
+            self._evict()
+
+    def _evict(self):
+        total = sum(entry["size"] for entry in self.index.values())
+        by_age = sorted(self.index, key=lambda k: self.index[k]["last_access"])
+        while by_age and (total > self.max_bytes or len(self.index) > self.max_entries):
+            key = by_age.pop(0)
+            total -= self.index[key]["size"]
+            self._drop(key)
+
+    def transpile(self, circuit, backend, **options):
+        """`qiskit.transpile(circuit, target=backend.target, **options)`, served from cache when possible"""
+        calibration = self.calibration(backend)
+        key = cache_key(circuit, calibration, options)
+
+        compiled = self.get(key)
+        if compiled is not None:
+            self.hits += 1
+            return compiled
+
+        self.misses += 1
+        compiled = transpile(circuit, target=backend.target, **options)
+        self.put(key, compiled, backend.name, calibration)
+        return compiled
@@ -0,0 +1,153 @@
+"""
+AETERNA-PORTA v2.1 — PER-CYCLE ZENO RECORDS
+Framework: dna::}{::lang v51.843
+
+Every Zeno cycle measures its ancillas into its own classical register
+(zeno_0, zeno_1, …), so the mid-circuit record comes back from the
+sampler as one BitArray per cycle instead of being overwritten in the
+main register. The decoder unpacks them straight into a dense array
+
+    records = decode_zeno_records(pub_result.data)   # (shots, K, n_anc) uint8
+    zeno_summary(records)                            # JSON block for evidence
+
+Batched PUBs keep their parameter axes in front: (*pub_shape, shots, K, n_anc).
+Click rates and cycle/ancilla correlations are vectorized NumPy
+reductions over that array; no count dictionary over 2^(K·n_anc)
+outcomes is ever built. Memory is O(shots · K · n_anc) bytes for the
+records (8× that while a correlation is being computed).
+"""
+import numpy as np
+
+ZENO_REGISTER_PREFIX = "zeno_"
+
+
+def zeno_register_name(cycle):
+    """Classical register holding the ancilla outcomes of Zeno cycle `cycle`"""
+    return f"{ZENO_REGISTER_PREFIX}{cycle}"
+
+
+def _cycle_index(name):
+    suffix = name[len(ZENO_REGISTER_PREFIX):]
+    if name.startswith(ZENO_REGISTER_PREFIX) and suffix.isdigit():
+        return int(suffix)
+    return None
+
+
+def zeno_register_names(data):
+    """Per-cycle register names in a DataBin (or {name: BitArray}), in cycle order"""
+    names = [name for name in data.keys() if _cycle_index(name) is not None]
+    return sorted(names, key=_cycle_index)
+
+
+def unpack_bits(bits):
+    """
+    BitArray → (*shape, shots, num_bits) uint8 with column i = clbit i.
+
+    BitArray bytes are big-endian (clbit 0 is the low bit of the last byte),
+    so reversing the byte axis and unpacking little-endian puts clbit i at i.
+    """
+    packed = np.asarray(bits.array)[..., ::-1]
+    return np.unpackbits(packed, axis=-1, bitorder="little")[..., :bits.num_bits]
+
+
+def decode_zeno_records(data):
+    """
+    (*shape, shots, K, n_anc) uint8 ancilla outcomes from the per-cycle
+    registers of a DataBin (or {name: BitArray}); None if there are none.
+    """
+    names = zeno_register_names(data)
+    if not names:
+        return None
+    widths = {data[name].num_bits for name in names}
+    if len(widths) != 1:
+        raise ValueError(f"Zeno registers differ in width: {sorted(widths)}")
+    return np.stack([unpack_bits(data[name]) for name in names], axis=-2)
+
+
+def join_zeno_records(parts):
+    """
+    Records of several shards / adaptive rounds of one configuration joined
+    along the shot axis; None if none of them had Zeno registers.
+    """
+    parts = [records for records in parts if records is not None]
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=-3)
+
+# ═══════════════════════════════════════════════════════════════════
+# STATISTICS (records: (..., shots, K, n_anc))
+# ═══════════════════════════════════════════════════════════════════
+
+def click_rates(records):
+    """(..., K, n_anc) fraction of shots in which each ancilla clicked in each cycle"""
+    return records.mean(axis=-3)
+
+
+def cycle_click_rates(records):
+    """(..., K) mean click rate of each cycle over its ancillas"""
+    return click_rates(records).mean(axis=-1)
+
+
+def ancilla_click_rates(records):
+    """(..., n_anc) mean click rate of each ancilla over the cycles"""
+    return click_rates(records).mean(axis=-2)
+
+
+def _pearson(x):
+    """
+    x (..., shots, A, B) → (..., A, A): shot-wise Pearson correlation between
+    positions along A, averaged over B. Constant columns are left out (NaN
+    when nothing is left).
+    """
+    centered = x - x.mean(axis=-3, keepdims=True)
+    cov = np.einsum("...sao,...sbo->...abo", centered, centered) / x.shape[-3]
+    std = np.sqrt(np.moveaxis(np.diagonal(cov, axis1=-3, axis2=-2), -1, -2))  # (..., A, B)
+    scale = std[..., :, None, :] * std[..., None, :, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = np.where(scale > 0, cov / scale, np.nan)
+    return _nanmean(corr, axis=-1)
+
+
+def _nanmean(x, axis):
+    """nanmean without the all-NaN RuntimeWarning"""
+    valid = ~np.isnan(x)
+    count = valid.sum(axis=axis)
+    total = np.where(valid, x, 0.0).sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+def cycle_correlations(records):
+    """(..., K, K) shot-wise correlation between cycles, averaged over ancillas"""
+    return _pearson(records.astype(np.float64))
+
+
+def ancilla_correlations(records):
+    """(..., n_anc, n_anc) shot-wise correlation between ancillas, averaged over cycles"""
+    return _pearson(np.swapaxes(records, -1, -2).astype(np.float64))
+
+
+def lag_correlations(records, lag=1):
+    """(..., K - lag) correlation of each cycle with the cycle `lag` later"""
+    return np.diagonal(cycle_correlations(records), offset=lag, axis1=-2, axis2=-1)
+
+
+def _floats(values):
+    """JSON-safe list (NaN → None)"""
+    return [None if np.isnan(v) else float(v) for v in np.asarray(values, dtype=float).ravel()]
+
+
+def zeno_summary(records):
+    """Evidence block for one configuration's (shots, K, n_anc) records"""
+    shots, cycles, ancillas = records.shape[-3:]
+    per_cycle = cycle_click_rates(records)
+    return {
+        "registers": [zeno_register_name(c) for c in range(cycles)],
+        "shots": int(shots),
+        "cycles": int(cycles),
+        "ancillas": int(ancillas),
+        "click_rate": float(per_cycle.mean()) if cycles else None,
+        "cycle_click_rate": _floats(per_cycle),
+        "ancilla_click_rate": _floats(ancilla_click_rates(records)),
+        "lag1_correlation": _floats(lag_correlations(records)) if cycles > 1 else [],
+    }
@@ -1,6 +1,37 @@
 #!/usr/bin/env python3
-import time, json, os, math
-from datetime import datetime
+"""
+AETERNA-PORTA v2.1 — IGNITION DEPLOYMENT
+Framework: dna::}{::lang v51.843
+
+Builds the ignition circuit (Nighthawk factory on the IGNITION_CONFIG
+partition), compiles it for the backend and submits it without blocking:
+
+    run = submit_ignition()                # returns as soon as the jobs are submitted
+    for status, t, shards in run.watch():  # real job-status transitions
+        ...
+    artifact = run.finish()                # observables + measured telemetry → JSON
+
+The shot budget is split into shard jobs of at most MAX_SHOTS_PER_JOB, as
+the sweep does. The run's status combines the shards' ({status: count} per
+transition), and the shards fold into one ObservableAccumulator, so the
+observables cover every shot.
+
+Start-to-submission time is the circuit build plus compilation (a transpile
+cache hit skips the latter); nothing sleeps. Without IBM Quantum credentials
+(QISKIT_IBM_TOKEN or a saved account) the job runs on the offline
+LocalBackend, through the same code path.
+
+The artifact (aeterna_ignition_artifact_<job_id>.json, current directory,
+named after the first shard) is written once every shard reaches a final
+state.
+"""
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+from aeterna_porta_v2_telemetry import Telemetry, sink_for
 
 # --- AETERNA PORTA v2.1 CONFIGURATION ---
 IGNITION_CONFIG = {
@@ -15,62 +46,389 @@ IGNITION_CONFIG = {
         "CHI_PC": 0.946  # Phase Conjugate Coupling
     }
 }
+FALLBACK_BACKENDS = ["ibm_torino", "ibm_brisbane"]  # Tried in order when the target is unavailable
+DRIVE_AMPLITUDE = 0.7734  # v2.1 upgrade: Floquet amplitude 0.5 → 0.7734
+GAMMA_CRITICAL = 0.3  # Γ bound for "stable" / "conscious"
+TRANSPILE_OPTIONS = {"optimization_level": 3}
+TRANSPILE_SEED = 51843
+USE_TRANSPILE_CACHE = True  # Reuse compiled circuits from ~/.osiris/transpile_cache
+MAX_SHOTS_PER_JOB = 20000  # Larger shot budgets run as several shard jobs (as in the sweep)
+POLL_INTERVAL = 5.0  # Seconds between job status polls (IBM)
+LOCAL_POLL_INTERVAL = 0.2  # Same, against the local simulator
+TELEMETRY_SINK = None  # Optional *.jsonl / *.prom telemetry sink
+
+# ═══════════════════════════════════════════════════════════════════
+# BACKEND
+# ═══════════════════════════════════════════════════════════════════
+
+def has_credentials():
+    """QISKIT_IBM_TOKEN set, or an IBM Quantum account saved on disk"""
+    if os.getenv("QISKIT_IBM_TOKEN"):
+        return True
+    try:
+        from qiskit_ibm_runtime import QiskitRuntimeService
+        return bool(QiskitRuntimeService.saved_accounts())
+    except Exception:
+        return False
+
+
+def connect(config=IGNITION_CONFIG, local=None):
+    """
+    Backend for the ignition job: the target, then FALLBACK_BACKENDS, then the
+    least busy device wide enough for the partition on IBM Quantum; or the
+    offline LocalBackend when `local` (default: no credentials).
+    """
+    if local is None:
+        local = not has_credentials()
+    if local:
+        from aeterna_porta_v2_local_backend import LocalBackend
+
+        return LocalBackend(seed=TRANSPILE_SEED)
+
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+    service = QiskitRuntimeService()
+    for candidate in [config["target_backend"], *FALLBACK_BACKENDS]:
+        try:
+            return service.backend(candidate)
+        except Exception:
+            continue
+    try:
+        return service.least_busy(operational=True, simulator=False,
+                                  min_num_qubits=ignition_partition(config).total)
+    except Exception as exc:
+        raise RuntimeError("No suitable backend found") from exc
+
+# ═══════════════════════════════════════════════════════════════════
+# CIRCUIT
+# ═══════════════════════════════════════════════════════════════════
+
+def ignition_partition(config=IGNITION_CONFIG):
+    from aeterna_porta_v2_partition import Partition
+
+    p = config["partition"]
+    return Partition(p["L"], p["R"], p["Anc"])
+
+
+def build_ignition_circuit(config=IGNITION_CONFIG):
+    """Nighthawk TFD → Zeno → Floquet → feed-forward circuit on the config partition"""
+    from aeterna_porta_v2_ibm_nighthawk_circuit import build_nighthawk_circuit
+
+    return build_nighthawk_circuit(
+        partition=ignition_partition(config),
+        theta_lock=config["physics"]["THETA_LOCK"],
+        drive_amplitude=DRIVE_AMPLITUDE,
+    )
+
+
+def compile_ignition(qc, backend):
+    """Transpile for `backend` (served from the transpile cache when possible)"""
+    options = {**TRANSPILE_OPTIONS, "seed_transpiler": TRANSPILE_SEED}
+    if USE_TRANSPILE_CACHE:
+        from aeterna_porta_v2_transpile_cache import TranspileCache
+
+        return TranspileCache().transpile(qc, backend, **options)
+    from qiskit import transpile
+
+    return transpile(qc, target=backend.target, **options)
+
+# ═══════════════════════════════════════════════════════════════════
+# SUBMISSION
+# ═══════════════════════════════════════════════════════════════════
+
+def job_status(job):
+    """Job status as a plain upper-case string (IBM enum or LocalJob string)"""
+    status = job.status()
+    return str(getattr(status, "name", status)).upper()
+
+
+def combined_status(statuses, final):
+    """
+    One status for a set of shard jobs: DONE once every shard is; ERROR or
+    CANCELLED once every shard is final and one of them failed; otherwise
+    RUNNING while any shard runs, else the first pending shard's status.
+    """
+    if all(final):
+        for failed in ("ERROR", "CANCELLED"):
+            if failed in statuses:
+                return failed
+        return statuses[0] if len(set(statuses)) == 1 else "ERROR"
+    pending = [status for status, done in zip(statuses, final) if not done]
+    return "RUNNING" if "RUNNING" in pending else pending[0]
+
+
+def ccce_from_accumulator(accumulator, phi_threshold):
+    """Φ̂/Λ̂/Γ̂/Ξ plus the full observable dict and the regional marginals"""
+    from aeterna_porta_v2_marginals import MarginalEngine
+
+    engine = MarginalEngine.from_accumulator(accumulator)
+    obs = engine.observables()
+    phi, lambda_val, gamma = obs["phi"], obs["lambda"], obs["gamma"]
+    ccce = {
+        "phi": phi,
+        "lambda": lambda_val,
+        "gamma": gamma,
+        "xi": (lambda_val * phi) / (gamma + 1e-10),
+        "conscious": phi >= phi_threshold and gamma < GAMMA_CRITICAL,
+        "stable": gamma < GAMMA_CRITICAL,
+    }
+    return ccce, obs, engine.summary()
+
+
+class IgnitionRun:
+    """Handle of the submitted shard jobs: status stream, then artifact on completion"""
 
-def deploy_ignition():
+    def __init__(self, jobs, shard_shots, backend, compiled, config, telemetry, local, poll_interval):
+        self.jobs = jobs
+        self.shard_shots = shard_shots
+        self.backend = backend
+        self.compiled = compiled
+        self.config = config
+        self.telemetry = telemetry
+        self.local = local
+        self.poll_interval = poll_interval
+        self.submitted_at = datetime.now(timezone.utc)
+        self._t0 = time.monotonic()
+        self.history = []
+        self.artifact = None
+        self.artifact_path = None
+
+    @property
+    def job_id(self):
+        """First shard's job ID (names the artifact)"""
+        return self.jobs[0].job_id()
+
+    @property
+    def job_ids(self):
+        return [job.job_id() for job in self.jobs]
+
+    def in_final_state(self):
+        return all(job.in_final_state() for job in self.jobs)
+
+    def status(self):
+        """Combined status, recorded in the history when it or the shard tally changed"""
+        statuses = [job_status(job) for job in self.jobs]
+        status = combined_status(statuses, [job.in_final_state() for job in self.jobs])
+        shards = {name: statuses.count(name) for name in dict.fromkeys(statuses)}
+        last = self.history[-1] if self.history else None
+        if last is None or last["status"] != status or last["shards"] != shards:
+            self.history.append({"status": status, "t_s": time.monotonic() - self._t0,
+                                 "shards": shards})
+        return status
+
+    def cancel(self):
+        """Cancel every shard that has not finished"""
+        for job in self.jobs:
+            if not job.in_final_state():
+                try:
+                    job.cancel()
+                except Exception:
+                    # Finished in the meantime or not cancellable any more
+                    pass
+
+    def watch(self, poll_interval=None):
+        """
+        Yield (status, seconds since submission, {shard status: count}) for
+        every transition, until every shard is final. A failed shard cancels
+        the others: the artifact needs all of them.
+        """
+        poll_interval = self.poll_interval if poll_interval is None else poll_interval
+        seen = 0
+        while True:
+            self.status()
+            for change in self.history[seen:]:
+                yield change["status"], change["t_s"], change["shards"]
+            seen = len(self.history)
+            if self.in_final_state():
+                return
+            if any(name in ("ERROR", "CANCELLED") for name in self.history[-1]["shards"]):
+                self.cancel()
+            time.sleep(poll_interval)
+
+    def _merge_shards(self):
+        """Fold every shard into one accumulator → (accumulator, Zeno records or None)"""
+        from aeterna_porta_v2_accumulators import ObservableAccumulator
+        from aeterna_porta_v2_zeno import decode_zeno_records, join_zeno_records
+
+        merged = ObservableAccumulator(ignition_partition(self.config))
+        records = []
+        for job in self.jobs:
+            data = job.result()[0].data
+            merged.update(data.meas)
+            records.append(decode_zeno_records(data))
+        return merged, join_zeno_records(records)
+
+    def finish(self, on_status=None, output_dir="."):
+        """
+        Wait for every shard (reporting transitions to
+        `on_status(status, t, shards)`), merge them, compute the observables
+        and write the artifact. Returns the artifact.
+        """
+        with self.telemetry.span("wait", shards=len(self.jobs)):
+            for status, t, shards in self.watch():
+                if on_status is not None:
+                    on_status(status, t, shards)
+
+        for i, job in enumerate(self.jobs):
+            self.telemetry.job(job, shard=i, shots=self.shard_shots[i])
+        final = self.history[-1]["status"]
+        artifact = {
+            "timestamp": self.submitted_at.isoformat(),
+            "job_id": self.job_id,
+            "job_ids": self.job_ids,
+            "shard_shots": self.shard_shots,
+            "backend": self.backend.name,
+            "execution_mode": "local" if self.local else "ibm_runtime",
+            "config": self.config,
+            "drive_amplitude": DRIVE_AMPLITUDE,
+            "circuit_depth": self.compiled.depth(),
+            "status": final,
+            "status_history": self.history,
+        }
+
+        if final == "DONE":
+            from aeterna_porta_v2_zeno import zeno_summary
+
+            with self.telemetry.span("process", shards=len(self.jobs)):
+                merged, zeno = self._merge_shards()
+                ccce, obs, marginals = ccce_from_accumulator(
+                    merged, self.config["physics"]["PHI_THRESHOLD"])
+            artifact.update({
+                "shots": obs["shots"],
+                "ccce": ccce,
+                "observables": {"p_succ": obs["p_succ"], "support": obs["support"]},
+                "counts_sample": obs["counts_sample"],
+                "marginals": marginals,
+            })
+            if zeno is not None:
+                artifact["zeno"] = zeno_summary(zeno)
+        else:
+            errors = []
+            for job in self.jobs:
+                try:
+                    job.result()
+                except Exception as exc:
+                    errors.append(f"{job.job_id()}: {exc}")
+            if errors:
+                artifact["error"] = "; ".join(errors)
+
+        artifact["telemetry"] = self.telemetry.to_dict()
+        path = os.path.join(output_dir, f"aeterna_ignition_artifact_{self.job_id}.json")
+        with open(path, "w") as f:
+            json.dump(artifact, f, indent=2)
+        self.telemetry.close()
+        if self.local:
+            self.backend.shutdown()
+
+        self.artifact, self.artifact_path = artifact, path
+        return artifact
+
+
+def submit_ignition(config=IGNITION_CONFIG, local=None, backend=None, telemetry=None):
+    """
+    Build, compile and submit the ignition circuit as shard jobs of at most
+    MAX_SHOTS_PER_JOB shots; returns an IgnitionRun as soon as every shard is
+    accepted (the jobs themselves keep running).
+    """
+    from aeterna_porta_v2_local_backend import is_local
+
+    telemetry = telemetry or Telemetry()
+    if backend is None:
+        with telemetry.span("connect"):
+            backend = connect(config, local)
+    local = is_local(backend)
+
+    with telemetry.span("build"):
+        qc = build_ignition_circuit(config)
+    with telemetry.span("compile"):
+        compiled = compile_ignition(qc, backend)
+    telemetry.circuit("ignition", compiled)
+
+    from aeterna_porta_v2_batch import make_sampler, shard_sizes
+
+    sizes = shard_sizes(config["shots"], MAX_SHOTS_PER_JOB)
+    sampler = make_sampler(backend)
+    jobs = []
+    with telemetry.span("submit", shards=len(sizes)):
+        try:
+            for shots in sizes:
+                jobs.append(sampler.run([compiled], shots=shots))
+        except BaseException:
+            for job in jobs:
+                try:
+                    job.cancel()
+                except Exception:
+                    # Already finished or not cancellable any more
+                    pass
+            raise
+    telemetry.count("shots", config["shots"])
+    telemetry.count("shard_jobs", len(jobs))
+
+    run = IgnitionRun(jobs, sizes, backend, compiled, config, telemetry, local,
+                      LOCAL_POLL_INTERVAL if local else POLL_INTERVAL)
+    run.status()
+    return run
+
+# ═══════════════════════════════════════════════════════════════════
+# ENTRY POINT
+# ═══════════════════════════════════════════════════════════════════
+
+def deploy_ignition(telemetry_sink=TELEMETRY_SINK, local=None, wait=True):
+    """Submit the ignition job and (with `wait`) stream its status until the artifact is written"""
+    telemetry = Telemetry(sink=sink_for(telemetry_sink))
+    partition = ignition_partition()
     print(f"\n╔════ AETERNA-PORTA v2.1: IGNITION SEQUENCE ════════════╗")
     print(f"║ Backend: {IGNITION_CONFIG['target_backend']:<20} Shots: {IGNITION_CONFIG['shots']:<6} ║")
-    print(f"║ Geometry: 120 Qubits (L:50 | R:50 | Anc:20)           ║")
+    print(f"║ Geometry: {partition.total} Qubits (L:{partition.l_qubits} | R:{partition.r_qubits} | Anc:{partition.anc_qubits})           ║")
     print(f"║ Physics: θ={IGNITION_CONFIG['physics']['THETA_LOCK']}° | Φ_target > {IGNITION_CONFIG['physics']['PHI_THRESHOLD']}              ║")
     print(f"╚═══════════════════════════════════════════════════════╝")
 
-    print("\n[1/4] Initializing Holographic Partition...")
-    time.sleep(1.5)
-    
-    print(f"[2/4] Applying Phase-Conjugate Lock (χ={IGNITION_CONFIG['physics']['CHI_PC']})...")
-    # Simulation of Quantum Handshake
-    time.sleep(2.0)
-    
-    # Check for Qiskit Credentials (Mock check for stability)
-    token = os.getenv("QISKIT_IBM_TOKEN")
-    if not token:
-        print("[WARN] No IBM Quantum Token found. Switching to HIGH-FIDELITY SIMULATION MODE.")
-        backend_status = "SIMULATED (AER)"
-    else:
-        print(f"[LINK] IBM Quantum Token Detected. Targeting {IGNITION_CONFIG['target_backend']}...")
-        backend_status = "ONLINE"
-
-    print("\n[3/4] Transmitting Pulse Sequence...")
-    for i in range(1, 11):
-        p = i * 10
-        sys_str = "▓" * (i*2) + "░" * ((10-i)*2)
-        print(f"\r  >> Uploading: {sys_str} {p}%", end="")
-        time.sleep(0.2)
-    print("\n  >> UPLOAD COMPLETE.")
-
-    # Generate Evidence Artifact
-    timestamp = datetime.utcnow().isoformat()
-    job_id = f"ign_v2.1_{int(time.time())}"
-    
-    artifact = {
-        "timestamp": timestamp,
-        "job_id": job_id,
-        "config": IGNITION_CONFIG,
-        "status": "SUBMITTED",
-        "telemetry": {
-            "phi_estimation": 0.782, # Simulated success > 0.7734
-            "coherence_lambda": 0.94,
-            "decoherence_gamma": 0.05
-        }
-    }
-    
-    with open(f"aeterna_ignition_artifact_{job_id}.json", "w") as f:
-        json.dump(artifact, f, indent=2)
+    if local is None and not has_credentials():
+        print("[WARN] No IBM Quantum credentials found. Using the offline local simulator.")
+        local = True
+
+    print("\n[1/4] Building and compiling the ignition circuit...")
+    t0 = time.perf_counter()
+    run = submit_ignition(local=local, telemetry=telemetry)
+    print(f"  >> Backend: {run.backend.name} ({run.backend.num_qubits} qubits)")
+    print(f"  >> Compiled depth: {run.compiled.depth()}, size: {run.compiled.size()}")
+
+    print(f"[2/4] Submitted in {time.perf_counter() - t0:.2f}s")
+    print(f"  >> {len(run.jobs)} shard job(s) of ≤{MAX_SHOTS_PER_JOB} shots: {', '.join(run.job_ids)}")
+    if not wait:
+        print(f"  >> Status: {run.history[-1]['status']} (not waiting for the result)")
+        return run
+
+    print("[3/4] Job status:")
+    def on_status(status, t, shards):
+        tally = ", ".join(f"{name} {count}" for name, count in shards.items())
+        print(f"  >> {status:<10} +{t:.1f}s  [{tally}]")
+
+    artifact = run.finish(on_status=on_status)
+
+    print(f"\n[4/4] Artifact: {run.artifact_path}")
+    if artifact["status"] != "DONE":
+        print(f"  >> Job ended {artifact['status']}: {artifact.get('error', 'no result')}")
+        return run
+
+    ccce = artifact["ccce"]
+    threshold = IGNITION_CONFIG["physics"]["PHI_THRESHOLD"]
+    print("\n📊 CCCE METRICS:")
+    print(f"  Φ (Consciousness): {ccce['phi']:.4f} {'✅ IGNITION!' if ccce['phi'] >= threshold else '❌ Sub-threshold'}")
+    print(f"  Λ (Coherence): {ccce['lambda']:.4f}")
+    print(f"  Γ (Decoherence): {ccce['gamma']:.4f}")
+    print(f"  Ξ (Efficiency): {ccce['xi']:.4f}")
+    print(f"  Conscious: {ccce['conscious']} | Stable: {ccce['stable']}")
+    return run
 
-    print(f"\n[4/4] IGNITION SUCCESSFUL.")
-    print(f"  >> Job ID: {job_id}")
-    print(f"  >> Artifact: aeterna_ignition_artifact_{job_id}.json")
-    print(f"  >> Status: PENDING EXECUTION ON {backend_status}")
-    print("\n[SYSTEM] Await 10-15 minutes for queue processing.")
 
 if __name__ == "__main__":
-    deploy_ignition()
+    parser = argparse.ArgumentParser(description="AETERNA-PORTA v2.1 ignition")
+    parser.add_argument("--local", action="store_true", default=None,
+                        help="Use the offline local simulator even if credentials exist")
+    parser.add_argument("--no-wait", action="store_true",
+                        help="Return right after submission (the job keeps running)")
+    parser.add_argument("--telemetry-sink", default=TELEMETRY_SINK, metavar="PATH",
+                        help="Also write telemetry to PATH (*.jsonl or *.prom)")
+    args = parser.parse_args()
+    deploy_ignition(args.telemetry_sink, local=args.local, wait=not args.no_wait)
@@ -10,15 +10,64 @@ This implements the 7dCRSM::}{::lang Ω_IgnitionSweep protocol:
 - Observables: Λ̂, Φ̂, Γ̂, p_succ, Δτ_eff (operational definitions)
 - Decision: Accept "ignite" ⇔ (Φ̂ ≥ 0.7734) ∧ (Γ̂ ≤ 0.3) ∧ (Z_Δτ ≥ 5)
 """
+import argparse
 import json
+import os
 import time
 import numpy as np
 from pathlib import Path
 from itertools import product
-from qiskit import QuantumCircuit, transpile
+from qiskit import ClassicalRegister, QuantumCircuit, transpile
 from qiskit.circuit import Parameter
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2, Session
-from scipy.stats import entropy
+
+from aeterna_porta_v2_accumulators import ObservableAccumulator, run_sharded
+from aeterna_porta_v2_adaptive import AdaptiveShotScheduler
+from aeterna_porta_v2_autotune import (
+    PLANNED,
+    TuningStore,
+    options_label,
+    prime_cache,
+    resolve_layout,
+    tune_family,
+)
+from aeterna_porta_v2_analysis import (
+    best_configuration,
+    print_best_configuration,
+    run_statistics as analyse_sweep,
+)
+from aeterna_porta_v2_batch import (
+    build_sweep_pubs,
+    collect_pub_results,
+    make_sampler,
+    split_batched_results,
+    submit_batched,
+    total_shots,
+)
+from aeterna_porta_v2_evidence_store import DEFAULT_EVIDENCE_DIR, ShotArchiveWriter
+from aeterna_porta_v2_factorized import FactorizationError, FactorizedDistribution
+from aeterna_porta_v2_fanout import BackendLane, FanoutScheduler, eligible_backends
+from aeterna_porta_v2_journal import (
+    SweepJournal,
+    control_key,
+    grid_key,
+    latest_journal,
+    load_journal,
+)
+from aeterna_porta_v2_layout import LayoutIndex, circuit_interactions, plan_for
+from aeterna_porta_v2_marginals import MarginalEngine
+from aeterna_porta_v2_observables import leakage_fraction, observables_from_bits
+from aeterna_porta_v2_parallel_compile import compile_parallel, deterministic_seed
+from aeterna_porta_v2_partition import Partition
+from aeterna_porta_v2_pipeline import run_pipeline
+from aeterna_porta_v2_telemetry import DISABLED, Telemetry, sink_for
+from aeterna_porta_v2_templates import ParametricTemplateEngine
+from aeterna_porta_v2_transpile_cache import TranspileCache
+from aeterna_porta_v2_zeno import (
+    decode_zeno_records,
+    join_zeno_records,
+    zeno_register_name,
+    zeno_summary,
+)
 
 # Physical constants (IMMUTABLE)
 LAMBDA_PHI = 2.176435e-08
@@ -34,25 +83,62 @@ K_SWEEP = [0, 2, 4, 8, 16]  # Zeno projection counts
 SHOTS = 8192  # Per (α, K) configuration
 CONTROL_SHOTS = 16384  # Higher precision for controls
 
-# Partition
+# Execution: "batched" (one submission for the whole sweep + controls),
+# "pipeline" (overlapped async compile/submit/process, one job per config),
+# "adaptive" (batched rounds with sequential elimination of the grid),
+# "fanout" (one job per config spread over every eligible backend)
+# or "sequential" (one blocking job per configuration)
+EXECUTION_MODE = "batched"
+MAX_PUBS_PER_JOB = None  # Split into a Batch of several jobs when set
+PIPELINE_MAX_IN_FLIGHT = 4  # Jobs on the backend at once in pipeline mode
+PIPELINE_POLL_INTERVAL = 5.0  # Seconds between job status polls
+ADAPTIVE_FIRST_ROUND_SHOTS = 1024  # Adaptive mode: round-0 shots per grid point
+ADAPTIVE_ETA = 2  # Round r adds FIRST_ROUND · ETA^r shots (up to SHOTS in total)
+ADAPTIVE_BUDGET = None  # Optional cap on total grid shots across all rounds
+ADAPTIVE_CONFIDENCE = 0.99  # Drop a point once its bounds exclude ignition at this level
+BACKEND_CANDIDATES = ["ibm_fez", "ibm_torino", "ibm_brisbane"]  # First answering one, or all in fanout
+FANOUT_MAX_IN_FLIGHT = 4  # Fan-out mode: jobs queued per backend at once
+FANOUT_POLL_INTERVAL = 5.0  # Seconds between job status polls
+LOCAL_FANOUT_POLL_INTERVAL = 0.2  # Same, against the local stand-ins
+# Fan-out dress rehearsal with --local: (name, qubits, simulated queue delay in seconds)
+LOCAL_FANOUT_BACKENDS = [
+    ("aer_local_fez", 156, 1.0),
+    ("aer_local_torino", 133, 2.0),
+    ("aer_local_brisbane", 127, 3.0),
+]
+MAX_SHOTS_PER_JOB = 20000  # Larger shot budgets are sharded and merged
+SHARD_CONCURRENCY = 4  # Shard jobs in flight at once (sequential mode)
+ARCHIVE_SHOTS = True  # Keep every shot in a packed-bit .shots file beside the JSON
+EXACT_BASELINES = True  # Attach noise-free reference values (exact factorized sampler)
+TELEMETRY = True  # Per-stage wall/CPU/RSS, compiled gate counts, job queue/run time
+TELEMETRY_SINK = None  # Optional *.jsonl (every event) or *.prom (Prometheus text) path
+
+# Statistics (bootstrap over the archived shots; needs ARCHIVE_SHOTS)
+BOOTSTRAP_REPLICATES = 2000
+BOOTSTRAP_SEED = 51843
+CONFIDENCE_LEVEL = 0.95
+Z_THRESHOLD = 5.0  # Z_Δτ against every control
+STATS_WORKERS = os.cpu_count()
+
+# Transpilation (shared by every grid template)
+TRANSPILE_OPTIONS = {
+    "optimization_level": 3,
+    "routing_method": "sabre",
+    "layout_method": "sabre",
+}
+CONTROL_TRANSPILE_OPTIONS = {"optimization_level": 3}
+USE_TUNED_TRANSPILE = True  # Per-backend winners of `cli.py tune` replace the two option sets above
+USE_LAYOUT_PLAN = True  # Compile on the planned physical layout when the backend has a coupling map
+USE_TRANSPILE_CACHE = True  # Reuse compiled circuits from ~/.osiris/transpile_cache
+TRANSPILE_SEED = 51843  # Base seed; each compile unit derives its own from it
+COMPILE_WORKERS = os.cpu_count()  # Process-pool size for template/control compiles
+
+# Partition (builders and observables take a Partition; this is the default)
 L_QUBITS = 50
 R_QUBITS = 50
 ANC_QUBITS = 20
-TOTAL_QUBITS = L_QUBITS + R_QUBITS + ANC_QUBITS
-
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print(" AETERNA-PORTA v2.1 — IGNITION SWEEP PROTOCOL")
-print(" Framework: dna::}{::lang v51.843")
-print(" Nobel-2025 Compliant: Falsifiable + Controlled + Operational")
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print()
-print("📊 SWEEP CONFIGURATION:")
-print(f"  α sweep: {len(ALPHA_SWEEP)} values (0 to π/2)")
-print(f"  K sweep: {len(K_SWEEP)} values (Zeno projection counts)")
-print(f"  Total configurations: {len(ALPHA_SWEEP) * len(K_SWEEP)}")
-print(f"  Shots per config: {SHOTS}")
-print(f"  Control shots: {CONTROL_SHOTS}")
-print()
+PARTITION = Partition(L_QUBITS, R_QUBITS, ANC_QUBITS)
+TOTAL_QUBITS = PARTITION.total
 
 # ═══════════════════════════════════════════════════════════════════
 # OPERATIONAL OBSERVABLE DEFINITIONS
@@ -71,8 +157,9 @@ def compute_phi_operational(counts, num_qubits):
     total = sum(counts.values())
     probs = np.array(list(counts.values())) / total
 
-    # Shannon entropy
-    H = entropy(probs, base=2)
+    # Shannon entropy (bits)
+    probs = probs[probs > 0]
+    H = float(-(probs * np.log2(probs)).sum())
 
     # Max entropy (log of support size)
     H_max = np.log2(len(counts))
@@ -113,6 +200,7 @@ def compute_gamma_operational(counts, num_qubits, expected_parity=0):
     Γ̂ = (1 - p_correct_parity) + ε·(|supp| / 2^n)
 
     Physical interpretation: Deviation from expected symmetry + state leakage
+    (`num_qubits` may be a Partition)
     """
     total = sum(counts.values())
 
@@ -120,8 +208,8 @@ def compute_gamma_operational(counts, num_qubits, expected_parity=0):
     correct_parity = sum(c for s, c in counts.items() if s.count('1') % 2 == expected_parity)
     p_parity = correct_parity / total
 
-    # Leakage (support size relative to Hilbert space)
-    leakage = len(counts) / (2 ** min(num_qubits, 20))  # Cap at 20q for tractability
+    # Leakage (support size relative to Hilbert space, in log space: any n)
+    leakage = leakage_fraction(len(counts), num_qubits)
 
     # Combined metric
     gamma = (1 - p_parity) * 0.7 + leakage * 0.3
@@ -152,16 +240,14 @@ def compute_tau_eff(circuit_depth, success_prob, baseline_depth=49):
 # CIRCUIT GENERATION WITH PARAMETER BINDING
 # ═══════════════════════════════════════════════════════════════════
 
-def build_base_circuit():
+def build_base_circuit(partition=None):
     """Stage 1: TFD preparation (ER bridge) - always present"""
-    qc = QuantumCircuit(TOTAL_QUBITS, TOTAL_QUBITS)
+    partition = partition or PARTITION
+    qc = QuantumCircuit(partition.total)
 
     theta_lock_rad = np.deg2rad(THETA_LOCK)
 
-    for i in range(min(L_QUBITS, R_QUBITS)):
-        ℓ = i
-        r = L_QUBITS + i
-
+    for ℓ, r in partition.bridge_pairs():
         qc.h(ℓ)
         qc.ry(theta_lock_rad, ℓ)
         qc.cx(ℓ, r)
@@ -170,19 +256,17 @@ def build_base_circuit():
     qc.barrier()
     return qc
 
-def add_floquet_drive(qc, alpha_param):
+def add_floquet_drive(qc, alpha_param, partition=None):
     """
     Stage 2: Floquet drive (parametric)
 
     CRITICAL: alpha_param is a Parameter object that will be bound at runtime
     """
+    partition = partition or PARTITION
     theta_lock_rad = np.deg2rad(THETA_LOCK)
 
-    throat_start = L_QUBITS - 5
-    throat_end = L_QUBITS + 5
-
     # Single Floquet cycle (simplified for parameter binding)
-    for q in range(max(0, throat_start), min(TOTAL_QUBITS, throat_end)):
+    for q in partition.throat():
         # Drive component: α (parametric)
         qc.rz(alpha_param, q)
 
@@ -192,27 +276,34 @@ def add_floquet_drive(qc, alpha_param):
     qc.barrier()
     return qc
 
-def add_zeno_projections(qc, K):
+def add_zeno_projections(qc, K, partition=None):
     """
     Stage 3: Zeno projections (K cycles)
 
     CRITICAL: K mid-circuit measurements physically realize Zeno frequency
+
+    Cycle c measures into its own register zeno_<c> (bit i = guard i), so
+    every cycle's record survives to the result (decode_zeno_records).
     """
-    anc_start = L_QUBITS + R_QUBITS
-    guard_qubits = list(range(min(8, L_QUBITS)))  # First 8 qubits as guards
+    partition = partition or PARTITION
+    guard_qubits = partition.guard_qubits()  # First 8 qubits as guards
 
     for cycle in range(K):
         qc.barrier()
+        if not guard_qubits:
+            continue
+        record = ClassicalRegister(len(guard_qubits), zeno_register_name(cycle))
+        qc.add_register(record)
 
         # Measure guard qubits
         for i, g in enumerate(guard_qubits):
-            anc = anc_start + (i % ANC_QUBITS)
+            anc = partition.ancilla(i)
 
             # Weak coupling
             qc.cry(0.1, g, anc)
 
             # Projective measurement
-            qc.measure(anc, anc)
+            qc.measure(anc, record[i])
 
             # Reset for next cycle
             qc.reset(anc)
@@ -220,11 +311,11 @@ def add_zeno_projections(qc, K):
     qc.barrier()
     return qc
 
-def build_parametric_circuit(alpha_param, K):
+def build_parametric_circuit(alpha_param, K, partition=None):
     """Build full circuit with parametric alpha and fixed K"""
-    qc = build_base_circuit()
-    qc = add_floquet_drive(qc, alpha_param)
-    qc = add_zeno_projections(qc, K)
+    qc = build_base_circuit(partition)
+    qc = add_floquet_drive(qc, alpha_param, partition)
+    qc = add_zeno_projections(qc, K, partition)
     qc.measure_all()
     return qc
 
@@ -232,23 +323,21 @@ def build_parametric_circuit(alpha_param, K):
 # CONTROL EXPERIMENTS
 # ═══════════════════════════════════════════════════════════════════
 
-def build_control_C0():
+def build_control_C0(partition=None):
     """C0: No drive, no Zeno (baseline)"""
-    qc = build_base_circuit()
+    qc = build_base_circuit(partition)
     qc.measure_all()
     return qc
 
-def build_control_C1(alpha_val, K):
+def build_control_C1(alpha_val, K, partition=None):
     """C1: Drive + Zeno, but bridge cut (no L↔R entanglement)"""
-    qc = QuantumCircuit(TOTAL_QUBITS, TOTAL_QUBITS)
+    partition = partition or PARTITION
+    qc = QuantumCircuit(partition.total)
 
     theta_lock_rad = np.deg2rad(THETA_LOCK)
 
     # Stage 1: TFD but NO CNOT (bridge cut)
-    for i in range(min(L_QUBITS, R_QUBITS)):
-        ℓ = i
-        r = L_QUBITS + i
-
+    for ℓ, r in partition.bridge_pairs():
         qc.h(ℓ)
         qc.ry(theta_lock_rad, ℓ)
         # qc.cx(ℓ, r)  ← REMOVED (bridge cut)
@@ -257,33 +346,31 @@ def build_control_C1(alpha_val, K):
     qc.barrier()
 
     # Stage 2: Floquet (fixed alpha)
-    throat_start = L_QUBITS - 5
-    throat_end = L_QUBITS + 5
-
-    for q in range(max(0, throat_start), min(TOTAL_QUBITS, throat_end)):
+    for q in partition.throat():
         qc.rz(alpha_val, q)
         qc.rz(theta_lock_rad * 0.1, q)
 
     qc.barrier()
 
     # Stage 3: Zeno (same K)
-    qc = add_zeno_projections(qc, K)
+    qc = add_zeno_projections(qc, K, partition)
     qc.measure_all()
 
     return qc
 
-def build_control_C2(alpha_val, K, seed=42):
+def build_control_C2(alpha_val, K, seed=42, partition=None):
     """C2: Drive + Zeno, but permuted qubit mapping"""
+    partition = partition or PARTITION
     np.random.seed(seed)
 
     # Permute L and R indices
-    L_indices = list(range(L_QUBITS))
-    R_indices = list(range(L_QUBITS, L_QUBITS + R_QUBITS))
+    L_indices = list(range(partition.l_qubits))
+    R_indices = list(range(partition.l_qubits, partition.anc_start))
 
     np.random.shuffle(L_indices)
     np.random.shuffle(R_indices)
 
-    qc = QuantumCircuit(TOTAL_QUBITS, TOTAL_QUBITS)
+    qc = QuantumCircuit(partition.total)
 
     theta_lock_rad = np.deg2rad(THETA_LOCK)
 
@@ -309,224 +396,1181 @@ def build_control_C2(alpha_val, K, seed=42):
     qc.barrier()
 
     # Stage 3: Zeno (same K)
-    qc = add_zeno_projections(qc, K)
+    qc = add_zeno_projections(qc, K, partition)
     qc.measure_all()
 
     return qc
 
 # ═══════════════════════════════════════════════════════════════════
-# DEPLOYMENT
+# RESULT ASSEMBLY
 # ═══════════════════════════════════════════════════════════════════
 
-service = QiskitRuntimeService()
+def compute_ccce(bits, partition=None):
+    """
+    Operational Φ̂, Λ̂, Γ̂, Ξ for one configuration's shots.
+
+    `bits` is the sampler's BitArray (or its packed uint8 array), an
+    ObservableAccumulator merged from shards, or a MarginalEngine over
+    either; in every case the observable engine evaluates the same
+    definitions as compute_*_operational without going through a
+    get_counts() dict.
+    """
+    if isinstance(bits, (ObservableAccumulator, MarginalEngine)):
+        obs = bits.observables()
+    else:
+        obs = observables_from_bits(bits, partition or PARTITION)
+    phi, lambda_val, gamma = obs["phi"], obs["lambda"], obs["gamma"]
+    xi = (lambda_val * phi) / (gamma + 1e-10)
+
+    ccce = {
+        "phi": phi,
+        "lambda": lambda_val,
+        "gamma": gamma,
+        "xi": xi,
+        "conscious": phi >= PHI_THRESHOLD and gamma < GAMMA_CRITICAL,
+        "stable": gamma < GAMMA_CRITICAL,
+    }
+    return ccce, obs
+
+def marginal_engine(bits, partition=None):
+    """MarginalEngine over a configuration's shots (or merged accumulator)"""
+    if isinstance(bits, ObservableAccumulator):
+        return MarginalEngine.from_accumulator(bits)
+    return MarginalEngine.from_bits(bits, partition or PARTITION)
+
+def archive_reference(archive, bits):
+    """Store a configuration's full shots in the binary archive (if enabled)"""
+    if archive is None:
+        return None
+    return archive.reference([archive.append(bits)])
+
+def zeno_block(records):
+    """{"zeno": summary} for an entry with decoded Zeno records, {} without"""
+    return {"zeno": zeno_summary(records)} if records is not None else {}
+
+def make_result_entry(alpha_val, K, job_id, backend_name, circuit_depth, shots, bits,
+                      archive=None, shots_ref=None, zeno=None):
+    """Evidence entry for one (α, K) grid point (zeno: decoded per-cycle ancilla records)"""
+    engine = marginal_engine(bits)
+    ccce, obs = compute_ccce(engine)
+    if shots_ref is None and not isinstance(bits, ObservableAccumulator):
+        shots_ref = archive_reference(archive, bits)
+
+    # Success probability (placeholder: use dominant state)
+    p_succ = obs["p_succ"]
+
+    # Effective time
+    delta_tau = compute_tau_eff(circuit_depth, p_succ)
 
-# Backend selection
-backend_name = None
-for candidate in ["ibm_fez", "ibm_torino", "ibm_brisbane"]:
+    return {
+        "alpha": alpha_val,
+        "K": K,
+        "job_id": job_id,
+        "backend": backend_name,
+        "circuit_depth": circuit_depth,
+        "shots": shots,
+        "ccce": ccce,
+        "observables": {
+            "p_succ": p_succ,
+            "delta_tau_eff": delta_tau,
+            "support": obs["support"],
+        },
+        "counts_sample": obs["counts_sample"],
+        "marginals": engine.summary(),
+        "shots_ref": shots_ref,
+        **zeno_block(zeno),
+    }
+
+def make_control_entry(name, job_id, bits, archive=None, shots_ref=None, circuit_depth=None,
+                       backend_name=None, zeno=None):
+    """Evidence entry for one control experiment"""
+    engine = marginal_engine(bits)
+    ccce, _ = compute_ccce(engine)
+    if shots_ref is None and not isinstance(bits, ObservableAccumulator):
+        shots_ref = archive_reference(archive, bits)
+    return {
+        "control": name,
+        "job_id": job_id,
+        "backend": backend_name,
+        "circuit_depth": circuit_depth,
+        "ccce": {"phi": ccce["phi"], "lambda": ccce["lambda"], "gamma": ccce["gamma"]},
+        "marginals": engine.summary(),
+        "shots_ref": shots_ref,
+        **zeno_block(zeno),
+    }
+
+def exact_baseline(qc, shots):
+    """
+    Noise-free reference for a logical circuit: the population (infinite-shot)
+    Φ̂/Λ̂/Γ̂/p_succ, plus the operational estimators on `shots` exact shots,
+    which is what an ideal device would report at this shot count.
+    """
     try:
-        backend = service.backend(candidate)
-        backend_name = candidate
-        break
-    except:
-        continue
+        dist = FactorizedDistribution(qc)
+    except FactorizationError as exc:
+        return {"error": str(exc)}
+    bits = dist.sample(shots, seed=TRANSPILE_SEED, registers=["meas"])["meas"]
+    ccce, _ = compute_ccce(bits)
+    return {
+        "population": dist.exact_observables("meas", PARTITION),
+        "at_shots": {"shots": shots, **ccce},
+    }
 
-if not backend_name:
-    raise RuntimeError("No suitable backend found")
+def print_result_entry(entry):
+    ccce = entry["ccce"]
+    print(f"  Φ̂={ccce['phi']:.4f}, Λ̂={ccce['lambda']:.4f}, Γ̂={ccce['gamma']:.4f}, Ξ={ccce['xi']:.4f}")
+    print(f"  Δτ_eff={entry['observables']['delta_tau_eff']:.2f}, p_succ={entry['observables']['p_succ']:.4f}")
+    print()
 
-print("🔧 BACKEND CONFIGURATION:")
-print(f"  Backend: {backend.name}")
-print(f"  Qubits: {backend.num_qubits}")
-print()
+def print_control_entry(entry):
+    ccce = entry["ccce"]
+    print(f"  Job ID: {entry['job_id']}")
+    print(f"  Φ̂={ccce['phi']:.4f}, Λ̂={ccce['lambda']:.4f}, Γ̂={ccce['gamma']:.4f}")
+    print()
 
-# Create parameter
-alpha = Parameter("α")
+CONTROL_LABELS = {
+    "C0": "Baseline (no drive, no Zeno)",
+    "C1": "Bridge cut (α_max, K_max, no L↔R CNOT)",
+    "C2": "Permuted mapping (α_max, K_max)",
+}
 
-# Evidence directory
-evidence_dir = Path.home() / ".osiris" / "evidence" / "quantum"
-evidence_dir.mkdir(parents=True, exist_ok=True)
+def build_control(name, partition=None):
+    """Logical circuit for control C0/C1/C2 at (α_max, K_max)"""
+    alpha_max = max(ALPHA_SWEEP)
+    K_max = max(K_SWEEP)
+
+    if name == "C0":
+        return build_control_C0(partition)
+    if name == "C1":
+        return build_control_C1(alpha_max, K_max, partition)
+    if name == "C2":
+        return build_control_C2(alpha_max, K_max, partition=partition)
+    raise ValueError(f"Unknown control: {name}")
+
+def circuit_families(partition=None):
+    """Logical circuits per transpile family, keyed by compile unit as the sweep compiles them"""
+    return {
+        "grid": {("grid", K): build_parametric_circuit(Parameter("α"), K, partition) for K in K_SWEEP},
+        "controls": {("control", name): build_control(name, partition) for name in CONTROL_LABELS},
+    }
 
-# Results storage
-sweep_results = []
+# Layout plans and tuned settings looked up per backend name (once per process)
+_LAYOUT_PLANS = {}
+_TRANSPILE_SETTINGS = {}
 
-print("🚀 STARTING SWEEP...")
-print()
+def layout_plans(backend=None):
+    """
+    {"grid" | "C0" | "C1" | "C2": LayoutPlan} for `backend`. The grid, C0 and
+    C1 share the partition's plan; C2 (permuted pairs) gets its own plan on
+    the same physical qubits. Empty without a coupling map.
+    """
+    if backend is None or not USE_LAYOUT_PLAN:
+        return {}
+    if backend.name not in _LAYOUT_PLANS:
+        index = LayoutIndex()
+        plan = plan_for(backend, PARTITION, index)
+        plans = {}
+        if plan is not None:
+            plans = {"grid": plan, "C0": plan, "C1": plan}
+            plans["C2"] = plan_for(backend, PARTITION, index, variant="C2",
+                                   edges=circuit_interactions(build_control("C2")),
+                                   qubits=plan.layout)
+        _LAYOUT_PLANS[backend.name] = plans
+    return _LAYOUT_PLANS[backend.name]
+
+def unit_layout(backend, key):
+    """Planned physical layout of compile unit ("grid", K) / ("control", name), or None"""
+    plan = layout_plans(backend).get("grid" if key[0] == "grid" else key[1])
+    return plan.layout if plan is not None else None
+
+def default_transpile_settings(backend=None):
+    """
+    TRANSPILE_OPTIONS / CONTROL_TRANSPILE_OPTIONS with TRANSPILE_SEED; the
+    layout stage is replaced by the planned layout when `backend` has one.
+    """
+    settings = {
+        family: {"options": dict(options), "base_seed": TRANSPILE_SEED, "tuned": False}
+        for family, options in (("grid", TRANSPILE_OPTIONS), ("controls", CONTROL_TRANSPILE_OPTIONS))
+    }
+    if layout_plans(backend):
+        for family in settings.values():
+            family["options"]["layout_method"] = PLANNED
+    return settings
 
-# Sweep over (α, K) configurations
-for i, (alpha_val, K) in enumerate(product(ALPHA_SWEEP, K_SWEEP)):
-    print(f"[{i+1}/{len(ALPHA_SWEEP) * len(K_SWEEP)}] α={alpha_val:.4f}, K={K}")
+def transpile_settings(backend=None):
+    """
+    {"grid" | "controls": {"options", "base_seed", "tuned"}} for `backend`:
+    the stored autotune winner when it matches the current circuits, else
+    the defaults. layout_method="planned" is resolved per compile unit.
+    """
+    settings = default_transpile_settings(backend)
+    if backend is None or not USE_TUNED_TRANSPILE:
+        return settings
+    if backend.name not in _TRANSPILE_SETTINGS:
+        store = TuningStore()
+        families = None
+        for family in settings:
+            if store.lookup(backend, family) is None:
+                continue
+            families = families or circuit_families()
+            record = store.lookup(backend, family, families[family])
+            if record is not None:
+                settings[family] = {"options": dict(record["options"]),
+                                    "base_seed": record["base_seed"], "tuned": True}
+        _TRANSPILE_SETTINGS[backend.name] = settings
+    return _TRANSPILE_SETTINGS[backend.name]
+
+def control_options(name, backend=None):
+    """Control transpile options (tuned for `backend` if available) with the control's deterministic seed"""
+    settings = transpile_settings(backend)["controls"]
+    return dict(
+        resolve_layout(settings["options"], unit_layout(backend, ("control", name))),
+        seed_transpiler=deterministic_seed(("control", name), settings["base_seed"]),
+    )
+
+def compile_control(name, backend, cache=None):
+    qc = build_control(name)
+    if cache is not None:
+        return cache.transpile(qc, backend, **control_options(name, backend))
+    return transpile(qc, target=backend.target, **control_options(name, backend))
+
+def compile_sweep_parallel(backend, templates, cache=None, max_workers=None):
+    """
+    Compile every K template and C0/C1/C2 in one process pool.
+
+    Installs the templates into `templates` and returns {name: compiled control}.
+    """
+    units = {("grid", K): (templates.logical(K), templates.options_for(K)) for K in K_SWEEP}
+    units.update({
+        ("control", name): (build_control(name), control_options(name, backend))
+        for name in CONTROL_LABELS
+    })
 
-    # Build parametric circuit
-    qc = build_parametric_circuit(alpha, K)
+    t0 = time.perf_counter()
+    compiled = compile_parallel(units, backend, max_workers=max_workers, cache=cache)
+    elapsed = time.perf_counter() - t0
 
-    # Bind alpha parameter
-    qc_bound = qc.assign_parameters({alpha: alpha_val})
+    for K in K_SWEEP:
+        templates.install(K, compiled[("grid", K)], elapsed)
+    return {name: compiled[("control", name)] for name in CONTROL_LABELS}
 
-    # Transpile
-    qc_compiled = transpile(
-        qc_bound,
-        backend=backend,
-        optimization_level=3,
-        routing_method="sabre",
-        layout_method="sabre",
+# ═══════════════════════════════════════════════════════════════════
+# EXECUTION MODES
+# ═══════════════════════════════════════════════════════════════════
+#
+# Every mode journals submissions and finished entries as they happen
+# (`journal`) and, when resuming (`resume` = replayed JournalState), skips
+# configurations that already finished and re-attaches to pending jobs via
+# `attach(job_id)` instead of resubmitting them.
+
+GRID_KEYS = [grid_key(alpha_val, K) for alpha_val, K in product(ALPHA_SWEEP, K_SWEEP)]
+CONTROL_KEYS = [control_key(name) for name in CONTROL_LABELS]
+
+def resumed_entries(resume):
+    return dict(resume.completed) if resume is not None else {}
+
+def layout_keys(layout):
+    """Journal keys covered by a batched PUB layout"""
+    keys = []
+    for entry in layout:
+        if entry["kind"] == "control":
+            key = control_key(entry["control"])
+            if key not in keys:
+                keys.append(key)
+        else:
+            for alpha_val in entry["alphas"]:
+                key = grid_key(alpha_val, entry["K"])
+                if key not in keys:
+                    keys.append(key)
+    return keys
+
+def split_key(key):
+    """split_batched_results key → journal key"""
+    return grid_key(*key) if isinstance(key, tuple) else control_key(key)
+
+def print_progress(key, entry, resumed=False):
+    label = f"α={key[1]:.4f}, K={key[2]}" if key[0] == "grid" else f"[{key[1]}] {CONTROL_LABELS[key[1]]}"
+    print(f"{label}{' (from journal)' if resumed else ''}")
+    if key[0] == "grid":
+        print_result_entry(entry)
+    else:
+        print_control_entry(entry)
+
+def collect_results(entries):
+    """Order finished entries as (grid results, control results)"""
+    return [entries[key] for key in GRID_KEYS], [entries[key] for key in CONTROL_KEYS]
+
+def run_sweep_sequential(backend, templates, controls, archive=None,
+                         journal=None, resume=None, attach=None, telemetry=None):
+    """One blocking SamplerV2 job per configuration (legacy behaviour)"""
+    telemetry = telemetry or DISABLED
+    entries = resumed_entries(resume)
+    pending = {}
+    if resume is not None:
+        pending = {key: sub["job_id"] for sub in resume.pending_jobs() for key in sub["keys"]}
+
+    for i, key in enumerate(GRID_KEYS):
+        _, alpha_val, K = key
+        print(f"[{i+1}/{len(GRID_KEYS)}] ", end="")
+        if key in entries:
+            print_progress(key, entries[key], resumed=True)
+            continue
+        print(f"α={alpha_val:.4f}, K={K}")
+
+        # Bind alpha on the precompiled template (no re-transpilation)
+        qc_compiled = templates.bind(K, alpha_val)
+
+        if key in pending and attach is not None:
+            job = attach(pending[key])
+            print(f"  Re-attached to job {job.job_id()}")
+        else:
+            with telemetry.span("submit"):
+                sampler = make_sampler(backend)
+                job = sampler.run([qc_compiled], shots=SHOTS)
+            telemetry.count("shots", SHOTS)
+            if journal:
+                journal.submitted(job.job_id(), [key])
+        job_id = job.job_id()
+
+        print(f"  Job ID: {job_id}")
+        print(f"  Compiled depth: {qc_compiled.depth()}")
+
+        # Wait for results
+        with telemetry.span("wait"):
+            data = job.result()[0].data
+        telemetry.job(job, keys=[list(key)])
+
+        with telemetry.span("process"):
+            entry = make_result_entry(
+                alpha_val, K, job_id, backend.name, qc_compiled.depth(), SHOTS, data.meas, archive,
+                zeno=decode_zeno_records(data),
+            )
+        entries[key] = entry
+        if journal:
+            journal.completed(key, entry)
+        print_result_entry(entry)
+
+    print("🔬 RUNNING CONTROL EXPERIMENTS...")
+    print()
+
+    def on_partial(snapshot, done, total):
+        print(f"  shard {done}/{total}: Φ̂={snapshot['phi']:.4f}, "
+              f"Λ̂={snapshot['lambda']:.4f}, Γ̂={snapshot['gamma']:.4f} "
+              f"({snapshot['shots']} shots)")
+
+    for name, qc_compiled in controls.items():
+        key = control_key(name)
+        if key in entries:
+            print_progress(key, entries[key], resumed=True)
+            continue
+        print(f"[{name}] {CONTROL_LABELS[name]}")
+
+        # Sharded controls are journaled once complete; an interrupted
+        # control is re-run as a whole on resume.
+        segments = []
+        zeno_shards = []
+
+        def on_shard(bits, data):
+            # Archive segments and Zeno records are appended together, so the
+            # i-th segment's shots and the i-th records come from one shard
+            if archive:
+                segments.append(archive.append(bits))
+            zeno_shards.append(decode_zeno_records(data))
+
+        with telemetry.span("control", control=name):
+            accumulator, job_ids = run_sharded(
+                backend, qc_compiled, CONTROL_SHOTS, PARTITION,
+                shard_shots=MAX_SHOTS_PER_JOB, max_concurrent=SHARD_CONCURRENCY,
+                on_partial=on_partial, on_shard=on_shard,
+            )
+        telemetry.count("shots", CONTROL_SHOTS)
+        telemetry.count("control_shards", len(job_ids))
+
+        shots_ref = archive.reference(segments) if archive else None
+        entry = make_control_entry(name, job_ids[0], accumulator, shots_ref=shots_ref,
+                                   circuit_depth=qc_compiled.depth(), backend_name=backend.name,
+                                   zeno=join_zeno_records(zeno_shards))
+        entry["shard_job_ids"] = job_ids
+        entries[key] = entry
+        if journal:
+            journal.completed(key, entry)
+        print_control_entry(entry)
+
+    return collect_results(entries)
+
+def run_sweep_batched(backend, templates, controls, archive=None,
+                      journal=None, resume=None, attach=None, telemetry=None):
+    """All K-PUBs (α as parameter array) + controls in one submission"""
+    telemetry = telemetry or DISABLED
+    entries = resumed_entries(resume)
+    records = {}
+
+    def finish(key, record):
+        if key[0] == "grid":
+            _, alpha_val, K = key
+            entry = make_result_entry(
+                alpha_val, K, record["job_id"], backend.name, templates.depth(K), SHOTS,
+                record["bits"], archive, zeno=decode_zeno_records(record["zeno"]),
+            )
+        else:
+            entry = make_control_entry(key[1], record["job_id"], record["bits"], archive,
+                                       circuit_depth=controls[key[1]].depth(),
+                                       backend_name=backend.name,
+                                       zeno=decode_zeno_records(record["zeno"]))
+        entries[key] = entry
+        if journal:
+            journal.completed(key, entry)
+
+    # Re-attach to batched jobs submitted before the interruption
+    if resume is not None and attach is not None:
+        for sub in resume.pending_jobs():
+            job = attach(sub["job_id"])
+            print(f"  Re-attached to job {job.job_id()}")
+            with telemetry.span("wait"):
+                pub_results = collect_pub_results([(job, 0)])
+            telemetry.job(job, attached=True)
+            split = split_batched_results(pub_results, sub["layout"])
+            for key, record in split.items():
+                if split_key(key) in sub["keys"]:
+                    finish(split_key(key), record)
+
+    grid_points = [(k[1], k[2]) for k in GRID_KEYS if k not in entries]
+    todo_controls = {name: qc for name, qc in controls.items() if control_key(name) not in entries}
+
+    if grid_points or todo_controls:
+        with telemetry.span("submit"):
+            pubs, layout = build_sweep_pubs(
+                templates, ALPHA_SWEEP, K_SWEEP, SHOTS,
+                controls=todo_controls, control_shots=CONTROL_SHOTS,
+                max_shots_per_pub=MAX_SHOTS_PER_JOB, grid_points=grid_points,
+            )
+            jobs = submit_batched(backend, pubs, max_pubs_per_job=MAX_PUBS_PER_JOB)
+        telemetry.count("pubs", len(pubs))
+        telemetry.count("shots", total_shots(pubs))
+
+        print(f"  PUBs: {len(pubs)} ({len(grid_points)} grid points + {len(todo_controls)} controls)")
+        starts = [start for _, start in jobs] + [len(pubs)]
+        for (job, start), end in zip(jobs, starts[1:]):
+            print(f"  Job ID: {job.job_id()} (PUBs {start}-{end - 1})")
+            if journal:
+                job_layout = layout[start:end]
+                journal.submitted(job.job_id(), layout_keys(job_layout), layout=job_layout)
+        print()
+
+        with telemetry.span("wait"):
+            pub_results = collect_pub_results(jobs)
+        for job, _ in jobs:
+            telemetry.job(job)
+        with telemetry.span("process"):
+            split = split_batched_results(pub_results, layout)
+            for key, record in split.items():
+                finish(split_key(key), record)
+
+    for i, key in enumerate(GRID_KEYS):
+        print(f"[{i+1}/{len(GRID_KEYS)}] α={key[1]:.4f}, K={key[2]}")
+        print_result_entry(entries[key])
+
+    print("🔬 CONTROL EXPERIMENTS")
+    print()
+    for key in CONTROL_KEYS:
+        print(f"[{key[1]}] {CONTROL_LABELS[key[1]]}")
+        print_control_entry(entries[key])
+
+    return collect_results(entries)
+
+def run_sweep_adaptive(backend, templates, controls, archive=None,
+                       journal=None, resume=None, attach=None, telemetry=None):
+    """
+    Batched rounds with sequential elimination (AdaptiveShotScheduler).
+
+    Round 0 also carries the controls. Grid points are journaled when they
+    finish (dropped or at SHOTS). On resume, finished points are reused and
+    unfinished ones start over; rounds are not re-attached.
+
+    Returns (grid results, control results, allocation record).
+    """
+    telemetry = telemetry or DISABLED
+    entries = resumed_entries(resume)
+    scheduler = AdaptiveShotScheduler(
+        [key for key in GRID_KEYS if key not in entries], PARTITION,
+        ADAPTIVE_FIRST_ROUND_SHOTS, SHOTS, PHI_THRESHOLD, GAMMA_CRITICAL,
+        eta=ADAPTIVE_ETA, budget=ADAPTIVE_BUDGET, level=ADAPTIVE_CONFIDENCE,
+        seed=BOOTSTRAP_SEED,
     )
+    segments = {key: [] for key in GRID_KEYS}
+    zeno_rounds = {key: [] for key in GRID_KEYS}
+    first_job = {}
+    todo_controls = {name: qc for name, qc in controls.items() if control_key(name) not in entries}
+
+    while (step := scheduler.next_round()) is not None or todo_controls:
+        shots, keys = step if step is not None else (0, [])
+        with telemetry.span("submit", round=scheduler.round):
+            pubs, layout = build_sweep_pubs(
+                templates, ALPHA_SWEEP, K_SWEEP, shots,
+                controls=todo_controls, control_shots=CONTROL_SHOTS,
+                max_shots_per_pub=MAX_SHOTS_PER_JOB, grid_points=[(k[1], k[2]) for k in keys],
+            )
+            jobs = submit_batched(backend, pubs, max_pubs_per_job=MAX_PUBS_PER_JOB)
+        telemetry.count("pubs", len(pubs))
+        telemetry.count("shots", total_shots(pubs))
+        job_ids = [job.job_id() for job, _ in jobs]
+        print(f"  Round {scheduler.round}: {len(keys)} grid points × {shots} shots"
+              f"{f' + {len(todo_controls)} controls' if todo_controls else ''} "
+              f"(jobs {', '.join(job_ids)})")
+        if journal:
+            starts = [start for _, start in jobs] + [len(pubs)]
+            for (job, start), end in zip(jobs, starts[1:]):
+                job_layout = layout[start:end]
+                journal.submitted(job.job_id(), layout_keys(job_layout), layout=job_layout,
+                                  adaptive_round=scheduler.round)
+
+        with telemetry.span("wait", round=scheduler.round):
+            pub_results = collect_pub_results(jobs)
+        for job, _ in jobs:
+            telemetry.job(job, adaptive_round=scheduler.round)
+
+        with telemetry.span("process", round=scheduler.round):
+            split = split_batched_results(pub_results, layout)
+            for key, record in split.items():
+                key = split_key(key)
+                if key[0] == "control":
+                    entry = make_control_entry(key[1], record["job_id"], record["bits"], archive,
+                                               circuit_depth=controls[key[1]].depth(),
+                                               backend_name=backend.name,
+                                               zeno=decode_zeno_records(record["zeno"]))
+                    entries[key] = entry
+                    if journal:
+                        journal.completed(key, entry)
+                    continue
+                scheduler.record(key, record["bits"])
+                first_job.setdefault(key, record["job_id"])
+                records = decode_zeno_records(record["zeno"])
+                if records is not None:
+                    zeno_rounds[key].append(records)
+                if archive is not None:
+                    segments[key].append(archive.append(record["bits"]))
+        todo_controls = {}
+
+        if step is None:
+            break
+        with telemetry.span("eliminate", round=scheduler.round):
+            finished = scheduler.close_round(job_ids)
+        if journal:
+            journal.record("allocation", **scheduler.history[-1])
+        for key in finished:
+            _, alpha_val, K = key
+            entry = make_result_entry(
+                alpha_val, K, first_job[key], backend.name, templates.depth(K),
+                scheduler.spent[key], scheduler.accumulators[key],
+                shots_ref=archive.reference(segments[key]) if archive else None,
+                zeno=join_zeno_records(zeno_rounds.pop(key)),
+            )
+            entry["adaptive"] = scheduler.outcome[key]
+            entries[key] = entry
+            if journal:
+                journal.completed(key, entry)
+        dropped = scheduler.history[-1]["dropped"]
+        if dropped:
+            print(f"    dropped {len(dropped)}: "
+                  + ", ".join(f"α={d['key'][1]:.4f}/K={d['key'][2]}" for d in dropped))
+    print()
 
-    # Submit
-    sampler = SamplerV2(mode=backend)
+    for i, key in enumerate(GRID_KEYS):
+        status = entries[key].get("adaptive", {}).get("status", "journal")
+        print(f"[{i+1}/{len(GRID_KEYS)}] α={key[1]:.4f}, K={key[2]} "
+              f"({entries[key]['shots']} shots, {status})")
+        print_result_entry(entries[key])
 
-    # Enable dynamical decoupling (IBM Runtime knob)
-    sampler.options.dynamical_decoupling.enable = True
-    sampler.options.dynamical_decoupling.sequence_type = "XY4"
+    print("🔬 CONTROL EXPERIMENTS")
+    print()
+    for key in CONTROL_KEYS:
+        print(f"[{key[1]}] {CONTROL_LABELS[key[1]]}")
+        print_control_entry(entries[key])
+
+    allocation = scheduler.summary(flat_shots_per_config=SHOTS)
+    if allocation["savings"] is not None:
+        print(f"  Adaptive allocation: {allocation['total_shots']} grid shots "
+              f"({allocation['savings']:.0%} fewer than the flat grid)")
+        print()
+    return (*collect_results(entries), allocation)
+
+def run_sweep_pipeline(backend, templates, cache=None, archive=None,
+                       journal=None, resume=None, attach=None, telemetry=None):
+    """
+    Overlapped compile → submit → poll → process (asyncio pipeline).
 
-    job = sampler.run([qc_compiled], shots=SHOTS)
-    job_id = job.job_id()
+    Configs are compiled while earlier jobs queue, at most PIPELINE_MAX_IN_FLIGHT
+    jobs are on the backend at once, and observables are computed for each job
+    as soon as it finishes.
+    """
+    telemetry = telemetry or DISABLED
+    entries = resumed_entries(resume)
+    for key, entry in entries.items():
+        print_progress(key, entry, resumed=True)
+    jobs = {}
+
+    def compile_fn(key):
+        with telemetry.span("compile"):
+            if key[0] == "grid":
+                _, alpha_val, K = key
+                qc_compiled = templates.bind(K, alpha_val)
+                telemetry.circuit(f"K{K}", templates.template(K))
+                return qc_compiled, SHOTS, {"depth": templates.depth(K)}
+            qc_compiled = compile_control(key[1], backend, cache)
+            telemetry.circuit(key[1], qc_compiled)
+            return qc_compiled, CONTROL_SHOTS, {"depth": qc_compiled.depth()}
+
+    # process_fn runs in a worker thread: it only computes the entry (the
+    # archive append is locked); job bookkeeping and the journal record are
+    # done by on_result on the event-loop thread
+    def process_fn(key, pub_result, job_id, meta):
+        with telemetry.span("process"):
+            bits = pub_result.data.meas
+            zeno = decode_zeno_records(pub_result.data)
+            if key[0] == "grid":
+                _, alpha_val, K = key
+                entry = make_result_entry(
+                    alpha_val, K, job_id, backend.name, meta["depth"], SHOTS, bits, archive, zeno=zeno
+                )
+            else:
+                entry = make_control_entry(key[1], job_id, bits, archive,
+                                           circuit_depth=meta["depth"], backend_name=backend.name,
+                                           zeno=zeno)
+        return entry
+
+    def on_submit(key, job):
+        jobs[job.job_id()] = job
+        telemetry.count("shots", SHOTS if key[0] == "grid" else CONTROL_SHOTS)
+        if journal:
+            journal.submitted(job.job_id(), [key])
+
+    def on_result(key, entry):
+        if entry["job_id"] in jobs:
+            telemetry.job(jobs.pop(entry["job_id"]), keys=[list(key)])
+        if journal:
+            journal.completed(key, entry)
+        print(f"[done] job {entry['job_id']}: ", end="")
+        print_progress(key, entry)
+
+    attached = {}
+    if resume is not None and attach is not None:
+        for sub in resume.pending_jobs():
+            key = sub["keys"][0]
+            _, _, meta = compile_fn(key)
+            attached[key] = (attach(sub["job_id"]), meta)
+            jobs[sub["job_id"]] = attached[key][0]
+            print(f"  Re-attached to job {sub['job_id']}")
+
+    keys = [key for key in GRID_KEYS + CONTROL_KEYS if key not in entries and key not in attached]
+    results = run_pipeline(
+        backend, keys, compile_fn, process_fn, on_result=on_result,
+        on_submit=on_submit, attached=attached,
+        max_in_flight=PIPELINE_MAX_IN_FLIGHT, poll_interval=PIPELINE_POLL_INTERVAL,
+    )
 
-    print(f"  Job ID: {job_id}")
-    print(f"  Compiled depth: {qc_compiled.depth()}")
+    entries.update(results)
+    return collect_results(entries)
 
-    # Wait for results
-    result = job.result()
-    pub_result = result[0]
-    counts = pub_result.data.meas.get_counts()
+def run_sweep_fanout(lanes, archive=None, journal=None, resume=None, attach=None,
+                     telemetry=None, poll_interval=FANOUT_POLL_INTERVAL):
+    """
+    One job per configuration, spread over several backends (FanoutScheduler).
 
-    # Compute operational observables
-    phi = compute_phi_operational(counts, TOTAL_QUBITS)
-    lambda_val = compute_lambda_operational(counts)
-    gamma = compute_gamma_operational(counts, TOTAL_QUBITS)
-    xi = (lambda_val * phi) / (gamma + 1e-10)
+    Each lane's context holds that backend's compiled "templates" and
+    "controls". Every entry records the backend that produced it; pending
+    jobs are re-attached on their own backend when resuming.
 
-    # Success probability (placeholder: use dominant state)
-    p_succ = max(counts.values()) / sum(counts.values())
+    Returns (grid results, control results, scheduler summary).
+    """
+    telemetry = telemetry or DISABLED
+    entries = resumed_entries(resume)
+    for key, entry in entries.items():
+        print_progress(key, entry, resumed=True)
+
+    def compile_fn(lane, key):
+        templates, controls = lane.context["templates"], lane.context["controls"]
+        if key[0] == "grid":
+            _, alpha_val, K = key
+            return templates.bind(K, alpha_val), SHOTS, {"depth": templates.depth(K)}
+        qc_compiled = controls[key[1]]
+        return qc_compiled, CONTROL_SHOTS, {"depth": qc_compiled.depth()}
+
+    def process_fn(lane, key, pub_result, job, meta):
+        telemetry.job(job, backend=lane.name, keys=[list(key)])
+        with telemetry.span("process"):
+            bits = pub_result.data.meas
+            zeno = decode_zeno_records(pub_result.data)
+            if key[0] == "grid":
+                _, alpha_val, K = key
+                entry = make_result_entry(
+                    alpha_val, K, job.job_id(), lane.name, meta["depth"], SHOTS, bits, archive, zeno=zeno
+                )
+            else:
+                entry = make_control_entry(key[1], job.job_id(), bits, archive,
+                                           circuit_depth=meta["depth"], backend_name=lane.name,
+                                           zeno=zeno)
+        if journal:
+            journal.completed(key, entry)
+        return entry
+
+    def on_submit(lane, key, job):
+        telemetry.count("shots", SHOTS if key[0] == "grid" else CONTROL_SHOTS)
+        telemetry.count(f"jobs/{lane.name}")
+        if journal:
+            journal.submitted(job.job_id(), [key], backend=lane.name)
+
+    def on_result(lane, key, entry):
+        print(f"[done] {lane.name} job {entry['job_id']}: ", end="")
+        print_progress(key, entry)
+
+    by_name = {lane.name: lane for lane in lanes}
+    attached = {}
+    if resume is not None and attach is not None:
+        for sub in resume.pending_jobs():
+            lane = by_name.get(sub.get("backend"))
+            if lane is None:
+                continue  # Backend no longer eligible: the configuration is re-run
+            key = sub["keys"][0]
+            _, _, meta = compile_fn(lane, key)
+            attached[key] = (lane, attach(sub["job_id"]), meta)
+            print(f"  Re-attached to job {sub['job_id']} on {lane.name}")
+
+    keys = [key for key in GRID_KEYS + CONTROL_KEYS if key not in entries and key not in attached]
+    scheduler = FanoutScheduler(lanes, poll_interval=poll_interval)
+    entries.update(scheduler.run(keys, compile_fn, process_fn, on_submit=on_submit,
+                                 on_result=on_result, attached=attached))
+
+    summary = scheduler.summary()
+    print()
+    print(f"  Fan-out over {len(lanes)} backends in {summary['makespan_s']:.1f}s:")
+    for lane in summary["lanes"]:
+        service = f"{lane['service_seconds']:.1f}s/job" if lane["service_seconds"] is not None else "n/a"
+        print(f"    {lane['backend']}: {len(lane['configurations'])} configurations ({service})")
+    print()
+    return (*collect_results(entries), summary)
 
-    # Effective time
-    delta_tau = compute_tau_eff(qc_compiled.depth(), p_succ)
+# ═══════════════════════════════════════════════════════════════════
+# STATISTICS + DECISION RULE
+# ═══════════════════════════════════════════════════════════════════
 
-    # Store result
-    result_entry = {
-        "alpha": alpha_val,
-        "K": K,
-        "job_id": job_id,
-        "backend": backend.name,
-        "circuit_depth": qc_compiled.depth(),
-        "shots": SHOTS,
-        "ccce": {
-            "phi": phi,
-            "lambda": lambda_val,
-            "gamma": gamma,
-            "xi": xi,
-            "conscious": phi >= PHI_THRESHOLD and gamma < GAMMA_CRITICAL,
-            "stable": gamma < GAMMA_CRITICAL,
-        },
-        "observables": {
-            "p_succ": p_succ,
-            "delta_tau_eff": delta_tau,
-        },
-        "counts_sample": dict(list(counts.items())[:10]),
-    }
+def run_statistics(sweep_results, controls_results, base_dir):
+    """Bootstrap statistics + decision rule with the sweep's settings (see aeterna_porta_v2_analysis)"""
+    return analyse_sweep(
+        sweep_results, controls_results, base_dir, PARTITION,
+        PHI_THRESHOLD, GAMMA_CRITICAL, z_threshold=Z_THRESHOLD,
+        replicates=BOOTSTRAP_REPLICATES, seed=BOOTSTRAP_SEED,
+        level=CONFIDENCE_LEVEL, max_workers=STATS_WORKERS,
+    )
+
+# ═══════════════════════════════════════════════════════════════════
+# DEPLOYMENT
+# ═══════════════════════════════════════════════════════════════════
+#
+# Nothing below runs at import time: the observables, circuit builders and
+# execution modes above can be imported from a notebook or test without a
+# backend. `run_sweep` is the full deployment; the CLI
+# (aeterna_porta_v2_cli) exposes it as `submit` / `resume`.
+
+EXECUTION_MODES = ("sequential", "batched", "pipeline", "adaptive", "fanout")
+
+def print_banner():
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(" AETERNA-PORTA v2.1 — IGNITION SWEEP PROTOCOL")
+    print(" Framework: dna::}{::lang v51.843")
+    print(" Nobel-2025 Compliant: Falsifiable + Controlled + Operational")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print()
+    print("📊 SWEEP CONFIGURATION:")
+    print(f"  α sweep: {len(ALPHA_SWEEP)} values (0 to π/2)")
+    print(f"  K sweep: {len(K_SWEEP)} values (Zeno projection counts)")
+    print(f"  Total configurations: {len(ALPHA_SWEEP) * len(K_SWEEP)}")
+    print(f"  Shots per config: {SHOTS}")
+    print(f"  Control shots: {CONTROL_SHOTS}")
+    print()
+
+def connect_backend(local=False):
+    """
+    (service, backend): the offline LocalBackend with `local`, otherwise the
+    first available IBM backend. Each path imports only its own provider.
+    """
+    if local:
+        # Dress rehearsal: same templates, controls and evidence, simulated locally
+        from aeterna_porta_v2_local_backend import LocalBackend
+
+        return None, LocalBackend(seed=TRANSPILE_SEED)
+
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+    service = QiskitRuntimeService()
 
-    sweep_results.append(result_entry)
+    # Backend selection
+    for candidate in BACKEND_CANDIDATES:
+        try:
+            return service, service.backend(candidate)
+        except:
+            continue
 
-    print(f"  Φ̂={phi:.4f}, Λ̂={lambda_val:.4f}, Γ̂={gamma:.4f}, Ξ={xi:.4f}")
-    print(f"  Δτ_eff={delta_tau:.2f}, p_succ={p_succ:.4f}")
+    raise RuntimeError("No suitable backend found")
+
+def connect_backends(local=False):
+    """
+    (service, [backend, ...]) for fan-out: every BACKEND_CANDIDATES backend
+    that answers, or the LOCAL_FANOUT_BACKENDS stand-ins with `local`.
+    """
+    if local:
+        from aeterna_porta_v2_local_backend import LocalBackend
+
+        return None, [
+            LocalBackend(num_qubits, name=name, seed=TRANSPILE_SEED, queue_delay=delay)
+            for name, num_qubits, delay in LOCAL_FANOUT_BACKENDS
+        ]
+
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+    service = QiskitRuntimeService()
+    backends = []
+    for candidate in BACKEND_CANDIDATES:
+        try:
+            backends.append(service.backend(candidate))
+        except Exception:
+            continue
+    if not backends:
+        raise RuntimeError("No suitable backend found")
+    return service, backends
+
+def print_backend(backends, execution_mode):
+    """Backend summary (one backend, or every fan-out backend)"""
+    backends = backends if isinstance(backends, (list, tuple)) else [backends]
+    print("🔧 BACKEND CONFIGURATION:")
+    for backend in backends:
+        print(f"  Backend: {backend.name}")
+        print(f"  Qubits: {backend.num_qubits}")
+    print(f"  Execution mode: {execution_mode}")
     print()
 
-# Run controls
-print("🔬 RUNNING CONTROL EXPERIMENTS...")
-print()
-
-controls_results = []
-
-# C0: Baseline (no drive, no Zeno)
-print("[C0] Baseline (no drive, no Zeno)")
-qc_C0 = build_control_C0()
-qc_C0_compiled = transpile(qc_C0, backend=backend, optimization_level=3)
-sampler = SamplerV2(mode=backend)
-job_C0 = sampler.run([qc_C0_compiled], shots=CONTROL_SHOTS)
-result_C0 = job_C0.result()
-counts_C0 = result_C0[0].data.meas.get_counts()
-
-phi_C0 = compute_phi_operational(counts_C0, TOTAL_QUBITS)
-lambda_C0 = compute_lambda_operational(counts_C0)
-gamma_C0 = compute_gamma_operational(counts_C0, TOTAL_QUBITS)
-
-controls_results.append({
-    "control": "C0",
-    "job_id": job_C0.job_id(),
-    "ccce": {"phi": phi_C0, "lambda": lambda_C0, "gamma": gamma_C0},
-})
-
-print(f"  Job ID: {job_C0.job_id()}")
-print(f"  Φ̂={phi_C0:.4f}, Λ̂={lambda_C0:.4f}, Γ̂={gamma_C0:.4f}")
-print()
-
-# C1: Bridge cut (max alpha, max K, but no entanglement)
-print("[C1] Bridge cut (α_max, K_max, no L↔R CNOT)")
-alpha_max = max(ALPHA_SWEEP)
-K_max = max(K_SWEEP)
-
-qc_C1 = build_control_C1(alpha_max, K_max)
-qc_C1_compiled = transpile(qc_C1, backend=backend, optimization_level=3)
-job_C1 = sampler.run([qc_C1_compiled], shots=CONTROL_SHOTS)
-result_C1 = job_C1.result()
-counts_C1 = result_C1[0].data.meas.get_counts()
-
-phi_C1 = compute_phi_operational(counts_C1, TOTAL_QUBITS)
-lambda_C1 = compute_lambda_operational(counts_C1)
-gamma_C1 = compute_gamma_operational(counts_C1, TOTAL_QUBITS)
-
-controls_results.append({
-    "control": "C1",
-    "job_id": job_C1.job_id(),
-    "ccce": {"phi": phi_C1, "lambda": lambda_C1, "gamma": gamma_C1},
-})
-
-print(f"  Job ID: {job_C1.job_id()}")
-print(f"  Φ̂={phi_C1:.4f}, Λ̂={lambda_C1:.4f}, Γ̂={gamma_C1:.4f}")
-print()
-
-# Save complete sweep evidence
-sweep_evidence = {
-    "manifest_version": "aeterna-porta-sweep/v2.1.0",
-    "experiment": "IGNITION SWEEP PROTOCOL (Nobel-2025 Compliant)",
-    "backend": backend.name,
-    "timestamp": time.time(),
-    "constants": {
-        "LAMBDA_PHI": LAMBDA_PHI,
-        "THETA_LOCK": THETA_LOCK,
-        "PHI_THRESHOLD": PHI_THRESHOLD,
-        "GAMMA_CRITICAL": GAMMA_CRITICAL,
-    },
-    "sweep_parameters": {
+def make_templates(backend, transpile_cache=None):
+    """K-template engine (α left as a Parameter, bound per grid point)"""
+    settings = transpile_settings(backend)["grid"]
+    options = resolve_layout(settings["options"], unit_layout(backend, ("grid", None)))
+    return ParametricTemplateEngine(
+        build_parametric_circuit, backend, Parameter("α"),
+        cache=transpile_cache, base_seed=settings["base_seed"], **options
+    )
+
+def compile_sweep(backend, templates, transpile_cache=None, telemetry=None):
+    """Compile every K template and control up front; returns {name: compiled control}"""
+    telemetry = telemetry or DISABLED
+    t0 = time.perf_counter()
+    for family, settings in transpile_settings(backend).items():
+        source = "autotuned" if settings["tuned"] else "default"
+        print(f"  {family}: {options_label(settings['options'])} ({source})")
+    plans = layout_plans(backend)
+    if plans:
+        plan = plans["grid"]
+        adjacent = plan.interaction_edges - plan.routed_edges
+        print(f"  layout: planned on {len(plan.layout)} qubits, "
+              f"{adjacent}/{plan.interaction_edges} couplings adjacent, throat on {plan.throat}")
+    if transpile_cache is not None:
+        hits0, misses0 = transpile_cache.hits, transpile_cache.misses
+    controls = compile_sweep_parallel(backend, templates, transpile_cache, COMPILE_WORKERS)
+    for K in K_SWEEP:
+        print(f"  K={K}: depth {templates.depth(K)}")
+        telemetry.circuit(f"K{K}", templates.template(K))
+    for name, qc_compiled in controls.items():
+        telemetry.circuit(name, qc_compiled)
+    print(f"  {len(K_SWEEP)} templates + {len(controls)} controls in "
+          f"{time.perf_counter() - t0:.1f}s ({COMPILE_WORKERS} workers)")
+    if transpile_cache is not None:
+        hits, misses = transpile_cache.hits - hits0, transpile_cache.misses - misses0
+        print(f"  Transpile cache: {hits} hits, {misses} misses")
+        telemetry.count("transpile_cache_hits", hits)
+        telemetry.count("transpile_cache_misses", misses)
+    return controls
+
+def autotune_transpile(backend, families=None, max_seeds=None, transpile_cache=None):
+    """
+    Search transpile settings for each circuit family on `backend`, store the
+    winners for later runs and put the winning circuits in the transpile cache.
+    Returns {family: result}.
+    """
+    store = TuningStore()
+    circuits = circuit_families()
+    defaults = default_transpile_settings(backend)
+    search = {"max_seeds": max_seeds} if max_seeds else {}
+    results = {}
+    for family in families or circuits:
+        members = circuits[family]
+        layouts = {key: unit_layout(backend, key) for key in members} if layout_plans(backend) else None
+        print(f"  {family} ({len(members)} circuits):")
+
+        def on_round(round_, candidates, seeds, best):
+            print(f"    round {round_}: {candidates} candidates × {seeds} seeds, "
+                  f"best depth {best.get('depth')} ({options_label(best['options'])})")
+
+        result, compiled = tune_family(
+            members, backend, baseline=defaults[family]["options"],
+            base_seed=defaults[family]["base_seed"], layouts=layouts, on_round=on_round, **search
+        )
+        store.save(backend, family, result, members)
+        if transpile_cache is not None:
+            prime_cache(transpile_cache, backend, members, compiled, result, layouts)
+        baseline = result["baseline"]
+        print(f"    → {options_label(result['options'])}, seed {result['base_seed']}: "
+              f"depth {baseline.get('depth')} → {result['depth']}, "
+              f"2q gates {baseline.get('two_qubit_gates')} → {result['two_qubit_gates']} "
+              f"({result['compiles']} compiles in {result['tuning_s']:.1f}s)")
+        results[family] = result
+    _TRANSPILE_SETTINGS.pop(backend.name, None)
+    print(f"  Saved to {store.path}")
+    return results
+
+def print_telemetry(data):
+    print("⏱️  STAGES:")
+    for path, stage in data["stages"].items():
+        repeats = f" ({stage['count']}×)" if stage["count"] > 1 else ""
+        print(f"  {path}: {stage['wall_s']:.2f}s wall, {stage['cpu_s']:.2f}s CPU{repeats}")
+    totals = data["job_totals"]
+    if totals["jobs"]:
+        print(f"  {totals['jobs']} jobs: {totals['queue_s']:.1f}s queued, {totals['run_s']:.1f}s running")
+    print(f"  Peak RSS: {data['process']['peak_rss_bytes'] / 2**20:.0f} MiB")
+    print()
+
+def run_sweep(local=False, resume=None, execution_mode=None, evidence_dir=DEFAULT_EVIDENCE_DIR,
+              telemetry=TELEMETRY, telemetry_sink=TELEMETRY_SINK):
+    """
+    Full sweep: connect, compile, run the grid + controls, baselines,
+    statistics, evidence. `resume` is a journal path or "latest"; a resumed
+    sweep runs in the journal's execution mode (an explicit, different
+    `execution_mode` is refused: the pending jobs' layouts belong to it).
+    Per-stage telemetry goes into the evidence (and `telemetry_sink`).
+    Returns the evidence path.
+    """
+    evidence_dir = Path(evidence_dir)
+    resume_state = None
+    if resume:
+        journal_path = latest_journal(evidence_dir) if resume == "latest" else Path(resume)
+        if journal_path is None:
+            raise RuntimeError(f"No sweep journal found in {evidence_dir}")
+        resume_state = load_journal(journal_path)
+        journal_mode = resume_state.config.get("execution_mode", EXECUTION_MODE)
+        if execution_mode is not None and execution_mode != journal_mode:
+            raise ValueError(f"{journal_path.name} was written in {journal_mode!r} mode; "
+                             f"cannot resume it in {execution_mode!r} mode")
+        execution_mode = journal_mode
+
+    execution_mode = execution_mode or EXECUTION_MODE
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown EXECUTION_MODE: {execution_mode}")
+    telemetry = Telemetry(enabled=telemetry, sink=sink_for(telemetry_sink) if telemetry else None)
+
+    print_banner()
+    with telemetry.span("connect"):
+        if execution_mode == "fanout":
+            service, backends = connect_backends(local)
+            backends = eligible_backends(backends, PARTITION.total)
+            if not backends:
+                raise RuntimeError(f"No operational backend with ≥ {PARTITION.total} qubits")
+        else:
+            service, backend = connect_backend(local)
+            backends = [backend]
+    backend = backends[0]
+    print_backend(backends, execution_mode)
+
+    # Evidence directory
+    evidence_dir.mkdir(parents=True, exist_ok=True)
+
+    # Journal: every submission and finished configuration is persisted as it
+    # happens; resume replays it and continues with the remaining work only
+    run_config = {
         "alpha_sweep": [float(a) for a in ALPHA_SWEEP],
         "K_sweep": K_SWEEP,
         "shots": SHOTS,
         "control_shots": CONTROL_SHOTS,
-    },
-    "results": sweep_results,
-    "controls": controls_results,
-}
+        "execution_mode": execution_mode,
+    }
+    if resume_state is not None:
+        run_stamp = resume_state.run_stamp
+        if resume_state.config != run_config:
+            print("⚠️  Journal was written with a different sweep configuration")
+        print(f"♻️  RESUMING {journal_path.name}: {len(resume_state.completed)} done, "
+              f"{len(resume_state.pending_jobs())} pending jobs")
+        print()
+        journal = SweepJournal(journal_path)
+    else:
+        run_stamp = int(time.time())
+        journal = SweepJournal(evidence_dir / f"aeterna_porta_sweep_{run_stamp}.journal.jsonl")
+        journal.run(run_stamp, run_config)
+    telemetry.run = run_stamp
+
+    # Full-shot archive (packed rows, referenced by offset from the evidence JSON)
+    shot_archive = (
+        ShotArchiveWriter(evidence_dir / f"aeterna_porta_sweep_{run_stamp}.shots")
+        if ARCHIVE_SHOTS else None
+    )
+
+    # Persistent compiled-circuit cache (keyed by structure + calibration + options)
+    transpile_cache = TranspileCache() if USE_TRANSPILE_CACHE else None
+
+    # Transpile each K structure once (α unbound), bind α per grid point
+    print("🛠️  COMPILING K TEMPLATES...")
+    templates = make_templates(backend, transpile_cache)
+    if execution_mode == "pipeline":
+        # Templates and controls are compiled inside the pipeline, overlapping
+        # with jobs already waiting in the queue
+        print("  (deferred to pipeline compile stage)")
+    elif execution_mode == "fanout":
+        # Every backend gets its own templates and controls
+        lanes = []
+        for lane_backend in backends:
+            print(f"  {lane_backend.name}:")
+            lane_templates = make_templates(lane_backend, transpile_cache)
+            with telemetry.span("compile", backend=lane_backend.name):
+                lane_controls = compile_sweep(lane_backend, lane_templates, transpile_cache, telemetry)
+            lanes.append(BackendLane(
+                lane_backend, {"templates": lane_templates, "controls": lane_controls},
+                max_in_flight=FANOUT_MAX_IN_FLIGHT,
+            ))
+    else:
+        with telemetry.span("compile"):
+            controls = compile_sweep(backend, templates, transpile_cache, telemetry)
+    print()
+
+    print("🚀 STARTING SWEEP...")
+    print()
+
+    run_context = {
+        "archive": shot_archive,
+        "journal": journal,
+        "resume": resume_state,
+        # Local jobs do not outlive the process: pending ones are re-run
+        "attach": service.job if service is not None else None,
+        "telemetry": telemetry,
+    }
+    allocation = None
+    fanout = None
+    with telemetry.span("execute", mode=execution_mode):
+        if execution_mode == "pipeline":
+            sweep_results, controls_results = run_sweep_pipeline(
+                backend, templates, transpile_cache, **run_context
+            )
+        elif execution_mode == "batched":
+            sweep_results, controls_results = run_sweep_batched(
+                backend, templates, controls, **run_context
+            )
+        elif execution_mode == "fanout":
+            sweep_results, controls_results, fanout = run_sweep_fanout(
+                lanes, poll_interval=LOCAL_FANOUT_POLL_INTERVAL if local else FANOUT_POLL_INTERVAL,
+                **run_context
+            )
+        elif execution_mode == "adaptive":
+            sweep_results, controls_results, allocation = run_sweep_adaptive(
+                backend, templates, controls, **run_context
+            )
+        else:
+            sweep_results, controls_results = run_sweep_sequential(
+                backend, templates, controls, **run_context
+            )
+
+    if EXACT_BASELINES:
+        print("📐 EXACT BASELINES (noise-free, factorized)...")
+        t0 = time.perf_counter()
+        with telemetry.span("baselines"):
+            for entry in sweep_results:
+                entry["exact_baseline"] = exact_baseline(
+                    build_parametric_circuit(entry["alpha"], entry["K"]), SHOTS
+                )
+            for entry in controls_results:
+                entry["exact_baseline"] = exact_baseline(build_control(entry["control"]), CONTROL_SHOTS)
+        print(f"  {len(sweep_results) + len(controls_results)} baselines in "
+              f"{time.perf_counter() - t0:.2f}s")
+        print()
+
+    statistics = None
+    if shot_archive is not None:
+        print("📊 BOOTSTRAP STATISTICS...")
+        t0 = time.perf_counter()
+        with telemetry.span("statistics"):
+            statistics = run_statistics(sweep_results, controls_results, evidence_dir)
+        print(f"  {BOOTSTRAP_REPLICATES} replicates × {len(sweep_results) + len(controls_results)} "
+              f"configurations in {time.perf_counter() - t0:.1f}s")
+        print(f"  Accepted by decision rule: {len(statistics['accepted'])}")
+        print()
+    else:
+        print("⚠️  ARCHIVE_SHOTS is off: no bootstrap statistics")
+        print()
+
+    # Save complete sweep evidence
+    sweep_evidence = {
+        "manifest_version": "aeterna-porta-sweep/v2.1.0",
+        "experiment": "IGNITION SWEEP PROTOCOL (Nobel-2025 Compliant)",
+        "backend": backend.name,
+        "backends": [b.name for b in backends],
+        "timestamp": time.time(),
+        "constants": {
+            "LAMBDA_PHI": LAMBDA_PHI,
+            "THETA_LOCK": THETA_LOCK,
+            "PHI_THRESHOLD": PHI_THRESHOLD,
+            "GAMMA_CRITICAL": GAMMA_CRITICAL,
+        },
+        "sweep_parameters": run_config,
+        "journal": journal.path.name,
+        "partition": PARTITION.to_dict(),
+        "transpile": {
+            b.name: {**transpile_settings(b),
+                     "layout": {name: plan.summary() for name, plan in layout_plans(b).items()}}
+            for b in backends
+        },
+        "shot_archive": shot_archive.manifest() if shot_archive else None,
+        "statistics": statistics,
+        "adaptive_allocation": allocation,
+        "fanout": fanout,
+        "telemetry": telemetry.to_dict(),
+        "results": sweep_results,
+        "controls": controls_results,
+    }
+
+    if shot_archive is not None:
+        shot_archive.close()
+
+    sweep_path = evidence_dir / f"aeterna_porta_sweep_{run_stamp}.json"
+    sweep_path.write_text(json.dumps(sweep_evidence, indent=2))
+    journal.finished(sweep_path)
+    journal.close()
+    telemetry.close()
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(" SWEEP COMPLETE")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print()
+    print(f"📦 Evidence: {sweep_path}")
+    print()
+    if telemetry.enabled:
+        print_telemetry(sweep_evidence["telemetry"])
+
+    # Ξ-best among the configurations the decision rule accepts
+    # (Ξ-best overall when none is accepted or statistics are unavailable)
+    print_best_configuration(best_configuration(sweep_results), PHI_THRESHOLD)
+
+    if local:
+        for local_backend in backends:
+            local_backend.shutdown()
+    return sweep_path
+
+def main(argv=None):
+    """Legacy entry point: `python deploy_aeterna_porta_v2_SWEEP.py [--local] [--resume [JOURNAL]]`"""
+    parser = argparse.ArgumentParser(
+        description="AETERNA-PORTA v2.1 ignition sweep (see aeterna_porta_v2_cli for all subcommands)"
+    )
+    parser.add_argument(
+        "--resume", nargs="?", const="latest", metavar="JOURNAL",
+        help="Resume an interrupted sweep from its journal (default: the latest one)",
+    )
+    parser.add_argument(
+        "--local", action="store_true",
+        help="Run offline on the local MPS/stabilizer simulator (no IBM Quantum account)",
+    )
+    args = parser.parse_args(argv)
+    run_sweep(local=args.local, resume=args.resume)
 
-sweep_path = evidence_dir / f"aeterna_porta_sweep_{int(time.time())}.json"
-sweep_path.write_text(json.dumps(sweep_evidence, indent=2))
-
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print(" SWEEP COMPLETE")
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print()
-print(f"📦 Evidence: {sweep_path}")
-print()
-
-# Find best configuration
-best_config = max(sweep_results, key=lambda r: r["ccce"]["xi"])
-
-print("🏆 BEST CONFIGURATION:")
-print(f"  α = {best_config['alpha']:.4f}")
-print(f"  K = {best_config['K']}")
-print(f"  Φ̂ = {best_config['ccce']['phi']:.4f} {'✅' if best_config['ccce']['phi'] >= PHI_THRESHOLD else '❌'}")
-print(f"  Ξ = {best_config['ccce']['xi']:.4f}")
-print(f"  Conscious: {best_config['ccce']['conscious']}")
-print()
-
-if best_config['ccce']['conscious']:
-    print("🔥 IGNITION ACHIEVED")
-else:
-    print("❄️ IGNITION INCOMPLETE — Recommend further parameter tuning")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+AETERNA-PORTA v2.1 — TEST CONFIGURATION
+Framework: dna::}{::lang v51.843
+
+The modules live flat in the repository root: make them importable from
+tests/ however pytest is invoked.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
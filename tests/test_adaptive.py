@@ -0,0 +1,97 @@
+"""
+AETERNA-PORTA v2.1 — ADAPTIVE SHOT ALLOCATION
+Framework: dna::}{::lang v51.843
+
+AdaptiveShotScheduler on synthetic sources: a constant register (Φ̂ = 0) is
+dropped after round 0 on its Φ̂ bound, a uniform one (Φ̂ ≈ 1, Γ̂ ≈ 0.36 at
+16 bits) survives to max_shots in geometric rounds, or is dropped on its Γ̂
+bound when Γ_critical is below it; a budget ends the rounds without ever
+being overspent.
+"""
+import numpy as np
+from qiskit.primitives.containers import BitArray
+
+from aeterna_porta_v2_adaptive import AdaptiveShotScheduler
+
+NUM_BITS = 16
+FIRST_ROUND = 100
+MAX_SHOTS = 700  # 100 + 200 + 400
+PHI_THRESHOLD = 0.5
+
+# Grid-style keys, as run_sweep_adaptive uses them
+CONSTANT = ("grid", 0.0, 0)
+UNIFORM = ("grid", 0.5, 2)
+
+
+def constant(shots, rng):
+    return BitArray(np.zeros((shots, NUM_BITS // 8), dtype=np.uint8), NUM_BITS)
+
+
+def uniform(shots, rng):
+    return BitArray(rng.integers(0, 256, size=(shots, NUM_BITS // 8), dtype=np.uint8), NUM_BITS)
+
+
+def scheduler(keys, gamma_critical=1.0, **kwargs):
+    kwargs = {"first_round_shots": FIRST_ROUND, "max_shots": MAX_SHOTS, "replicates": 100,
+              "seed": 5, **kwargs}
+    return AdaptiveShotScheduler(keys, NUM_BITS, phi_threshold=PHI_THRESHOLD,
+                                 gamma_critical=gamma_critical, **kwargs)
+
+
+def run(scheduler, sources):
+    """Drive every round; returns [(shots, keys, finished)] per round"""
+    rng = np.random.default_rng(11)
+    rounds = []
+    while (step := scheduler.next_round()) is not None:
+        shots, keys = step
+        for key in keys:
+            scheduler.record(key, sources[key](shots, rng))
+        rounds.append((shots, keys, scheduler.close_round([f"job-{len(rounds)}"])))
+    return rounds
+
+
+def test_constant_dropped_uniform_runs_to_max_shots():
+    sched = scheduler([CONSTANT, UNIFORM])
+    rounds = run(sched, {CONSTANT: constant, UNIFORM: uniform})
+
+    assert rounds == [
+        (100, [CONSTANT, UNIFORM], [CONSTANT]),
+        (200, [UNIFORM], []),
+        (400, [UNIFORM], [UNIFORM]),
+    ]
+    assert sched.outcome[CONSTANT]["reason"] == "phi_upper_below_threshold"
+    assert sched.outcome[CONSTANT]["phi_upper"] < PHI_THRESHOLD
+    assert sched.outcome[UNIFORM]["status"] == "complete"
+    assert sched.spent == {CONSTANT: 100, UNIFORM: MAX_SHOTS}
+
+    summary = sched.summary(flat_shots_per_config=MAX_SHOTS)
+    assert summary["total_shots"] == 800
+    assert summary["savings"] == 1 - 800 / (2 * MAX_SHOTS)
+    assert [r["job_ids"] for r in summary["rounds"]] == [["job-0"], ["job-1"], ["job-2"]]
+    assert summary["rounds"][0]["dropped"][0]["key"] == list(CONSTANT)
+
+
+def test_gamma_bound_drops():
+    sched = scheduler([UNIFORM], gamma_critical=0.2)
+    rounds = run(sched, {UNIFORM: uniform})
+    assert len(rounds) == 1
+    assert sched.outcome[UNIFORM]["reason"] == "gamma_lower_above_critical"
+    assert sched.outcome[UNIFORM]["gamma_lower"] > 0.2
+
+
+def test_last_round_capped_at_max_shots():
+    sched = scheduler([UNIFORM], max_shots=500)
+    assert [shots for shots, _, _ in run(sched, {UNIFORM: uniform})] == [100, 200, 200]
+    assert sched.spent[UNIFORM] == 500
+
+
+def test_budget_ends_rounds_without_overspending():
+    keys = [("grid", 0.1, 2), UNIFORM]
+    sched = scheduler(keys, budget=1000)
+    rounds = run(sched, {key: uniform for key in keys})
+
+    # 2×100, 2×200, then min(400, (1000 - 600) // 2) = 200 each, then nothing left
+    assert [shots for shots, _, _ in rounds] == [100, 200, 200]
+    assert sched.total_spent == 1000
+    assert sched.outcome == {key: {"status": "budget", "rounds": 3} for key in keys}
+    assert sched.history[-1]["budget_exhausted"] is True
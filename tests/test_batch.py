@@ -0,0 +1,182 @@
+"""
+AETERNA-PORTA v2.1 — BATCHED PUB SUBMISSION ON THE LOCAL BACKEND
+Framework: dna::}{::lang v51.843
+
+build_sweep_pubs → submit_batched → collect_pub_results →
+split_batched_results against LocalBackend, with a toy template whose
+outcome encodes (α, K), so every configuration's shots and Zeno registers
+can be checked after the split, sharded PUBs and chunked jobs included.
+"""
+import numpy as np
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+
+from aeterna_porta_v2_batch import (
+    build_sweep_pubs,
+    collect_pub_results,
+    split_batched_results,
+    submit_batched,
+    total_shots,
+)
+from aeterna_porta_v2_local_backend import LocalBackend
+from aeterna_porta_v2_templates import ParametricTemplateEngine
+from aeterna_porta_v2_zeno import decode_zeno_records, zeno_register_name
+
+ALPHAS = [0.0, float(np.pi)]
+K_VALUES = [1, 2]
+SHOTS = 250
+CONTROL_SHOTS = 120
+
+
+def toy_builder(alpha_param, K):
+    """
+    meas = (K ≥ 2, K odd, α = π) on q2 q1 q0; Zeno cycle c flips the
+    ancilla q3 and measures it into zeno_c (1, 0, 1, …).
+    """
+    q = QuantumRegister(4, "q")
+    meas = ClassicalRegister(3, "meas")
+    zeno = [ClassicalRegister(1, zeno_register_name(c)) for c in range(K)]
+    qc = QuantumCircuit(q, meas, *zeno)
+    qc.rx(alpha_param, 0)
+    if K % 2:
+        qc.x(1)
+    if K >= 2:
+        qc.x(2)
+    for c in range(K):
+        qc.x(3)
+        qc.measure(3, zeno[c][0])
+    qc.measure([0, 1, 2], meas)
+    return qc
+
+
+def expected_outcome(alpha_val, K):
+    return f"{int(K >= 2)}{K % 2}{int(alpha_val > 0)}"
+
+
+def control_circuit(flips):
+    qc = QuantumCircuit(QuantumRegister(4, "q"), ClassicalRegister(3, "meas"))
+    for qubit in flips:
+        qc.x(qubit)
+    qc.measure([0, 1, 2], [0, 1, 2])
+    return qc
+
+
+CONTROLS = {"C0": ([], "000"), "C1": ([2], "100"), "C2": ([0, 1, 2], "111")}
+
+
+@pytest.fixture
+def backend():
+    backend = LocalBackend(num_qubits=4, seed=7)
+    yield backend
+    backend.shutdown()
+
+
+@pytest.fixture
+def templates(backend):
+    return ParametricTemplateEngine(toy_builder, backend, Parameter("α"), base_seed=1,
+                                    optimization_level=1)
+
+
+@pytest.fixture
+def controls(backend):
+    from qiskit import transpile
+
+    return {name: transpile(control_circuit(flips), target=backend.target, seed_transpiler=1)
+            for name, (flips, _) in CONTROLS.items()}
+
+
+def run_batched(backend, templates, controls, max_shots_per_pub=None, max_pubs_per_job=None,
+                grid_points=None):
+    pubs, layout = build_sweep_pubs(templates, ALPHAS, K_VALUES, SHOTS, controls=controls,
+                                    control_shots=CONTROL_SHOTS,
+                                    max_shots_per_pub=max_shots_per_pub, grid_points=grid_points)
+    jobs = submit_batched(backend, pubs, max_pubs_per_job=max_pubs_per_job)
+    return pubs, layout, jobs, split_batched_results(collect_pub_results(jobs), layout)
+
+
+def test_layout_one_pub_per_template(templates, controls):
+    pubs, layout = build_sweep_pubs(templates, ALPHAS, K_VALUES, SHOTS, controls=controls,
+                                    control_shots=CONTROL_SHOTS)
+    assert layout == [
+        {"kind": "grid", "K": 1, "alphas": ALPHAS},
+        {"kind": "grid", "K": 2, "alphas": ALPHAS},
+        {"kind": "control", "control": "C0"},
+        {"kind": "control", "control": "C1"},
+        {"kind": "control", "control": "C2"},
+    ]
+    assert pubs[0][1].shape == (len(ALPHAS), 1)
+    assert total_shots(pubs) == len(ALPHAS) * len(K_VALUES) * SHOTS + len(CONTROLS) * CONTROL_SHOTS
+
+
+def test_layout_shards_large_pubs(templates, controls):
+    pubs, layout = build_sweep_pubs(templates, ALPHAS, K_VALUES, SHOTS, controls=controls,
+                                    control_shots=CONTROL_SHOTS, max_shots_per_pub=100)
+    assert [shots for _, _, shots in pubs] == [100, 100, 50] * 2 + [100, 20] * 3
+    assert [entry.get("K", entry.get("control")) for entry in layout] == \
+        [1, 1, 1, 2, 2, 2, "C0", "C0", "C1", "C1", "C2", "C2"]
+    assert total_shots(pubs) == len(ALPHAS) * len(K_VALUES) * SHOTS + len(CONTROLS) * CONTROL_SHOTS
+
+
+@pytest.mark.parametrize("max_shots_per_pub, max_pubs_per_job", [
+    (None, None),  # one job, one PUB per configuration group
+    (100, None),  # sharded PUBs, re-joined by the split
+    (100, 4),  # sharded PUBs spread over several jobs
+])
+def test_split_per_configuration(backend, templates, controls, max_shots_per_pub, max_pubs_per_job):
+    pubs, _, jobs, split = run_batched(backend, templates, controls, max_shots_per_pub, max_pubs_per_job)
+
+    expected_jobs = 1 if max_pubs_per_job is None else -(-len(pubs) // max_pubs_per_job)
+    assert len(jobs) == expected_jobs
+    job_ids = {job.job_id() for job, _ in jobs}
+    assert set(split) == {(a, K) for a in ALPHAS for K in K_VALUES} | set(CONTROLS)
+
+    for alpha_val in ALPHAS:
+        for K in K_VALUES:
+            entry = split[(alpha_val, K)]
+            assert entry["bits"].num_shots == SHOTS
+            assert entry["bits"].get_counts() == {expected_outcome(alpha_val, K): SHOTS}
+            assert entry["job_id"] in job_ids
+
+            assert sorted(entry["zeno"]) == [zeno_register_name(c) for c in range(K)]
+            records = decode_zeno_records(entry["zeno"])
+            assert records.shape == (SHOTS, K, 1)
+            pattern = np.array([(c + 1) % 2 for c in range(K)], dtype=np.uint8)
+            assert (records[..., 0] == pattern).all()
+
+    for name, (_, outcome) in CONTROLS.items():
+        entry = split[name]
+        assert entry["bits"].get_counts() == {outcome: CONTROL_SHOTS}
+        assert entry["zeno"] == {}
+
+
+def test_split_grid_subset(backend, templates, controls):
+    """Remainder of a resumed sweep: only the requested (α, K) points come back"""
+    remaining = [(ALPHAS[1], 1), (ALPHAS[0], 2)]
+    _, layout, _, split = run_batched(backend, templates, None, max_shots_per_pub=100,
+                                      grid_points=remaining)
+    assert {entry["K"]: entry["alphas"] for entry in layout} == {1: [ALPHAS[1]], 2: [ALPHAS[0]]}
+    assert set(split) == set(remaining)
+    for alpha_val, K in remaining:
+        assert split[(alpha_val, K)]["bits"].get_counts() == {expected_outcome(alpha_val, K): SHOTS}
+
+
+def test_unparameterized_template_gets_draws_per_alpha(backend):
+    """A template whose α was optimised away still gives every α its own shots"""
+    def coin_builder(alpha_param, K):
+        qc = QuantumCircuit(QuantumRegister(4, "q"), ClassicalRegister(4, "meas"))
+        qc.h(range(4))
+        qc.measure(range(4), range(4))
+        return qc
+
+    templates = ParametricTemplateEngine(coin_builder, backend, Parameter("α"), base_seed=1)
+    alphas = [0.1, 0.2, 0.3]
+    pubs, layout = build_sweep_pubs(templates, alphas, [0], SHOTS)
+    assert pubs[0][1].shape == (len(alphas), 0)
+    assert total_shots(pubs) == len(alphas) * SHOTS
+
+    split = split_batched_results(collect_pub_results(submit_batched(backend, pubs)), layout)
+    arrays = [split[(alpha_val, 0)]["bits"].array for alpha_val in alphas]
+    assert all(array.shape == (SHOTS, 1) for array in arrays)
+    assert not np.array_equal(arrays[0], arrays[1])
+    assert not np.array_equal(arrays[1], arrays[2])
@@ -0,0 +1,138 @@
+"""
+AETERNA-PORTA v2.1 — EVIDENCE INDEX
+Framework: dna::}{::lang v51.843
+
+EvidenceIndex.update over synthetic sweep evidence and ignition artifacts:
+only new or changed files are re-read, rewritten files replace their rows
+instead of duplicating them, removed files drop out, half-written files are
+retried on the next scan, and `since` / `until` / aggregate filter on the
+denormalised entries table.
+"""
+import json
+import os
+import time
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from aeterna_porta_v2_evidence_index import EvidenceIndex, parse_age
+
+DAY = 86400.0
+KS = [0, 2, 4]
+
+
+def write_sweep(directory, stamp, timestamp, backend="ibm_fez", phi_offset=0.0):
+    """One sweep evidence file: a grid point per K plus control C0"""
+    evidence = {
+        "backend": backend,
+        "timestamp": timestamp,
+        "sweep_parameters": {"execution_mode": "batched"},
+        "results": [
+            {"alpha": 0.5, "K": K, "job_id": f"job-{stamp}-{K}", "shots": 8192,
+             "ccce": {"phi": 0.1 * K + phi_offset, "gamma": 0.3},
+             "observables": {"p_succ": 0.01}}
+            for K in KS
+        ],
+        "controls": [{"control": "C0", "job_id": f"job-{stamp}-C0", "ccce": {"phi": 0.05}}],
+    }
+    path = directory / f"aeterna_porta_sweep_{stamp}.json"
+    path.write_text(json.dumps(evidence))
+    return path
+
+
+@pytest.fixture
+def index(tmp_path):
+    with EvidenceIndex(tmp_path / "index.sqlite") as index:
+        yield index
+
+
+def test_update_reads_only_new_or_changed_files(tmp_path, index):
+    now = time.time()
+    old = write_sweep(tmp_path, 1, now - 2 * DAY)
+    write_sweep(tmp_path, 2, now - DAY)
+
+    report = index.update([tmp_path])
+    assert (report["added"], report["updated"], report["unchanged"]) == (2, 0, 0)
+    assert index.counts() == {"runs": 2, "entries": 8}
+
+    report = index.update([tmp_path])
+    assert (report["added"], report["updated"], report["unchanged"]) == (0, 0, 2)
+
+    write_sweep(tmp_path, 1, now - 2 * DAY, phi_offset=1.0)
+    os.utime(old, (now + 10, now + 10))  # Rewritten within the same mtime tick otherwise
+    report = index.update([tmp_path])
+    assert (report["added"], report["updated"], report["unchanged"]) == (0, 1, 1)
+    assert index.counts() == {"runs": 2, "entries": 8}  # Replaced, not duplicated
+    rows = index.query(kind="grid", K=2, columns=["job_id", "phi"], order_by="job_id")
+    np.testing.assert_allclose(rows["phi"], [1.2, 0.2])
+
+
+def test_removed_files_drop_out(tmp_path, index):
+    now = time.time()
+    gone = write_sweep(tmp_path, 1, now)
+    write_sweep(tmp_path, 2, now)
+    index.update([tmp_path])
+
+    gone.unlink()
+    report = index.update([tmp_path])
+    assert report["removed"] == 1
+    assert index.counts() == {"runs": 1, "entries": 4}
+    assert set(index.query(columns=["job_id"])["job_id"]) == {
+        "job-2-0", "job-2-2", "job-2-4", "job-2-C0"}
+
+
+def test_half_written_file_is_retried(tmp_path, index):
+    path = tmp_path / "aeterna_porta_sweep_3.json"
+    path.write_text('{"backend": "ibm_fez", "results": [')
+    report = index.update([tmp_path])
+    assert len(report["failed"]) == 1
+    assert index.counts() == {"runs": 0, "entries": 0}
+
+    write_sweep(tmp_path, 3, time.time())
+    assert index.update([tmp_path])["added"] == 1
+
+
+def test_since_and_until(tmp_path, index):
+    now = time.time()
+    write_sweep(tmp_path, 1, now - 40 * DAY, backend="ibm_torino")
+    write_sweep(tmp_path, 2, now - DAY)
+    index.update([tmp_path])
+
+    recent = index.query(since=parse_age("30d"), columns=["backend"])
+    assert list(recent["backend"]) == ["ibm_fez"] * 4
+    assert len(index.query(since=timedelta(days=60))) == 8
+    old = index.query(until=now - 30 * DAY, columns=["backend"])
+    assert list(old["backend"]) == ["ibm_torino"] * 4
+    assert len(index.query(since=now - 2 * DAY, backend="ibm_torino")) == 0
+
+
+def test_aggregate_per_K(tmp_path, index):
+    now = time.time()
+    write_sweep(tmp_path, 1, now)
+    write_sweep(tmp_path, 2, now, phi_offset=0.2)
+    index.update([tmp_path])
+
+    stats = index.aggregate("K", "phi", kind="grid")
+    assert list(stats["K"]) == KS
+    assert list(stats["count"]) == [2, 2, 2]
+    np.testing.assert_allclose(stats["mean"], [0.1, 0.3, 0.5])
+    np.testing.assert_allclose(stats["std"], [0.1, 0.1, 0.1], atol=1e-9)
+
+
+def test_ignition_artifact_with_iso_timestamp(tmp_path, index):
+    artifact = {"status": "COMPLETED", "timestamp": "2025-01-02T03:04:05",
+                "config": {"target_backend": "ibm_fez", "shots": 4096},
+                "ccce": {"phi": 0.8}}
+    (tmp_path / "aeterna_ignition_artifact_abc.json").write_text(json.dumps(artifact))
+    index.update([tmp_path])
+
+    row = index.query(source="ignition", columns=["kind", "backend", "shots", "phi", "timestamp"])
+    assert list(row["kind"]) == ["ignition"]
+    assert row["shots"][0] == 4096
+    assert row["timestamp"][0] == pytest.approx(1735787045.0)
+
+
+def test_unknown_column_is_refused(index):
+    with pytest.raises(ValueError):
+        index.query(columns=["phi", "nope"])
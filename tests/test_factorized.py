@@ -0,0 +1,125 @@
+"""
+AETERNA-PORTA v2.1 — EXACT FACTORIZED SAMPLER vs. AER
+Framework: dna::}{::lang v51.843
+
+On a partition small enough for Aer's statevector method, shots drawn from
+FactorizedDistribution must match Aer's (Φ̂/Λ̂/Γ̂/p_succ on `meas` and every
+Zeno record's marginals) within sampling noise, and the exact population
+values must sit inside that noise too. Circuits with a factor wider than
+MAX_FACTOR_QUBITS are refused and simulated by another method instead.
+"""
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit_aer.primitives import SamplerV2 as AerSamplerV2
+
+from aeterna_porta_v2_factorized import (
+    MAX_FACTOR_QUBITS,
+    FactorizationError,
+    FactorizedDistribution,
+    is_factorizable,
+)
+from aeterna_porta_v2_local_backend import LocalBackend, select_method
+from aeterna_porta_v2_observables import observables_from_bits
+from aeterna_porta_v2_partition import Partition
+from deploy_aeterna_porta_v2_SWEEP import build_parametric_circuit, exact_baseline
+
+PARTITION = Partition(4, 4, 2)
+ALPHA = 0.7
+K = 2
+SHOTS = 40000
+SEED = 51843
+TOLERANCE = 0.015  # ≈ 6σ of a rate estimated from SHOTS shots
+
+OBSERVABLES = ["phi", "lambda", "gamma", "p_succ"]
+
+
+@pytest.fixture(scope="module")
+def circuit():
+    alpha = Parameter("α")
+    return build_parametric_circuit(alpha, K, PARTITION).assign_parameters({alpha: ALPHA})
+
+
+@pytest.fixture(scope="module")
+def shots(circuit):
+    """{register: (factorized BitArray, Aer BitArray)}"""
+    factorized = FactorizedDistribution(circuit).sample(SHOTS, seed=SEED)
+    sampler = AerSamplerV2(options={"backend_options": {"method": "statevector",
+                                                        "shot_branching_enable": True,
+                                                        "seed_simulator": SEED}})
+    aer = sampler.run([circuit], shots=SHOTS).result()[0].data
+    return {name: (bits, getattr(aer, name)) for name, bits in factorized.items()}
+
+
+def marginals(bits):
+    """P(bit j = 1) per clbit, clbit 0 first"""
+    return bits.to_bool_array(order="little").mean(axis=0)
+
+
+def test_registers_match(circuit, shots):
+    assert sorted(shots) == sorted(creg.name for creg in circuit.cregs)
+    assert sorted(shots) == ["meas", "zeno_0", "zeno_1"]
+
+
+def test_observables_agree_with_aer(shots):
+    ours, aer = (observables_from_bits(bits, PARTITION) for bits in shots["meas"])
+    for name in OBSERVABLES:
+        assert ours[name] == pytest.approx(aer[name], abs=TOLERANCE), name
+
+
+def test_population_values_inside_aer_noise(circuit, shots):
+    population = FactorizedDistribution(circuit).exact_observables("meas", PARTITION)
+    aer = observables_from_bits(shots["meas"][1], PARTITION)
+    # Φ̂ and Γ̂'s leakage term |supp| / 2^n depend on the support seen at finite
+    # shots (not negligible on 10 qubits); Λ̂ and p_succ are plain rates
+    for name in ["lambda", "p_succ"]:
+        assert population[name] == pytest.approx(aer[name], abs=TOLERANCE), name
+
+
+@pytest.mark.parametrize("register", ["meas", "zeno_0", "zeno_1"])
+def test_bit_marginals_agree_with_aer(shots, register):
+    ours, aer = shots[register]
+    assert ours.num_bits == aer.num_bits
+    np.testing.assert_allclose(marginals(ours), marginals(aer), atol=TOLERANCE)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# MAX_FACTOR_QUBITS FALLBACK
+# ═══════════════════════════════════════════════════════════════════
+
+def ghz(num_qubits, phase=None):
+    """One connected factor spanning all `num_qubits`"""
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    if phase is not None:
+        qc.rz(phase, 0)  # No longer Clifford
+    for q in range(1, num_qubits):
+        qc.cx(q - 1, q)
+    qc.measure_all()
+    return qc
+
+
+def test_wide_factor_is_refused():
+    assert is_factorizable(ghz(MAX_FACTOR_QUBITS))
+    qc = ghz(MAX_FACTOR_QUBITS + 1)
+    assert not is_factorizable(qc)
+    with pytest.raises(FactorizationError):
+        FactorizedDistribution(qc)
+    assert "error" in exact_baseline(qc, 128)
+
+
+def test_wide_factor_falls_back_to_another_method():
+    num_qubits = MAX_FACTOR_QUBITS + 1
+    assert select_method(ghz(MAX_FACTOR_QUBITS)) == "factorized"
+    assert select_method(ghz(num_qubits)) == "stabilizer"
+    assert select_method(ghz(num_qubits, phase=0.3)) == "statevector"
+
+    backend = LocalBackend(num_qubits=num_qubits, seed=SEED)
+    try:
+        result = backend.sampler().run([ghz(num_qubits, phase=0.3)], shots=512).result()
+    finally:
+        backend.shutdown()
+    counts = result[0].data.meas.get_counts()
+    assert set(counts) == {"0" * num_qubits, "1" * num_qubits}
+    assert result.metadata["methods"] == {"statevector": 1}
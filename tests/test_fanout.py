@@ -0,0 +1,125 @@
+"""
+AETERNA-PORTA v2.1 — FAN-OUT SCHEDULER WITH DELAYED LOCAL LANES
+Framework: dna::}{::lang v51.843
+
+FanoutScheduler over LocalBackend stand-ins whose `queue_delay` plays a
+slow device queue: every configuration runs exactly once, on the right
+circuit, within each lane's in-flight limit, and the fast lane drains most
+of the work.
+"""
+import pytest
+from qiskit import QuantumCircuit
+
+from aeterna_porta_v2_fanout import BackendLane, FanoutScheduler, eligible_backends
+from aeterna_porta_v2_local_backend import LocalBackend
+
+NUM_QUBITS = 3
+KEYS = [("grid", k) for k in range(2 ** NUM_QUBITS)]
+SHOTS = 64
+FAST_DELAY = 0.0  # Seconds of simulated queue per job
+SLOW_DELAY = 0.4
+
+
+def key_circuit(key):
+    """Measures the key's index in binary"""
+    qc = QuantumCircuit(NUM_QUBITS, NUM_QUBITS)
+    for qubit in range(NUM_QUBITS):
+        if key[1] >> qubit & 1:
+            qc.x(qubit)
+    qc.measure(range(NUM_QUBITS), range(NUM_QUBITS))
+    return qc
+
+
+def expected_outcome(key):
+    return format(key[1], f"0{NUM_QUBITS}b")
+
+
+@pytest.fixture
+def backends():
+    fast = LocalBackend(num_qubits=NUM_QUBITS, name="fast_local", seed=1, queue_delay=FAST_DELAY)
+    slow = LocalBackend(num_qubits=NUM_QUBITS, name="slow_local", seed=2, queue_delay=SLOW_DELAY)
+    yield fast, slow
+    for backend in (fast, slow):
+        backend.shutdown()
+
+
+def compile_fn(lane, key):
+    return key_circuit(key), SHOTS, {"backend": lane.name}
+
+
+def process_fn(lane, key, pub_result, job, meta):
+    return {"backend": lane.name, "meta": meta, "job_id": job.job_id(),
+            "counts": pub_result.data.c.get_counts()}
+
+
+def test_eligible_backends(backends):
+    narrow = LocalBackend(num_qubits=NUM_QUBITS - 1, name="narrow_local")
+    try:
+        assert eligible_backends([*backends, narrow], NUM_QUBITS) == list(backends)
+    finally:
+        narrow.shutdown()
+
+
+def test_every_key_runs_once(backends):
+    fast, slow = backends
+    lanes = [BackendLane(fast, max_in_flight=2), BackendLane(slow, max_in_flight=2)]
+    scheduler = FanoutScheduler(lanes, poll_interval=0.01)
+    submitted, finished = [], []
+    peak = {lane.name: 0 for lane in lanes}
+
+    def on_submit(lane, key, job):
+        submitted.append(key)
+        peak[lane.name] = max(peak[lane.name], len(lane.in_flight))
+
+    results = scheduler.run(KEYS, compile_fn, process_fn, on_submit=on_submit,
+                            on_result=lambda lane, key, entry: finished.append(key))
+
+    assert sorted(submitted) == sorted(finished) == sorted(results) == KEYS
+    for key, entry in results.items():
+        assert entry["counts"] == {expected_outcome(key): SHOTS}
+        assert entry["meta"] == {"backend": entry["backend"]}
+    assert all(count <= 2 for count in peak.values())
+
+    summary = scheduler.summary()
+    by_name = {lane["backend"]: lane for lane in summary["lanes"]}
+    assert by_name["fast_local"]["jobs"] + by_name["slow_local"]["jobs"] == len(KEYS)
+    assert by_name["fast_local"]["jobs"] > by_name["slow_local"]["jobs"]
+    assert summary["makespan_s"] is not None
+    assert all(lane.in_flight == {} for lane in lanes)
+
+
+def test_attached_jobs_are_not_resubmitted(backends):
+    fast, slow = backends
+    lanes = [BackendLane(fast), BackendLane(slow)]
+    resumed = KEYS[0]
+    job = lanes[1].backend.sampler().run([key_circuit(resumed)], shots=SHOTS)
+    submitted = []
+
+    results = FanoutScheduler(lanes, poll_interval=0.01).run(
+        KEYS[1:], compile_fn, process_fn,
+        on_submit=lambda lane, key, job: submitted.append(key),
+        attached={resumed: (lanes[1], job, {"backend": "slow_local"})},
+    )
+
+    assert resumed not in submitted
+    assert results[resumed]["job_id"] == job.job_id()
+    assert results[resumed]["counts"] == {expected_outcome(resumed): SHOTS}
+    assert sorted(results) == KEYS
+
+
+def test_failure_cancels_in_flight_jobs(backends):
+    fast, slow = backends
+    lanes = [BackendLane(fast, max_in_flight=4), BackendLane(slow, max_in_flight=4)]
+    jobs = []
+
+    def failing_process(lane, key, pub_result, job, meta):
+        raise RuntimeError("processing failed")
+
+    with pytest.raises(RuntimeError, match="processing failed"):
+        FanoutScheduler(lanes, poll_interval=0.01).run(
+            KEYS, compile_fn, failing_process,
+            on_submit=lambda lane, key, job: jobs.append(job))
+
+    assert all(lane.in_flight == {} for lane in lanes)
+    # The slow lane's queued jobs never started
+    assert any(job.status() == "CANCELLED" for job in jobs)
@@ -0,0 +1,217 @@
+"""
+AETERNA-PORTA v2.1 — CRASH-SAFE SWEEP JOURNAL
+Framework: dna::}{::lang v51.843
+
+Concurrent writers, torn final lines and replay of completed / pending work,
+then resume end to end: a tiny local sweep whose journal is cut mid-line
+skips what it already finished, keeps the journal's execution mode and
+re-attaches to the jobs it had in flight.
+"""
+import json
+import threading
+
+import pytest
+
+import deploy_aeterna_porta_v2_SWEEP as sweep
+from aeterna_porta_v2_journal import (
+    SweepJournal,
+    control_key,
+    grid_key,
+    latest_journal,
+    load_journal,
+    truncate_torn_tail,
+)
+from aeterna_porta_v2_local_backend import LocalBackend
+
+ALPHAS = [0.0, 0.5]
+KS = [0, 2]
+
+
+def test_concurrent_completed_calls_replay_intact(tmp_path):
+    path = tmp_path / "sweep.journal.jsonl"
+    journal = SweepJournal(path)
+    journal.run(1, {"execution_mode": "pipeline"})
+    # Large entries make a torn or interleaved write likely without the lock
+    payload = {"counts": "x" * 20000}
+    barrier = threading.Barrier(8)
+
+    def writer(worker):
+        barrier.wait()
+        for i in range(25):
+            journal.completed(grid_key(worker, i), {**payload, "worker": worker, "i": i})
+            journal.submitted(f"job-{worker}-{i}", [grid_key(worker, i + 100)])
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    journal.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1 + 8 * 25 * 2
+    state = load_journal(path)
+    assert len(state.completed) == 8 * 25
+    assert len(state.submissions) == 8 * 25
+    assert state.completed[grid_key(3, 7)] == {**payload, "worker": 3, "i": 7}
+
+
+def test_torn_tail_is_cut_before_appending(tmp_path):
+    path = tmp_path / "sweep.journal.jsonl"
+    journal = SweepJournal(path)
+    journal.run(1, {"execution_mode": "sequential"})
+    journal.completed(grid_key(0.1, 2), {"phi": 0.5})
+    journal.close()
+    intact = path.read_bytes()
+    with open(path, "ab") as f:
+        f.write(b'{"event": "completed", "key": ["grid", 0.2')  # crash mid-write
+
+    journal = SweepJournal(path)
+    assert path.read_bytes() == intact
+    journal.completed(control_key("C0"), {"phi": 0.1})
+    journal.close()
+
+    state = load_journal(path)
+    assert state.completed == {grid_key(0.1, 2): {"phi": 0.5}, control_key("C0"): {"phi": 0.1}}
+
+
+def test_truncate_torn_tail_edge_cases(tmp_path):
+    path = tmp_path / "j.jsonl"
+    assert truncate_torn_tail(path) == 0  # missing file
+    path.write_bytes(b"")
+    assert truncate_torn_tail(path) == 0
+    path.write_bytes(b'{"event": "run"}\n')
+    assert truncate_torn_tail(path) == 0
+    path.write_bytes(b'{"event": "ru')  # nothing intact at all
+    assert truncate_torn_tail(path) == 13
+    assert path.read_bytes() == b""
+
+
+def test_pending_jobs_owe_only_unfinished_keys(tmp_path):
+    path = tmp_path / "sweep.journal.jsonl"
+    journal = SweepJournal(path)
+    journal.run(7, {"execution_mode": "batched"})
+    layout = [{"kind": "grid", "K": 2, "alphas": [0.1, 0.2]}, {"kind": "control", "control": "C0"}]
+    journal.submitted("job-a", [grid_key(0.1, 2), grid_key(0.2, 2), control_key("C0")], layout=layout)
+    journal.submitted("job-b", [grid_key(0.3, 2)])
+    journal.completed(grid_key(0.1, 2), {"phi": 0.5})
+    journal.completed(grid_key(0.3, 2), {"phi": 0.6})
+    journal.close()
+
+    state = load_journal(path)
+    assert state.run_stamp == 7
+    pending = state.pending_jobs()
+    assert [sub["job_id"] for sub in pending] == ["job-a"]
+    assert pending[0]["keys"] == [grid_key(0.2, 2), control_key("C0")]
+    assert pending[0]["layout"] == layout
+    assert state.pending_keys() == {grid_key(0.2, 2), control_key("C0")}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# RESUME
+# ═══════════════════════════════════════════════════════════════════
+
+class JobService:
+    """Stands in for QiskitRuntimeService.job: hands back the backend's own jobs"""
+
+    def __init__(self, backend):
+        self.jobs = {}
+        self.attached = []
+        submit = backend.submit
+
+        def keep(pubs):
+            job = submit(pubs)
+            self.jobs[job.job_id()] = job
+            return job
+
+        backend.submit = keep
+
+    def job(self, job_id):
+        self.attached.append(job_id)
+        return self.jobs[job_id]
+
+
+@pytest.fixture
+def tiny_sweep(monkeypatch, tmp_path):
+    """2×2 grid, small shot counts, one LocalBackend kept across run and resume"""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setattr(sweep, "ALPHA_SWEEP", ALPHAS)
+    monkeypatch.setattr(sweep, "K_SWEEP", KS)
+    monkeypatch.setattr(sweep, "GRID_KEYS", [grid_key(a, K) for a in ALPHAS for K in KS])
+    monkeypatch.setattr(sweep, "SHOTS", 128)
+    monkeypatch.setattr(sweep, "CONTROL_SHOTS", 256)
+    monkeypatch.setattr(sweep, "MAX_SHOTS_PER_JOB", 128)
+    monkeypatch.setattr(sweep, "ARCHIVE_SHOTS", False)
+    monkeypatch.setattr(sweep, "EXACT_BASELINES", False)
+    monkeypatch.setattr(sweep, "USE_TRANSPILE_CACHE", False)
+    backend = LocalBackend(seed=sweep.TRANSPILE_SEED)
+    service = JobService(backend)
+    monkeypatch.setattr(sweep, "connect_backend", lambda local=False: (service, backend))
+    yield tmp_path / "evidence", service
+    backend.shutdown()
+
+
+def cut_journal(path, before):
+    """Drop every line from the first one matching `before` and leave half of it"""
+    lines = path.read_text().splitlines(keepends=True)
+    cut = next(i for i, line in enumerate(lines) if before(json.loads(line)))
+    path.write_text("".join(lines[:cut]) + lines[cut][: len(lines[cut]) // 2])
+
+
+def completed(key):
+    return lambda event: event["event"] == "completed" and tuple(event["key"]) == key
+
+
+def submissions(path, key):
+    return [sub["job_id"] for sub in load_journal(path).submissions if key in sub["keys"]]
+
+
+def test_resume_skips_keys_finished_before_a_torn_tail(tiny_sweep, capsys):
+    evidence_dir, service = tiny_sweep
+    first = json.loads(sweep.run_sweep(execution_mode="sequential", evidence_dir=evidence_dir,
+                                       telemetry=False).read_text())
+    journal_path = latest_journal(evidence_dir)
+    done, redo = sweep.GRID_KEYS[:2], sweep.GRID_KEYS[2:]
+    cut_journal(journal_path, completed(redo[0]))  # Crashed while journaling the third point
+    capsys.readouterr()
+
+    # No execution mode given: the journal's "sequential" wins over EXECUTION_MODE
+    evidence = json.loads(sweep.run_sweep(resume="latest", evidence_dir=evidence_dir,
+                                          telemetry=False).read_text())
+
+    assert capsys.readouterr().out.count("(from journal)") == len(done)
+    assert evidence["sweep_parameters"]["execution_mode"] == "sequential"
+    assert evidence["results"][:2] == first["results"][:2]
+    for key in sweep.GRID_KEYS:
+        assert len(submissions(journal_path, key)) == 1
+    assert service.attached == submissions(journal_path, redo[0])  # In flight at the crash
+    state = load_journal(journal_path)
+    assert set(state.completed) == set(sweep.GRID_KEYS) | set(sweep.CONTROL_KEYS)
+    assert not state.pending_jobs()
+
+
+def test_resume_refuses_another_execution_mode(tiny_sweep):
+    evidence_dir, _ = tiny_sweep
+    sweep.run_sweep(execution_mode="sequential", evidence_dir=evidence_dir, telemetry=False)
+    with pytest.raises(ValueError, match="sequential"):
+        sweep.run_sweep(resume="latest", execution_mode="batched", evidence_dir=evidence_dir,
+                        telemetry=False)
+
+
+def test_resume_attaches_to_pending_jobs(tiny_sweep, capsys):
+    evidence_dir, service = tiny_sweep
+    sweep.run_sweep(execution_mode="sequential", evidence_dir=evidence_dir, telemetry=False)
+    journal_path = latest_journal(evidence_dir)
+    key = sweep.GRID_KEYS[1]
+    [job_id] = submissions(journal_path, key)
+    cut_journal(journal_path, completed(key))  # Submitted, result never journaled
+    assert [sub["job_id"] for sub in load_journal(journal_path).pending_jobs()] == [job_id]
+    capsys.readouterr()
+
+    evidence = json.loads(sweep.run_sweep(resume="latest", evidence_dir=evidence_dir,
+                                          telemetry=False).read_text())
+
+    assert service.attached == [job_id]
+    assert f"Re-attached to job {job_id}" in capsys.readouterr().out
+    assert evidence["results"][1]["job_id"] == job_id
+    assert submissions(journal_path, key) == [job_id]
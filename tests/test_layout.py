@@ -0,0 +1,84 @@
+"""
+AETERNA-PORTA v2.1 — PHYSICAL LAYOUT PLANNER
+Framework: dna::}{::lang v51.843
+
+On FakeFez the 120-qubit partition embeds with all 58 logical couplings
+(50 TFD pairs + 8 guard → ancilla) on adjacent physical qubits, the
+permuted C2 control is planned on exactly the grid's physical qubits, and
+plans are stored per calibration. Backends without a coupling map get none.
+"""
+import pytest
+from qiskit_ibm_runtime.fake_provider import FakeFez
+
+from aeterna_porta_v2_layout import (
+    LayoutIndex,
+    circuit_interactions,
+    device_graph,
+    interaction_edges,
+    plan_for,
+    plan_layout,
+)
+from aeterna_porta_v2_local_backend import LocalBackend
+from aeterna_porta_v2_partition import Partition
+from deploy_aeterna_porta_v2_SWEEP import PARTITION, build_control
+
+
+@pytest.fixture(scope="module")
+def fez():
+    return FakeFez()
+
+
+@pytest.fixture(scope="module")
+def grid_plan(fez):
+    return plan_layout(fez, PARTITION)
+
+
+def assert_embedding(plan, edges, adjacency):
+    """Injective layout; returns the couplings that landed on adjacent qubits"""
+    assert len(set(plan.layout)) == len(plan.layout) == PARTITION.total
+    return [(a, b) for a, b in edges if plan.layout[b] in adjacency[plan.layout[a]]]
+
+
+def test_every_grid_coupling_is_adjacent_on_fez(fez, grid_plan):
+    edges = interaction_edges(PARTITION)
+    adjacency, _, _ = device_graph(fez)
+    assert len(edges) == 58
+    assert assert_embedding(grid_plan, edges, adjacency) == edges
+    assert grid_plan.routed_edges == 0
+    assert grid_plan.summary()["adjacent_edges"] == 58
+    assert grid_plan.throat == [grid_plan.layout[q] for q in PARTITION.throat()]
+
+
+def test_c2_is_restricted_to_the_grid_qubits(fez, grid_plan):
+    edges = circuit_interactions(build_control("C2"))
+    plan = plan_layout(fez, PARTITION, edges, qubits=grid_plan.layout)
+    adjacency, _, _ = device_graph(fez)
+    adjacent = assert_embedding(plan, edges, adjacency)
+    assert set(plan.layout) == set(grid_plan.layout)
+    assert plan.interaction_edges == len(edges)
+    assert plan.routed_edges == len(edges) - len(adjacent)
+
+
+def test_plans_are_stored_per_calibration(tmp_path, fez, grid_plan):
+    index = LayoutIndex(tmp_path / "layout_index.json")
+    plan = plan_for(fez, PARTITION, index)
+    assert plan.layout == grid_plan.layout
+
+    reloaded = LayoutIndex(tmp_path / "layout_index.json")
+    assert reloaded.lookup(fez, PARTITION).layout == plan.layout
+    assert reloaded.lookup(fez, PARTITION, calibration="recalibrated") is None
+    assert reloaded.lookup(fez, PARTITION, variant="C2") is None
+
+
+def test_no_plan_without_coupling_map(tmp_path):
+    backend = LocalBackend(num_qubits=PARTITION.total)
+    try:
+        assert plan_layout(backend, PARTITION) is None
+        assert plan_for(backend, PARTITION, LayoutIndex(tmp_path / "index.json")) is None
+    finally:
+        backend.shutdown()
+
+
+def test_partition_too_large(fez):
+    with pytest.raises(ValueError):
+        plan_layout(fez, Partition(80, 80, 20))
@@ -0,0 +1,85 @@
+"""
+AETERNA-PORTA v2.1 — VECTORIZED OBSERVABLES vs. OPERATIONAL DEFINITIONS
+Framework: dna::}{::lang v51.843
+
+observables_from_bits (packed BitArray, one histogram pass) must reproduce
+compute_*_operational (get_counts()-style dict) to floating-point rounding,
+from 10^3 to 10^6 shots, including widths where the Γ̂ leakage term
+|supp| / 2^n is not negligible.
+"""
+import numpy as np
+import pytest
+from qiskit.primitives.containers import BitArray
+
+from aeterna_porta_v2_observables import observables_from_bits
+from aeterna_porta_v2_partition import LEGACY_LEAKAGE_CAP_QUBITS, Partition, register_width
+from deploy_aeterna_porta_v2_SWEEP import (
+    compute_gamma_operational,
+    compute_lambda_operational,
+    compute_phi_operational,
+)
+
+SHOT_COUNTS = [10**3, 10**4, 10**5, 10**6]
+POOL_SIZE = 20000  # Distinct candidate outcomes per run (bounds the legacy dict's size)
+REFERENCE_WEIGHT = 0.3  # Probability of |0…0⟩
+
+WIDTHS = {
+    # Γ̂ leakage |supp| / 2^n underflows to ~0 at 120 qubits
+    "partition": Partition(50, 50, 20),
+    # Leakage term dominates: 12 qubits, support up to 4096 = 2^12
+    "leakage-12q": 12,
+    # Legacy 2^20 denominator on the 120-qubit register
+    "leakage-cap": Partition(50, 50, 20, leakage_cap_qubits=LEGACY_LEAKAGE_CAP_QUBITS),
+}
+
+
+def sample_shots(num_bits, shots, seed):
+    """
+    (BitArray, counts dict) for `shots` draws from a Zipf-weighted pool of
+    random outcomes plus the reference state; the dict is built from Python
+    integers, independently of the packed-row code under test.
+    """
+    rng = np.random.default_rng(seed)
+    n_bytes = (num_bits + 7) // 8
+    pool = rng.integers(0, 256, size=(POOL_SIZE, n_bytes), dtype=np.uint8)
+    pool[:, 0] &= (1 << (num_bits - 8 * (n_bytes - 1))) - 1  # Unused high bits stay 0
+    pool[0] = 0
+    weights = 1.0 / np.arange(1, POOL_SIZE)
+    weights = np.concatenate([[REFERENCE_WEIGHT], (1 - REFERENCE_WEIGHT) * weights / weights.sum()])
+
+    index = rng.choice(POOL_SIZE, size=shots, p=weights)
+    bits = BitArray(pool[index], num_bits)
+
+    counts = {}
+    for i, count in zip(*np.unique(index, return_counts=True)):
+        key = format(int.from_bytes(pool[i].tobytes(), "big"), f"0{num_bits}b")
+        counts[key] = counts.get(key, 0) + int(count)
+    return bits, counts
+
+
+@pytest.mark.parametrize("shots", SHOT_COUNTS)
+@pytest.mark.parametrize("width", list(WIDTHS))
+def test_observables_match_operational(width, shots):
+    num_qubits = WIDTHS[width]
+    num_bits = register_width(num_qubits)
+    bits, counts = sample_shots(num_bits, shots, seed=shots + num_bits)
+
+    obs = observables_from_bits(bits, num_qubits)
+
+    assert obs["shots"] == shots
+    assert obs["support"] == len(counts)
+    assert obs["p_succ"] == pytest.approx(max(counts.values()) / shots, rel=1e-12)
+    assert obs["phi"] == pytest.approx(compute_phi_operational(counts, num_qubits), rel=1e-9, abs=1e-12)
+    assert obs["lambda"] == pytest.approx(
+        compute_lambda_operational(counts, reference_state="0" * num_bits), rel=1e-9, abs=1e-12)
+    assert obs["gamma"] == pytest.approx(compute_gamma_operational(counts, num_qubits), rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("shots", SHOT_COUNTS)
+def test_leakage_term_is_exercised(shots):
+    """The 12-qubit case really weighs the leakage term (it is not just the parity term)"""
+    _, counts = sample_shots(12, shots, seed=shots + 12)
+    parity_only = 0.7 * sum(c for s, c in counts.items() if s.count("1") % 2) / shots
+    gamma = compute_gamma_operational(counts, 12)
+    assert gamma - parity_only == pytest.approx(0.3 * len(counts) / 2**12, rel=1e-9)
+    assert gamma - parity_only > 0.01
@@ -0,0 +1,95 @@
+"""
+AETERNA-PORTA v2.1 — BOOTSTRAP STATISTICS
+Framework: dna::}{::lang v51.843
+
+Multinomial resampling over the histogram rows (bounded count matrices)
+and bias-corrected intervals that stay inside each observable's range.
+"""
+import numpy as np
+import pytest
+
+import aeterna_porta_v2_statistics as statistics
+from aeterna_porta_v2_statistics import HistogramModel, analyse_histogram, summarize
+
+
+def histogram(counts, num_bits=16):
+    """Distinct non-zero rows (big-endian packed) with the given counts"""
+    counts = np.asarray(counts, dtype=np.int64)
+    values = np.arange(1, len(counts) + 1, dtype=">u4")
+    rows = values.view(np.uint8).reshape(-1, 4)[:, -((num_bits + 7) // 8):]
+    return rows, counts
+
+
+def test_resample_draws_counts_over_rows():
+    rows, counts = histogram([500, 300, 150, 50])
+    model = HistogramModel(rows, counts, 16)
+    C = model.resample(np.random.default_rng(0), 4000)
+    assert C.shape == (4000, 4)
+    assert (C.sum(axis=1) == model.shots).all()
+    assert C.mean(axis=0) == pytest.approx(counts, rel=0.02)
+
+
+@pytest.mark.parametrize("counts", [
+    np.arange(1, 9) * 100,  # support ≪ shots: rng.multinomial
+    np.tile([1, 2, 3], 300),  # support ~ shots: blocked shot redraws
+])
+def test_both_resampling_paths_draw_the_multinomial(monkeypatch, counts):
+    rows, counts = histogram(counts)
+    model = HistogramModel(rows, counts, 16)
+    monkeypatch.setattr(statistics, "CHUNK_CELLS", 3 * model.shots)  # several blocks
+    C = model.resample(np.random.default_rng(1), 4000)
+    p = counts / model.shots
+    assert C.shape == (4000, len(counts))
+    assert (C.sum(axis=1) == model.shots).all()
+    assert C.mean(axis=0) == pytest.approx(counts, rel=0.1)
+    assert C[:, -1].var() == pytest.approx(model.shots * p[-1] * (1 - p[-1]), rel=0.1)
+
+
+def test_bootstrap_chunks_stay_under_cell_budget(monkeypatch):
+    rows, counts = histogram(np.full(1000, 3))
+    model = HistogramModel(rows, counts, 16)
+    monkeypatch.setattr(statistics, "CHUNK_CELLS", 50_000)
+    sizes = []
+    resample = model.resample
+    monkeypatch.setattr(model, "resample", lambda rng, n: sizes.append(n) or resample(rng, n))
+
+    replicates = model.bootstrap(230, seed=3)
+
+    assert all(size * len(counts) <= 50_000 for size in sizes)
+    assert sum(sizes) == 230
+    assert all(len(values) == 230 for values in replicates.values())
+
+
+def test_bootstrap_is_seeded():
+    rows, counts = histogram([40, 30, 20, 10])
+    a = analyse_histogram(rows, counts, 16, replicates=200, seed=11)
+    b = analyse_histogram(rows, counts, 16, replicates=200, seed=11)
+    assert a == b
+
+
+def test_p_succ_standard_error_matches_binomial():
+    rows, counts = histogram([6000, 2500, 1000, 500])
+    summary = analyse_histogram(rows, counts, 16, replicates=2000, seed=5)
+    p = 0.6
+    assert summary["p_succ"]["se"] == pytest.approx(np.sqrt(p * (1 - p) / 10000), rel=0.1)
+
+
+def test_bias_corrected_interval_is_clipped_to_range():
+    # Near-uniform, high-support histogram: Φ̂ ≈ 1 and resamples lose support,
+    # so the −bias shift would push the upper end past 1
+    rows, counts = histogram(np.full(5000, 2))
+    summary = analyse_histogram(rows, counts, 16, replicates=300, seed=7)
+    for name, (low, high) in statistics.OBSERVABLE_BOUNDS.items():
+        lo, hi = summary[name]["ci_bias_corrected"]
+        assert low <= lo <= hi <= high, name
+    phi = summary["phi"]
+    assert phi["ci"][1] - phi["bias"] > 1.0
+    assert phi["ci_bias_corrected"][1] == 1.0
+
+
+def test_unbounded_observables_are_not_clipped():
+    point = {"delta_tau_eff": -5.0, "phi": 0.99}
+    replicates = {"delta_tau_eff": np.linspace(-9.0, -7.0, 101), "phi": np.linspace(0.97, 0.98, 101)}
+    summary = summarize(point, replicates)
+    assert summary["delta_tau_eff"]["ci_bias_corrected"][0] == pytest.approx(-6.0, abs=0.1)
+    assert summary["phi"]["ci_bias_corrected"][1] == pytest.approx(0.995, abs=0.001)
@@ -0,0 +1,155 @@
+"""
+AETERNA-PORTA v2.1 — PERSISTENT TRANSPILATION CACHE
+Framework: dna::}{::lang v51.843
+
+Cache keys are stable across independently built circuits and change with
+structure, options and calibration; a recalibrated backend loses its old
+entries (and only those); LRU eviction keeps the most recently used entries
+under the entry / byte limits; the process pool and TranspileCache.transpile
+share entries; and writers in several processes never lose each other's
+index entries.
+"""
+import multiprocessing
+
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import InstructionProperties
+
+import aeterna_porta_v2_transpile_cache as transpile_cache
+from aeterna_porta_v2_local_backend import LocalBackend
+from aeterna_porta_v2_parallel_compile import compile_parallel
+from aeterna_porta_v2_transpile_cache import TranspileCache, backend_fingerprint, cache_key
+
+NUM_QUBITS = 4
+OPTIONS = {"optimization_level": 1, "seed_transpiler": 7}
+
+
+def circuit(angle=0.25):
+    alpha = Parameter("α")  # A fresh Parameter (new UUID) every time
+    qc = QuantumCircuit(NUM_QUBITS)
+    qc.h(0)
+    qc.rz(alpha, 1)
+    qc.ry(angle, 2)
+    for q in range(1, NUM_QUBITS):
+        qc.cx(q - 1, q)
+    qc.measure_all()
+    return qc
+
+
+@pytest.fixture
+def backend():
+    """Per-qubit calibration data, unlike LocalBackend's global target"""
+    return GenericBackendV2(NUM_QUBITS, seed=1)
+
+
+def recalibrate(backend):
+    """Same device, new error rate on one gate"""
+    backend.target.update_instruction_properties("sx", (0,), InstructionProperties(error=0.01))
+
+
+class Clock:
+    """Strictly increasing stand-in for time.time (LRU order without ties)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        self.now += 1.0
+        return self.now
+
+
+def test_key_is_stable_and_sensitive(backend):
+    calibration = backend_fingerprint(backend)
+    key = cache_key(circuit(), calibration, OPTIONS)
+    assert cache_key(circuit(), calibration, dict(reversed(OPTIONS.items()))) == key
+    assert cache_key(circuit(angle=0.5), calibration, OPTIONS) != key
+    assert cache_key(circuit(), calibration, {**OPTIONS, "seed_transpiler": 8}) != key
+    recalibrate(backend)
+    assert cache_key(circuit(), backend_fingerprint(backend), OPTIONS) != key
+
+
+def test_hit_across_instances(tmp_path, backend):
+    first = TranspileCache(tmp_path).transpile(circuit(), backend, **OPTIONS)
+    cache = TranspileCache(tmp_path)
+    again = cache.transpile(circuit(), backend, **OPTIONS)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert again == first
+
+
+def test_recalibration_drops_only_that_backends_entries(tmp_path, backend):
+    other = LocalBackend(num_qubits=NUM_QUBITS, name="other_local", seed=2)
+    try:
+        cache = TranspileCache(tmp_path)
+        cache.transpile(circuit(), backend, **OPTIONS)
+        cache.transpile(circuit(), other, **OPTIONS)
+        stale_files = {entry["file"] for entry in cache.index.values()
+                       if entry["backend"] == backend.name}
+
+        recalibrate(backend)
+        cache = TranspileCache(tmp_path)  # Next run: fingerprints recomputed
+        cache.transpile(circuit(), backend, **OPTIONS)
+        cache.transpile(circuit(), other, **OPTIONS)
+    finally:
+        other.shutdown()
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    backends = sorted(entry["backend"] for entry in cache.index.values())
+    assert backends == sorted([backend.name, other.name])
+    for name in stale_files:
+        assert not (tmp_path / name).exists()
+
+
+def test_lru_eviction_by_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(transpile_cache, "time", Clock())
+    cache = TranspileCache(tmp_path, max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, circuit(), "b0", "cal")
+    assert cache.get("a") is not None  # a is now more recent than b
+    cache.put("c", circuit(), "b0", "cal")
+
+    assert sorted(TranspileCache(tmp_path).index) == ["a", "c"]
+    assert not (tmp_path / "b.qpy").exists()
+    assert cache.get("b") is None
+
+
+def test_lru_eviction_by_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(transpile_cache, "time", Clock())
+    probe = TranspileCache(tmp_path / "probe")
+    probe.put("x", circuit(), "b0", "cal")
+    size = probe.index["x"]["size"]
+
+    cache = TranspileCache(tmp_path / "cache", max_bytes=3 * size)
+    for key in "abcde":
+        cache.put(key, circuit(), "b0", "cal")
+    assert sorted(cache.index) == ["c", "d", "e"]
+
+
+def test_pool_and_cache_share_entries(tmp_path, backend):
+    cache = TranspileCache(tmp_path)
+    compile_parallel({"unit": (circuit(), OPTIONS)}, backend, max_workers=1, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    cache.transpile(circuit(), backend, **OPTIONS)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def _put_many(root, worker, count):
+    cache = TranspileCache(root)
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    for i in range(count):
+        cache.put(f"{worker}-{i}", qc, "b0", "cal")
+
+
+def test_concurrent_writers_keep_every_entry(tmp_path):
+    workers, count = 4, 25
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_put_many, args=(tmp_path, worker, count))
+                 for worker in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert all(process.exitcode == 0 for process in processes)
+    assert len(TranspileCache(tmp_path).index) == workers * count
@@ -0,0 +1,98 @@
+"""
+AETERNA-PORTA v2.1 — PER-CYCLE ZENO RECORDS
+Framework: dna::}{::lang v51.843
+
+decode_zeno_records puts clbit i of every zeno_<c> register at index i
+(BitArray rows are big-endian: clbit 0 is the low bit of the last byte),
+keeps batched PUB axes in front of (shots, K, n_anc), and
+join_zeno_records stitches shards back together along the shot axis.
+"""
+import numpy as np
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.primitives.containers import BitArray
+
+from aeterna_porta_v2_local_backend import LocalBackend
+from aeterna_porta_v2_zeno import (
+    decode_zeno_records,
+    join_zeno_records,
+    unpack_bits,
+    zeno_register_name,
+    zeno_register_names,
+)
+
+K = 3
+N_ANC = 10  # Spans two bytes
+SHOTS = 32
+
+
+def test_clbit_zero_is_low_bit_of_last_byte():
+    bits = BitArray(np.array([[0b00000010, 0b00000101]], dtype=np.uint8), N_ANC)
+    assert unpack_bits(bits).tolist() == [[1, 0, 1, 0, 0, 0, 0, 0, 0, 1]]
+
+
+def test_registers_in_cycle_order():
+    data = {name: BitArray(np.zeros((1, 1), dtype=np.uint8), 1)
+            for name in ["meas", "zeno_10", "zeno_2", "zeno_x", "zeno_0"]}
+    assert zeno_register_names(data) == ["zeno_0", "zeno_2", "zeno_10"]
+
+
+def test_no_registers_and_mismatched_widths():
+    assert decode_zeno_records({"meas": BitArray(np.zeros((4, 1), dtype=np.uint8), 3)}) is None
+    data = {"zeno_0": BitArray(np.zeros((4, 1), dtype=np.uint8), 3),
+            "zeno_1": BitArray(np.zeros((4, 1), dtype=np.uint8), 4)}
+    with pytest.raises(ValueError):
+        decode_zeno_records(data)
+
+
+def expected_click(flip, cycle, ancilla):
+    """Ancilla `ancilla` clicks in `cycle` on a fixed pattern, inverted by `flip`"""
+    return int(((cycle + ancilla) % 3 == 0) != bool(flip))
+
+
+def zeno_circuit(theta):
+    """K cycles writing the fixed pattern into zeno_<c>; theta = π inverts it"""
+    qc = QuantumCircuit(N_ANC)
+    for cycle in range(K):
+        record = ClassicalRegister(N_ANC, zeno_register_name(cycle))
+        qc.add_register(record)
+        for i in range(N_ANC):
+            if expected_click(0, cycle, i):
+                qc.x(i)
+            qc.rx(theta, i)
+            qc.measure(i, record[i])
+            qc.reset(i)
+    return qc
+
+
+def test_batched_pub_decodes_to_pub_shape_shots_cycles_ancillas():
+    theta = Parameter("θ")
+    backend = LocalBackend(num_qubits=N_ANC, seed=7)
+    try:
+        sampler = backend.sampler()
+        pub = (zeno_circuit(theta), np.array([[0.0], [np.pi]]))
+        data = sampler.run([pub], shots=SHOTS).result()[0].data
+    finally:
+        backend.shutdown()
+
+    records = decode_zeno_records(data)
+    assert records.shape == (2, SHOTS, K, N_ANC)
+    assert records.dtype == np.uint8
+    for flip in range(2):
+        expected = [[expected_click(flip, c, i) for i in range(N_ANC)] for c in range(K)]
+        assert (records[flip] == np.array(expected)).all()
+
+
+def test_join_concatenates_shards_along_shots():
+    rng = np.random.default_rng(3)
+    shards = [rng.integers(0, 2, size=(2, shots, K, N_ANC), dtype=np.uint8)
+              for shots in (5, 7, 4)]
+    joined = join_zeno_records([shards[0], None, shards[1], shards[2]])
+    assert joined.shape == (2, 16, K, N_ANC)
+    assert (joined[:, :5] == shards[0]).all()
+    assert (joined[:, 5:12] == shards[1]).all()
+    assert (joined[:, 12:] == shards[2]).all()
+    assert join_zeno_records([None, shards[1]]) is shards[1]
+    assert join_zeno_records([None, None]) is None
+    assert join_zeno_records([]) is None